@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+
+"""Benchmark the SAM translator.
+
+Measures the time to import the translator in a fresh interpreter and to parse YAML synthetic templates, then runs every
+template of tests/translator/input through transform() for each partition, followed by synthetic templates scaled up
+to N functions, N API routes and N policy templates. Reports the time spent in each phase of the translation
+and the peak memory used, and can save the results as a JSON baseline to compare later runs against.
+
+Phases:
+  parse        Loading the YAML template
+  parameters   Default and pseudo parameter values, including the region where SAM runs
+  validate     Parser validation of the template structure and SAM schema
+  plugins      All plugin lifecycle hooks, before and after the transform
+  macros       Expansion of SAM resources into CloudFormation resources (from_dict, to_cloudformation, to_dict)
+  resolution   Resolution of references to SAM resources in the output template
+  copy         Copying the parts of the input template that are passed through to the output
+  other        Everything else
+
+Usage:
+  benchmark.py [--partitions=<p>] [--scales=<n>] [--repeat=<r>] [--no-import] [--no-yaml] [--no-corpus]
+               [--no-synthetic]
+               [--output=<o>]
+               [--compare=<b>] [--threshold=<t>]
+
+Options:
+  --partitions=<p>  Comma separated partitions to run the corpus against [default: aws,aws-cn,aws-us-gov].
+  --scales=<n>      Comma separated sizes of the synthetic templates [default: 10,100,500].
+  --repeat=<r>      Number of timed runs. The fastest run is reported [default: 1].
+  --no-import       Skip the import time measurement.
+  --no-yaml         Skip the YAML parsing measurement.
+  --no-corpus       Skip the tests/translator/input corpus.
+  --no-synthetic    Skip the synthetic templates.
+  --output=<o>      Location to store the results as JSON, to be used as a baseline.
+  --compare=<b>     Location of a baseline JSON to compare the results against. Exits with status 1 if any total
+                    or phase time regressed by more than the threshold.
+  --threshold=<t>   Allowed slowdown compared to the baseline, as a fraction [default: 0.2].
+
+"""
+import glob
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from docopt import docopt
+from mock import patch
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+from samtranslator.intrinsics.resolver import IntrinsicsResolver
+from samtranslator.model import Resource, SamResourceMacro
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.parser.parser import Parser
+from samtranslator.plugins import SamPlugins
+from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.policy_template_processor.processor import PolicyTemplatesProcessor
+from samtranslator.sdk.parameter import SamParameterValues
+from samtranslator.translator.arn_generator import ArnGenerator
+from samtranslator.translator.transform import transform
+from samtranslator.translator.translator import Translator
+from samtranslator.yaml_helper import intrinsics_multi_constructor, yaml_parse
+
+INPUT_FOLDER = os.path.join(my_path, "..", "tests", "translator", "input")
+
+PARTITION_REGIONS = {"aws": "us-east-1", "aws-cn": "cn-north-1", "aws-us-gov": "us-gov-west-1"}
+PHASES = ["parse", "parameters", "validate", "plugins", "macros", "resolution", "copy", "other"]
+PARAMETER_VALUES = {"param1": "value1", "param2": "value2"}
+# Module whose import time is measured, as imported by the CloudFormation macro
+IMPORTED_MODULE = "samtranslator.translator.transform"
+# Line of `python -X importtime` output: self and cumulative microseconds, then the indented module name
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+# Differences smaller than this are timer noise, not regressions
+MIN_REGRESSION_SECONDS = 0.005
+
+
+class PhaseTimer(object):
+    """
+    Times the phases of a translation by wrapping the methods that implement them. Phases are exclusive: when a phase
+    starts while another one is running, ex: a plugin hook called from within a macro, the outer phase is paused
+    until the inner one ends. Re-entering the phase that is already running is counted once.
+    """
+
+    # Methods implementing each phase, as (owner, method name)
+    PHASE_METHODS = {
+        "parameters": [
+            (SamParameterValues, "add_default_parameter_values"),
+            (SamParameterValues, "add_pseudo_parameter_values"),
+            (ArnGenerator, "get_region_name"),
+        ],
+        "validate": [(Parser, "_validate")],
+        "plugins": [(SamPlugins, "act")],
+        "resolution": [(IntrinsicsResolver, "resolve_sam_resource_id_and_resource_refs")],
+        "copy": [(Translator, "_prepare_output_template")],
+    }
+
+    def __init__(self):
+        self.elapsed = dict.fromkeys(PHASES, 0.0)
+        self._stack = []
+        self._started_at = None
+        self._patches = []
+
+    def __enter__(self):
+        methods = dict(self.PHASE_METHODS)
+        methods["macros"] = [(Resource, "from_dict"), (Resource, "to_dict")] + [
+            (cls, "to_cloudformation") for cls in _all_subclasses(SamResourceMacro)
+        ]
+
+        for phase, owners in methods.items():
+            for owner, name in owners:
+                if name in vars(owner):
+                    patcher = patch.object(owner, name, self._wrap(phase, vars(owner)[name]))
+                    patcher.start()
+                    self._patches.append(patcher)
+        return self
+
+    def __exit__(self, *args):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        self._patches = []
+
+    def measure(self, phase, function, *args, **kwargs):
+        self._enter(phase)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._exit()
+
+    def _wrap(self, phase, method):
+        timer = self
+        function = method.__func__ if isinstance(method, classmethod) else method
+
+        def wrapper(*args, **kwargs):
+            return timer.measure(phase, function, *args, **kwargs)
+
+        return classmethod(wrapper) if isinstance(method, classmethod) else wrapper
+
+    def _enter(self, phase):
+        now = time.perf_counter()
+        if self._stack:
+            self.elapsed[self._stack[-1]] += now - self._started_at
+        self._stack.append(phase)
+        self._started_at = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        self.elapsed[self._stack.pop()] += now - self._started_at
+        self._started_at = now
+
+
+class ManagedPolicyLoaderStub(object):
+    """
+    Managed policy loader that returns a fixed map of the policies used by the corpus, instead of calling IAM
+    """
+
+    def __init__(self, partition):
+        self.partition = partition
+
+    def load(self):
+        policies = {
+            "AWSLambdaBasicExecutionRole": "service-role/AWSLambdaBasicExecutionRole",
+            "AmazonDynamoDBFullAccess": "AmazonDynamoDBFullAccess",
+            "AmazonDynamoDBReadOnlyAccess": "AmazonDynamoDBReadOnlyAccess",
+            "AWSLambdaRole": "service-role/AWSLambdaRole",
+            "AWSXrayWriteOnlyAccess": "AWSXrayWriteOnlyAccess",
+            "AWSXRayDaemonWriteAccess": "AWSXRayDaemonWriteAccess",
+        }
+        return {name: "arn:{}:iam::aws:policy/{}".format(self.partition, path) for name, path in policies.items()}
+
+
+def sar_service_call_stub(self, service_call_function, logical_id, *args):
+    """
+    Replaces calls to the Serverless Application Repository with an immediate, successful response
+    """
+    return {
+        "ApplicationId": args[0],
+        "SemanticVersion": "1.0.0",
+        "Status": "ACTIVE",
+        "TemplateId": "id-xx-xx",
+        "TemplateUrl": "https://awsserverlessrepo-changesets-xxx.s3.amazonaws.com/signed-url",
+    }
+
+
+def run_templates(templates, partition, repeat):
+    """
+    Translates every template, `repeat` times, and once more to measure memory.
+
+    :param list templates: List of (name, YAML text) tuples
+    :param string partition: Partition to translate the templates for
+    :param int repeat: Number of timed runs
+    :return dict: Results of the fastest run
+    """
+    best = None
+    for _ in range(repeat):
+        result = _run_once(templates, partition)
+        if best is None or result["total"] < best["total"]:
+            best = result
+
+    tracemalloc.start()
+    try:
+        _run_once(templates, partition)
+        best["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return best
+
+
+def _run_once(templates, partition):
+    policy_loader = ManagedPolicyLoaderStub(partition)
+    errors = 0
+
+    region = PARTITION_REGIONS[partition]
+    # The region Boto3 resolves is memoized, and each partition patches a different one
+    ArnGenerator._region_names.clear()
+    with patch("boto3.session.Session.region_name", region), patch(
+        "botocore.client.ClientEndpointBridge._check_default_region", lambda *args: region
+    ), patch.object(ServerlessAppPlugin, "_sar_service_call", sar_service_call_stub), PhaseTimer() as timer:
+        start = time.perf_counter()
+        for _, text in templates:
+            template = timer.measure("parse", yaml_parse, text)
+            try:
+                timer.measure("other", transform, template, dict(PARAMETER_VALUES), policy_loader)
+            except InvalidDocumentException:
+                errors += 1
+        total = time.perf_counter() - start
+
+    phases = {phase: round(elapsed, 6) for phase, elapsed in timer.elapsed.items()}
+    return {"templates": len(templates), "errors": errors, "total": round(total, 6), "phases": phases}
+
+
+def load_corpus():
+    templates = []
+    for path in sorted(glob.glob(os.path.join(INPUT_FOLDER, "*.yaml"))):
+        with open(path, "r") as fp:
+            templates.append((os.path.basename(path), fp.read()))
+    return templates
+
+
+def generate_functions(count):
+    """
+    Template with `count` functions, each with its own implicit API route and SQS event
+    """
+    resources = {}
+    for index in range(count):
+        resources["Function{}".format(index)] = {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "CodeUri": "s3://bucket/key",
+                "Handler": "index.handler",
+                "Runtime": "python3.8",
+                "Events": {
+                    "Api": {"Type": "Api", "Properties": {"Path": "/function{}".format(index), "Method": "get"}},
+                    "Queue": {"Type": "SQS", "Properties": {"Queue": "arn:aws:sqs:us-east-1:123456789012:queue"}},
+                },
+            },
+        }
+    return {"Transform": "AWS::Serverless-2016-10-31", "Resources": resources}
+
+
+def generate_api_routes(count):
+    """
+    Template with one function serving `count` routes of one explicit API
+    """
+    events = {}
+    for index in range(count):
+        events["Route{}".format(index)] = {
+            "Type": "Api",
+            "Properties": {"Path": "/route{}".format(index), "Method": "post", "RestApiId": {"Ref": "Api"}},
+        }
+    return {
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Resources": {
+            "Api": {"Type": "AWS::Serverless::Api", "Properties": {"StageName": "Prod"}},
+            "Function": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "s3://bucket/key",
+                    "Handler": "index.handler",
+                    "Runtime": "python3.8",
+                    "Events": events,
+                },
+            },
+        },
+    }
+
+
+def generate_policy_templates(count):
+    """
+    Template with one function using `count` policy templates, cycling through all available templates
+    """
+    policy_templates = PolicyTemplatesProcessor.get_default_policy_templates_json()["Templates"]
+    names = sorted(policy_templates)
+    policies = []
+    for index in range(count):
+        name = names[index % len(names)]
+        parameters = policy_templates[name].get("Parameters", {})
+        policies.append({name: {parameter: "value{}".format(index) for parameter in parameters}})
+    return {
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Resources": {
+            "Function": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "s3://bucket/key",
+                    "Handler": "index.handler",
+                    "Runtime": "python3.8",
+                    "Policies": policies,
+                },
+            }
+        },
+    }
+
+
+SYNTHETIC_GENERATORS = {
+    "functions": generate_functions,
+    "api_routes": generate_api_routes,
+    "policy_templates": generate_policy_templates,
+}
+
+
+def measure_import(module, repeat):
+    """
+    Imports a module in a fresh interpreter with `-X importtime`
+
+    :param string module: Name of the module to import
+    :param int repeat: Number of interpreters to start. The fastest import is reported
+    :return dict: Cumulative import time of the module, in seconds, and the number of modules it imported
+    """
+    result = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            cwd=os.path.join(my_path, ".."),
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        modules = {}
+        for line in process.stderr.splitlines():
+            match = IMPORT_TIME_PATTERN.match(line)
+            if match:
+                modules[match.group(3)] = int(match.group(2)) / 1e6
+        if result is None or modules[module] < result["total"]:
+            result = {"total": modules[module], "modules": len(modules)}
+    return result
+
+
+class PythonIntrinsicsLoader(yaml.SafeLoader):
+    """
+    Pure Python loader of CloudFormation templates, the baseline yaml_parse is compared against
+    """
+
+
+PythonIntrinsicsLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+
+def measure_yaml(template, repeat):
+    """
+    Parses a YAML template with yaml_parse and with the pure Python loader
+
+    :param dict template: Template to dump to YAML and parse
+    :param int repeat: Number of timed runs. The fastest run is reported
+    :return dict: Time of yaml_parse, of the pure Python loader, in seconds, and size of the YAML text
+    """
+    text = yaml.safe_dump(template, default_flow_style=False)
+    result = {"total": None, "python": None, "bytes": len(text)}
+    for key, parse in (("total", yaml_parse), ("python", lambda text: yaml.load(text, Loader=PythonIntrinsicsLoader))):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(text)
+            elapsed = time.perf_counter() - start
+            if result[key] is None or elapsed < result[key]:
+                result[key] = elapsed
+    return result
+
+
+def compare(results, baseline, threshold):
+    """
+    Lists the times that regressed compared to the baseline
+
+    :return list: Descriptions of the regressions. Empty if there are none
+    """
+    regressions = []
+    for name, result in _flatten(results).items():
+        previous = _flatten(baseline).get(name)
+        if previous and result > previous * (1 + threshold) and result - previous > MIN_REGRESSION_SECONDS:
+            regressions.append("{}: {:.4f}s -> {:.4f}s (+{:.0%})".format(name, previous, result, result / previous - 1))
+    return regressions
+
+
+def _flatten(results):
+    times = {}
+    for module, result in results.get("import", {}).items():
+        times["import.{}.total".format(module)] = result["total"]
+    for name, result in results.get("yaml", {}).items():
+        times["yaml.{}.total".format(name)] = result["total"]
+    for group in ("corpus", "synthetic"):
+        for name, result in results.get(group, {}).items():
+            times["{}.{}.total".format(group, name)] = result["total"]
+            for phase, elapsed in result["phases"].items():
+                times["{}.{}.{}".format(group, name, phase)] = elapsed
+    return times
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for nested in _all_subclasses(subclass):
+            yield nested
+
+
+def print_result(name, result):
+    phases = " ".join("{}={:.3f}s".format(phase, result["phases"][phase]) for phase in PHASES)
+    print(
+        "{:<36} templates={:<4} errors={:<4} total={:.3f}s peak={:.1f}MiB  {}".format(
+            name,
+            result["templates"],
+            result["errors"],
+            result["total"],
+            result["peak_memory_bytes"] / (1024.0 * 1024.0),
+            phases,
+        )
+    )
+
+
+def main():
+    cli_options = docopt(__doc__)
+    repeat = int(cli_options["--repeat"])
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "import": {},
+        "yaml": {},
+        "corpus": {},
+        "synthetic": {},
+    }
+
+    if not cli_options["--no-import"]:
+        results["import"][IMPORTED_MODULE] = measure_import(IMPORTED_MODULE, repeat)
+        print(
+            "{:<36} modules={:<4} total={:.3f}s".format(
+                "import[{}]".format(IMPORTED_MODULE),
+                results["import"][IMPORTED_MODULE]["modules"],
+                results["import"][IMPORTED_MODULE]["total"],
+            )
+        )
+
+    if not cli_options["--no-yaml"]:
+        for scale in cli_options["--scales"].split(","):
+            name = "functions[{}]".format(scale)
+            result = results["yaml"][name] = measure_yaml(generate_functions(int(scale)), repeat)
+            print(
+                "{:<36} size={:.1f}KiB total={:.3f}s python={:.3f}s speedup={:.1f}x".format(
+                    "yaml[{}]".format(name),
+                    result["bytes"] / 1024.0,
+                    result["total"],
+                    result["python"],
+                    result["python"] / result["total"],
+                )
+            )
+
+    if not cli_options["--no-corpus"]:
+        corpus = load_corpus()
+        for partition in cli_options["--partitions"].split(","):
+            name = "corpus[{}]".format(partition)
+            results["corpus"][partition] = run_templates(corpus, partition, repeat)
+            print_result(name, results["corpus"][partition])
+
+    if not cli_options["--no-synthetic"]:
+        for generator_name, generator in sorted(SYNTHETIC_GENERATORS.items()):
+            for scale in cli_options["--scales"].split(","):
+                name = "{}[{}]".format(generator_name, scale)
+                template = json.dumps(generator(int(scale)))
+                results["synthetic"][name] = run_templates([(name, template)], "aws", repeat)
+                print_result(name, results["synthetic"][name])
+
+    if cli_options["--output"]:
+        with open(cli_options["--output"], "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+    if cli_options["--compare"]:
+        with open(cli_options["--compare"], "r") as fp:
+            baseline = json.load(fp)
+        regressions = compare(results, baseline, float(cli_options["--threshold"]))
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
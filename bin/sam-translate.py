@@ -5,13 +5,16 @@
 Known limitations: cannot transform CodeUri pointing at local directory.
 
 Usage:
-  sam-translate.py --template-file=sam-template.yaml [--verbose] [--output-template=<o>]
-  sam-translate.py package --template-file=sam-template.yaml --s3-bucket=my-bucket [--verbose] [--output-template=<o>]
-  sam-translate.py deploy --template-file=sam-template.yaml --s3-bucket=my-bucket --capabilities=CAPABILITY_NAMED_IAM --stack-name=my-stack [--verbose] [--output-template=<o>]
+  sam-translate.py --template-file=sam-template.yaml [--verbose] [--output-template=<o>] [--sort-keys]
+  sam-translate.py package --template-file=sam-template.yaml --s3-bucket=my-bucket [--verbose] [--output-template=<o>] [--sort-keys]
+  sam-translate.py deploy --template-file=sam-template.yaml --s3-bucket=my-bucket --capabilities=CAPABILITY_NAMED_IAM --stack-name=my-stack [--verbose] [--output-template=<o>] [--sort-keys]
 
 Options:
   --template-file=<i>       Location of SAM template to transform [default: template.yaml].
   --output-template=<o>     Location to store resulting CloudFormation template [default: transformed-template.json].
+                            The template is written as YAML if the location ends with .yaml or .yml, as JSON
+                            otherwise. Use - to write the template to the standard output.
+  --sort-keys               Write the keys of the template in sorted order instead of the order they are generated in
   --s3-bucket=<s>           S3 bucket to use for SAM artifacts when using the `package` command
   --capabilities=<c>        Capabilities
   --stack-name=<n>          Unique name for your CloudFormation Stack
@@ -31,15 +34,18 @@ from docopt import docopt
 my_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, my_path + "/..")
 
-from samtranslator.public.translator import ManagedPolicyLoader
+from samtranslator.public.translator import ManagedPolicyCache, ManagedPolicyLoader, TemplateUrlCache
 from samtranslator.translator.transform import transform
-from samtranslator.yaml_helper import yaml_parse
+from samtranslator.yaml_helper import yaml_dump, yaml_parse
 from samtranslator.model.exceptions import InvalidDocumentException
 from samtranslator.feature_toggle.feature_toggle import FeatureToggleLocalConfigProvider, FeatureToggle
 
 LOG = logging.getLogger(__name__)
 cli_options = docopt(__doc__)
 iam_client = boto3.client("iam")
+cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "sam-translate")
+policy_cache = ManagedPolicyCache(cache_dir, iam_client.meta.partition)
+template_url_cache = TemplateUrlCache(cache_file=os.path.join(cache_dir, "template-urls.json"))
 cwd = os.getcwd()
 
 if cli_options.get("--verbose"):
@@ -68,7 +74,7 @@ def get_input_output_file_paths():
     input_file_option = cli_options.get("--template-file")
     output_file_option = cli_options.get("--output-template")
     input_file_path = os.path.join(cwd, input_file_option)
-    output_file_path = os.path.join(cwd, output_file_option)
+    output_file_path = output_file_option if output_file_option == "-" else os.path.join(cwd, output_file_option)
 
     return input_file_path, output_file_path
 
@@ -91,6 +97,27 @@ def package(input_file_path, output_file_path):
     return package_output_template_file
 
 
+def write_template(template, output_file_path):
+    """
+    Writes the template to the file, or to the standard output if the path is -, as it is serialized. The whole text
+    of large templates is never held in memory.
+    """
+    sort_keys = bool(cli_options.get("--sort-keys"))
+    if output_file_path == "-":
+        output = sys.stdout
+    else:
+        output = open(output_file_path, "w")
+
+    try:
+        if output_file_path.endswith((".yaml", ".yml")):
+            yaml_dump(template, output, sort_keys=sort_keys)
+        else:
+            json.dump(template, output, indent=2, sort_keys=sort_keys)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
 def transform_template(input_file_path, output_file_path):
     with open(input_file_path, "r") as f:
         sam_template = yaml_parse(f)
@@ -104,13 +131,16 @@ def transform_template(input_file_path, output_file_path):
             account_id=None,
             region=None,
         )
-        cloud_formation_template = transform(sam_template, {}, ManagedPolicyLoader(iam_client), feature_toggle)
-        cloud_formation_template_prettified = json.dumps(cloud_formation_template, indent=2)
-
-        with open(output_file_path, "w") as f:
-            f.write(cloud_formation_template_prettified)
+        policy_loader = ManagedPolicyLoader(iam_client, cache=policy_cache, background_refresh=True)
+        cloud_formation_template = transform(
+            sam_template, {}, policy_loader, feature_toggle, template_url_cache=template_url_cache
+        )
+        template_url_cache.save()
+        write_template(cloud_formation_template, output_file_path)
 
-        print("Wrote transformed CloudFormation template to: " + output_file_path)
+        if output_file_path != "-":
+            print("Wrote transformed CloudFormation template to: " + output_file_path)
+        policy_loader.wait_for_refresh()
     except InvalidDocumentException as e:
         errorMessage = reduce(lambda message, error: message + " " + error.message, e.causes, e.message)
         LOG.error(errorMessage)
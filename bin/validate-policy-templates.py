@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+"""Validate the bundled policy templates and record their digest.
+
+Validates samtranslator/policy_templates_data/policy_templates.json against the JSON Schema of policy templates and
+writes the digest of both documents to samtranslator/policy_templates_data/validated.py. The default policy templates
+are not validated again at runtime as long as their content matches this digest. Run it after changing either file.
+
+Usage:
+  validate-policy-templates.py
+"""
+import os
+import sys
+
+from docopt import docopt
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+from samtranslator import policy_templates_data
+from samtranslator.policy_template_processor.processor import PolicyTemplatesProcessor
+
+VALIDATED_FILE = os.path.join(os.path.dirname(policy_templates_data.POLICY_TEMPLATES_FILE), "validated.py")
+
+VALIDATED_TEMPLATE = """# Generated by bin/validate-policy-templates.py, do not edit.
+#
+# Digest of the content of policy_templates.json and schema.json, computed after the policy templates were validated
+# against the schema. The default policy templates are not validated again when their content matches this digest.
+
+DIGEST = "{}"
+"""
+
+if __name__ == "__main__":
+    docopt(__doc__)
+
+    policy_templates = PolicyTemplatesProcessor._read_json(policy_templates_data.POLICY_TEMPLATES_FILE)
+    schema = PolicyTemplatesProcessor._read_json(policy_templates_data.SCHEMA_FILE)
+
+    PolicyTemplatesProcessor._is_valid_templates_dict(policy_templates, schema)
+
+    with open(VALIDATED_FILE, "w") as fp:
+        fp.write(VALIDATED_TEMPLATE.format(PolicyTemplatesProcessor._digest(policy_templates, schema)))
+    print("Wrote digest of the validated policy templates to: " + VALIDATED_FILE)
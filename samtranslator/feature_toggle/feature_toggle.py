@@ -1,11 +1,9 @@
 import os
 import sys
 import json
-import boto3
 import logging
 import hashlib
 
-from botocore.config import Config
 from samtranslator.feature_toggle.dialup import (
     DisabledDialup,
     ToggleDialup,
@@ -132,6 +130,9 @@ class FeatureToggleAppConfigConfigProvider(FeatureToggleConfigProvider):
 
     def __init__(self, application_id, environment_id, configuration_profile_id):
         FeatureToggleConfigProvider.__init__(self)
+        import boto3
+        from botocore.config import Config
+
         try:
             LOG.info("Loading feature toggle config from AppConfig...")
             # Lambda function has 120 seconds limit
@@ -0,0 +1,142 @@
+import re
+
+from six import string_types
+
+from samtranslator.intrinsics.actions import GetAttAction, RefAction, SubAction
+
+# Same references as SubAction finds in the string of a Fn::Sub
+_SUB_REFERENCE_PATTERN = re.compile(r"\$\{([A-Za-z0-9\.]+|AWS::[A-Z][A-Za-z]*)\}")
+
+
+class ReferenceIndex(object):
+    """
+    Index of the Ref, Fn::GetAtt and Fn::Sub intrinsics of a template, by the logical id they reference. It is built in
+    a single walk of the template and records where each intrinsic is, so that the intrinsics referencing some logical
+    ids can be found and replaced without walking the template again.
+
+    The logical id of a reference is the part before the first dot, ex: "MyFunction" for {"Ref": "MyFunction.Alias"}
+    or for {"Fn::Sub": "${MyFunction.Arn}"}. Parameters and pseudo parameters are indexed like logical ids.
+
+    Locations are (container, key) tuples, where `container[key]` is the intrinsic. The intrinsic at the root of the
+    template has the location (None, None). Locations stay valid as long as the containers of the intrinsics are
+    not replaced.
+    """
+
+    def __init__(self, template):
+        """
+        :param template: Any primitive type (dict, array, string etc) whose values might contain intrinsic functions
+        """
+        self.template = template
+        # Locations of the intrinsics, in the order they were found. A container is found before its children
+        self._locations = []
+        # logical id -> indices in self._locations of the intrinsics referencing it
+        self._references = {}
+        # Indices of the intrinsics that must always be resolved because their references could not be read, ex: a
+        # Fn::GetAtt with an intrinsic in its arguments, which resolution rejects
+        self._unreadable = []
+        self._build()
+
+    def logical_ids(self):
+        """
+        :return set: Logical ids referenced in the template
+        """
+        return set(self._references)
+
+    def references(self, logical_id):
+        """
+        Returns the intrinsics that reference the given logical id
+
+        :param string logical_id: Logical id of a resource or parameter
+        :return list: Intrinsic dictionaries, in template order
+        """
+        return [self.get(location) for location in self.locations([logical_id])]
+
+    def locations(self, logical_ids, include_unreadable=False):
+        """
+        Returns the locations of the intrinsics that reference any of the given logical ids. An intrinsic referencing
+        several of them is listed once. Containers come before the intrinsics they contain.
+
+        :param logical_ids: Iterable of logical ids
+        :param bool include_unreadable: Also return the intrinsics whose references could not be read
+        :return list: List of (container, key) tuples
+        """
+        indices = set(self._unreadable) if include_unreadable else set()
+        for logical_id in logical_ids:
+            indices.update(self._references.get(logical_id, ()))
+        return [self._locations[index] for index in sorted(indices)]
+
+    def get(self, location):
+        """
+        :param tuple location: (container, key) tuple returned by `locations`
+        :return dict: The intrinsic at the location
+        """
+        container, key = location
+        return self.template if container is None else container[key]
+
+    def _build(self):
+        if isinstance(self.template, dict) and len(self.template) == 1:
+            self._add((None, None), self.template)
+
+        stack = [self.template]
+        while stack:
+            node = stack.pop()
+
+            if isinstance(node, dict):
+                children = node.items()
+            elif isinstance(node, list):
+                children = enumerate(node)
+            else:
+                continue
+
+            for key, value in children:
+                if isinstance(value, dict):
+                    if len(value) == 1:
+                        self._add((node, key), value)
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.append(value)
+
+    def _add(self, location, intrinsic):
+        logical_ids = _referenced_logical_ids(intrinsic)
+        if logical_ids is None:
+            return
+
+        index = len(self._locations)
+        self._locations.append(location)
+        if logical_ids is _UNREADABLE:
+            self._unreadable.append(index)
+            return
+        for logical_id in logical_ids:
+            self._references.setdefault(logical_id, []).append(index)
+
+
+# Returned for intrinsics whose references cannot be read
+_UNREADABLE = object()
+
+
+def _referenced_logical_ids(intrinsic):
+    """
+    Returns the logical ids referenced by an intrinsic dictionary, following the parsing of the intrinsic actions
+
+    :param dict intrinsic: Dictionary with one key
+    :return: Set of logical ids, None if the dictionary is not a Ref, Fn::GetAtt or Fn::Sub that references anything,
+        or _UNREADABLE
+    """
+    name, value = next(iter(intrinsic.items()))
+    if name == RefAction.intrinsic_name:
+        if isinstance(value, string_types):
+            return {value.split(".", 1)[0]}
+
+    elif name == GetAttAction.intrinsic_name:
+        if isinstance(value, list) and len(value) >= 2:
+            if not all(isinstance(entry, string_types) for entry in value):
+                return _UNREADABLE
+            return {value[0].split(".", 1)[0]}
+
+    elif name == SubAction.intrinsic_name:
+        if isinstance(value, list) and value:
+            value = value[0]
+        if isinstance(value, string_types):
+            return {reference.split(".", 1)[0] for reference in _SUB_REFERENCE_PATTERN.findall(value)} or None
+
+    return None
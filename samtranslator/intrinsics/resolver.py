@@ -1,6 +1,7 @@
 # Help resolve intrinsic functions
 
 from samtranslator.intrinsics.actions import Action, SubAction, RefAction, GetAttAction
+from samtranslator.intrinsics.reference_index import ReferenceIndex
 from samtranslator.model.exceptions import InvalidTemplateException, InvalidDocumentException
 
 # All intrinsics are supported by default
@@ -92,6 +93,71 @@ class IntrinsicsResolver(object):
         """
         return self._traverse(input, supported_resource_id_refs, self._try_resolve_sam_resource_id_refs)
 
+    def resolve_sam_resource_id_and_resource_refs(self, input, supported_resource_id_refs, supported_resource_refs):
+        """
+        Resolves SAM resource id references and then SAM resource references. The result is the same as calling
+        `resolve_sam_resource_id_refs` followed by `resolve_sam_resource_refs`, but the tree is walked only once, to
+        index its references, and only the intrinsics that reference a changed logical id or a resource with
+        supported references are resolved.
+
+        :param dict input: CFN template that needs resolution. This method will modify the input directly.
+        :param dict supported_resource_id_refs: Dictionary that maps old logical ids to new ones.
+        :param SupportedResourceReferences supported_resource_refs: Object that contains information about the resource
+            references supported in this SAM template, along with the value they should resolve to.
+        :return: Modified `input` with references resolved
+        """
+        resolutions = []
+        logical_ids = set()
+        if len(supported_resource_id_refs) > 0:
+            resolutions.append((self._try_resolve_sam_resource_id_refs, supported_resource_id_refs))
+            logical_ids.update(supported_resource_id_refs)
+        if len(supported_resource_refs) > 0:
+            resolutions.append((self._try_resolve_sam_resource_refs, supported_resource_refs))
+            logical_ids.update(supported_resource_refs.logical_ids())
+
+        # There is no data to help with resolution. Skip the traversal altogether
+        if not resolutions:
+            return input
+
+        # Resolving a Ref, Fn::GetAtt or Fn::Sub either modifies the intrinsic in place or replaces it with a new Ref
+        # without nested intrinsics, so the locations of the other intrinsics stay valid
+        index = ReferenceIndex(input)
+        for container, key in index.locations(logical_ids, include_unreadable=True):
+            value = input if container is None else container[key]
+            for resolver_method, resolution_data in resolutions:
+                value = resolver_method(value, resolution_data)
+            if container is None:
+                input = value
+            else:
+                container[key] = value
+        return input
+
+    def resolve_all(self, input, resolutions):
+        """
+        Performs several resolutions in one Pre-Order traversal of the input. At every node, the resolutions are
+        applied in the given order, each one to the output of the previous one, before moving on to the children of the
+        node. Resolution actions only look at the intrinsic function at the node being resolved, so the result is the
+        same as running one traversal per resolution, in order.
+
+        :param input: Any primitive type (dict, array, string etc) whose values might contain intrinsic functions
+        :param list resolutions: List of `(resolver_method, resolution_data)` tuples. `resolver_method` is called with
+            the parameters `(input, resolution_data)` for every node that looks like an intrinsic function, ie. a
+            dictionary with one key, and returns the resolved node. Resolutions with empty `resolution_data` are
+            skipped.
+        :return: Modified `input` with intrinsics resolved
+        """
+        resolutions = [
+            (resolver_method, resolution_data)
+            for resolver_method, resolution_data in resolutions
+            if len(resolution_data) > 0
+        ]
+
+        # There is no data to help with resolution. Skip the traversal altogether
+        if not resolutions:
+            return input
+
+        return self._traverse_node(input, resolutions)
+
     def _traverse(self, input, resolution_data, resolver_method):
         """
         Driver method that performs the actual traversal of input and calls the appropriate `resolver_method` when
@@ -105,9 +171,18 @@ class IntrinsicsResolver(object):
         :return: Modified `input` with intrinsics resolved
         """
 
-        # There is data to help with resolution. Skip the traversal altogether
-        if len(resolution_data) == 0:
-            return input
+        return self.resolve_all(input, [(resolver_method, resolution_data)])
+
+    def _traverse_node(self, input, resolutions):
+        """
+        Resolves intrinsics at the given node and then at every node below it. The tree is walked with an explicit
+        stack instead of recursion, so deeply nested inputs do not hit Python's recursion limit and do not pay for a
+        function call per node.
+
+        :param input: Any primitive type  (dict, array, string etc) whose value might contain an intrinsic function
+        :param list resolutions: List of `(resolver_method, resolution_data)` tuples to apply at every node
+        :return: Modified `input` with intrinsics resolved
+        """
 
         #
         # Traversal Algorithm:
@@ -125,44 +200,45 @@ class IntrinsicsResolver(object):
         # to handle nested intrinsics. All of these cases lend well towards a Pre-Order traversal where we try and
         # process the intrinsic, which results in a modified sub-tree to traverse.
         #
+        # The stack holds the dicts and lists whose children are still to be visited. Every node on the stack has
+        # already been resolved. Its children are resolved one after the other, the new values are written back into
+        # the node, and the children that are themselves dicts or lists are pushed to be visited later. Siblings may
+        # be resolved in a different order than a recursive traversal would, but a node is always resolved before its
+        # children, which is all resolution actions depend on.
+        #
+        # Intrinsic functions are dictionaries with exactly one key. Resolution is only attempted on nodes of this
+        # shape, which saves a call per resolution at every other node of the tree.
+        #
 
-        input = resolver_method(input, resolution_data)
-
-        if isinstance(input, dict):
-            return self._traverse_dict(input, resolution_data, resolver_method)
-        elif isinstance(input, list):
-            return self._traverse_list(input, resolution_data, resolver_method)
-        else:
-            # We can iterate only over dict or list types. Primitive types are terminals
-            return input
-
-    def _traverse_dict(self, input_dict, resolution_data, resolver_method):
-        """
-        Traverse a dictionary to resolve intrinsic functions on every value
-
-        :param input_dict: Input dictionary to traverse
-        :param resolution_data: Data that the `resolver_method` needs to operate
-        :param resolver_method: Method that can actually resolve an intrinsic function, if it detects one
-        :return: Modified dictionary with values resolved
-        """
-        for key, value in input_dict.items():
-            input_dict[key] = self._traverse(value, resolution_data, resolver_method)
-
-        return input_dict
-
-    def _traverse_list(self, input_list, resolution_data, resolver_method):
-        """
-        Traverse a list to resolve intrinsic functions on every element
-
-        :param input_list: List of input
-        :param resolution_data: Data that the `resolver_method` needs to operate
-        :param resolver_method: Method that can actually resolve an intrinsic function, if it detects one
-        :return: Modified list with intrinsic functions resolved
-        """
-        for index, value in enumerate(input_list):
-            input_list[index] = self._traverse(value, resolution_data, resolver_method)
-
-        return input_list
+        if isinstance(input, dict) and len(input) == 1:
+            for resolver_method, resolution_data in resolutions:
+                input = resolver_method(input, resolution_data)
+
+        stack = [input]
+        while stack:
+            node = stack.pop()
+
+            if isinstance(node, dict):
+                children = node.items()
+            elif isinstance(node, list):
+                children = enumerate(node)
+            else:
+                # We can iterate only over dict or list types. Primitive types are terminals
+                continue
+
+            for key, value in children:
+                if isinstance(value, dict):
+                    if len(value) == 1:
+                        for resolver_method, resolution_data in resolutions:
+                            value = resolver_method(value, resolution_data)
+                        node[key] = value
+                        if not isinstance(value, (dict, list)):
+                            continue
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.append(value)
+
+        return input
 
     def _try_resolve_parameter_refs(self, input, parameters):
         """
@@ -178,7 +254,7 @@ class IntrinsicsResolver(object):
         if not self._is_intrinsic_dict(input):
             return input
 
-        function_type = list(input.keys())[0]
+        function_type = next(iter(input))
         return self.supported_intrinsics[function_type].resolve_parameter_refs(input, parameters)
 
     def _try_resolve_sam_resource_refs(self, input, supported_resource_refs):
@@ -195,7 +271,7 @@ class IntrinsicsResolver(object):
         if not self._is_intrinsic_dict(input):
             return input
 
-        function_type = list(input.keys())[0]
+        function_type = next(iter(input))
         return self.supported_intrinsics[function_type].resolve_resource_refs(input, supported_resource_refs)
 
     def _try_resolve_sam_resource_id_refs(self, input, supported_resource_id_refs):
@@ -211,7 +287,7 @@ class IntrinsicsResolver(object):
         if not self._is_intrinsic_dict(input):
             return input
 
-        function_type = list(input.keys())[0]
+        function_type = next(iter(input))
         return self.supported_intrinsics[function_type].resolve_resource_id_refs(input, supported_resource_id_refs)
 
     def _is_intrinsic_dict(self, input):
@@ -221,5 +297,6 @@ class IntrinsicsResolver(object):
         :param input: Object to be checked
         :return: True, if the input contains a supported intrinsic function.  False otherwise
         """
-        # All intrinsic functions are dictionaries with just one key
-        return isinstance(input, dict) and len(input) == 1 and list(input.keys())[0] in self.supported_intrinsics
+        # All intrinsic functions are dictionaries with just one key. Look at the key without building a list of keys,
+        # this is called at every node of every traversal.
+        return isinstance(input, dict) and len(input) == 1 and next(iter(input)) in self.supported_intrinsics
@@ -68,6 +68,12 @@ class SupportedResourceReferences(object):
         """
         return self._refs.get(logical_id, None)
 
+    def logical_ids(self):
+        """
+        :return list: Logical IDs of the resources that support references
+        """
+        return list(self._refs)
+
     def __len__(self):
         """
         To make len(this_object) work
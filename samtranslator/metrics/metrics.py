@@ -2,6 +2,7 @@
 Helper classes to publish metrics
 """
 import logging
+from timeit import default_timer
 
 LOG = logging.getLogger(__name__)
 
@@ -152,7 +153,47 @@ class Metrics:
         """
         self._record_metric(name, value, Unit.Milliseconds, dimensions)
 
+    def timer(self, name, dimensions=None):
+        """
+        Create a timer that records the time spent in a `with` block as a metric with unit Milliseconds.
+
+        :param name: metric name
+        :param dimensions: array of dimensions applied to the metric
+        :return LatencyTimer: Context manager timing its block
+        """
+        return LatencyTimer(self, name, dimensions)
+
     def publish(self):
         """Calls publish method from the configured metrics publisher to publish metrics"""
         self.metrics_publisher.publish(self.namespace, self.metrics_cache)
         self.metrics_cache = []
+
+
+class LatencyTimer:
+    """
+    Context manager that records the time spent inside its block as a latency metric, in milliseconds. The latency is
+    recorded even if the block raises an exception. A timer without metrics does nothing, so that code can be timed
+    unconditionally and timing turned off by not providing metrics.
+    """
+
+    def __init__(self, metrics, name, dimensions=None):
+        """
+        Constructor
+
+        :param metrics: Metrics object to record the latency to. If None, nothing is timed or recorded
+        :param name: metric name
+        :param dimensions: array of dimensions applied to the metric
+        """
+        self.metrics = metrics
+        self.name = name
+        self.dimensions = dimensions if dimensions else []
+        self._start = None
+
+    def __enter__(self):
+        if self.metrics is not None:
+            self._start = default_timer()
+        return self
+
+    def __exit__(self, *args):
+        if self.metrics is not None:
+            self.metrics.record_latency(self.name, (default_timer() - self._start) * 1000, self.dimensions)
@@ -1,7 +1,8 @@
 """ CloudFormation Resource serialization, deserialization, and validation """
-from six import string_types
+from six import add_metaclass, string_types
 
 import re
+import importlib
 import inspect
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.plugins import LifeCycleEvents
@@ -24,6 +25,42 @@ class PropertyType(object):
         self.supports_intrinsics = supports_intrinsics
 
 
+class _ResourceType(type):
+    """Metaclass of Resource. When a Resource class is defined, it compiles the validation of its properties once, and
+    stores the keywords and properties of its instances in slots instead of a dictionary per instance.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        inherited = set()
+        for base in bases:
+            for klass in base.__mro__:
+                inherited.update(klass.__dict__.get("__slots__", ()))
+
+        slots = list(namespace.get("__slots__", ()))
+        for attribute in list(namespace.get("_keywords", ())) + list(namespace.get("property_types") or ()):
+            # Python mangles private names in __slots__, ex: __MANAGE_SWAGGER. They are kept in a dictionary instead
+            if attribute.startswith("__") and not attribute.endswith("__"):
+                attribute = "__dict__"
+            if attribute not in inherited and attribute not in slots:
+                slots.append(attribute)
+        namespace["__slots__"] = tuple(slots)
+
+        return super(_ResourceType, mcs).__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name, bases, namespace):
+        super(_ResourceType, cls).__init__(name, bases, namespace)
+
+        property_types = cls.property_types or {}
+        # Names that can be set on instances, checked with a single lookup in __setattr__
+        cls._attribute_names = frozenset(cls._keywords).union(property_types)
+        # (name, required, validate, supports_intrinsics) of each property, in the order of validate_properties
+        cls._property_validators = tuple(
+            (name, property_type.required, property_type.validate, property_type.supports_intrinsics)
+            for name, property_type in property_types.items()
+        )
+
+
+@add_metaclass(_ResourceType)
 class Resource(object):
     """A Resource object represents an abstract entity that contains a Type and a Properties object. They map well to
     CloudFormation resources as well sub-types like AWS::Lambda::Function or `Events` section of
@@ -72,7 +109,7 @@ class Resource(object):
         self.relative_id = relative_id
         self.depends_on = depends_on
 
-        for name, _ in self.property_types.items():
+        for name in self.property_types:
             setattr(self, name, None)
 
         self.resource_attributes = {}
@@ -243,8 +280,8 @@ class Resource(object):
         :param value: the value of the attribute to be set
         :raises InvalidResourceException: if an invalid property is provided
         """
-        if name in self._keywords or name in self.property_types:
-            return super(Resource, self).__setattr__(name, value)
+        if name in self._attribute_names:
+            return object.__setattr__(self, name, value)
 
         raise InvalidResourceException(
             self.logical_id,
@@ -261,21 +298,21 @@ class Resource(object):
         :rtype: bool
         :raises TypeError: if any properties are invalid
         """
-        for name, property_type in self.property_types.items():
+        for name, required, validate, supports_intrinsics in self._property_validators:
             value = getattr(self, name)
 
             # If the property value is an intrinsic function, any remaining validation has to be left to CloudFormation
-            if property_type.supports_intrinsics and self._is_intrinsic_function(value):
+            if supports_intrinsics and self._is_intrinsic_function(value):
                 continue
 
             # If the property value has not been set, verify that the property is not required.
             if value is None:
-                if property_type.required:
+                if required:
                     raise InvalidResourceException(
                         self.logical_id, "Missing required property '{property_name}'.".format(property_name=name)
                     )
             # Otherwise, validate the value of the property.
-            elif not property_type.validate(value, should_raise=False):
+            elif not validate(value, should_raise=False):
                 raise InvalidResourceException(
                     self.logical_id, "Type of property '{property_name}' is invalid.".format(property_name=name)
                 )
@@ -475,18 +512,33 @@ class ResourceTypeResolver(object):
     def __init__(self, *modules):
         """Initializes the ResourceTypeResolver from the given modules.
 
-        :param modules: one or more Python modules containing Resource definitions
+        :param modules: one or more Python modules containing Resource definitions, or their names. Modules given by
+            name are only imported the first time a type is resolved
         """
-        self.resource_types = {}
-        for module in modules:
-            # Get all classes in the specified module which have a class variable resource_type.
-            for _, resource_class in inspect.getmembers(
-                module,
-                lambda cls: inspect.isclass(cls)
-                and cls.__module__ == module.__name__
-                and hasattr(cls, "resource_type"),
-            ):
-                self.resource_types[resource_class.resource_type] = resource_class
+        self._modules = modules
+        self._resource_types = None
+
+    @property
+    def resource_types(self):
+        if self._resource_types is None:
+            resource_types = {}
+            for module in self._modules:
+                if isinstance(module, string_types):
+                    module = importlib.import_module(module)
+                # Get all classes in the specified module which have a class variable resource_type.
+                for _, resource_class in inspect.getmembers(
+                    module,
+                    lambda cls: inspect.isclass(cls)
+                    and cls.__module__ == module.__name__
+                    and hasattr(cls, "resource_type"),
+                ):
+                    resource_types[resource_class.resource_type] = resource_class
+            self._resource_types = resource_types
+        return self._resource_types
+
+    @resource_types.setter
+    def resource_types(self, resource_types):
+        self._resource_types = resource_types
 
     def can_resolve(self, resource_dict):
         if not isinstance(resource_dict, dict) or "Type" not in resource_dict:
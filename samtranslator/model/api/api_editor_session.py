@@ -0,0 +1,106 @@
+import copy
+from contextlib import contextmanager
+
+
+class ApiEditorSession(object):
+    """
+    Shares one editor per API definition body for the duration of a translation.
+
+    Every API event of every Function or State Machine adds its path and method to the `DefinitionBody` of the API it
+    refers to. Opening a new SwaggerEditor/OpenApiEditor per event copies the whole document twice, once when the
+    editor is created and once when the result is read back, which makes adding N routes cost O(N x document size).
+
+    Instead, the first event that touches an API opens an editor on a private copy of its `DefinitionBody` and installs
+    that copy in the API's properties. All later events of the same translation reuse the editor and modify this copy
+    in place, so the document is copied once per API no matter how many routes are added to it.
+
+    Because the document is shared, an event that fails halfway must not leave its partial changes behind for the
+    events that come after it. Events make their changes inside `edit()`, which undoes them if an error is raised.
+    """
+
+    def __init__(self):
+        # id(api properties) -> (api properties, editor class, editor). The properties dictionary is kept alive by this
+        # map, so its id cannot be reused by another dictionary while the session exists.
+        self._editors = {}
+
+    def open(self, api, editor_class):
+        """
+        Returns the editor for the `DefinitionBody` of the given API. The editor is created on first use and reused by
+        later calls, unless the `DefinitionBody` was replaced since then.
+
+        :param dict api: Properties of the Serverless::Api or Serverless::HttpApi resource
+        :param editor_class: SwaggerEditor or OpenApiEditor, depending on the type of API
+        :return: Editor modifying the `DefinitionBody` of the API in place
+        :raises ValueError: If the `DefinitionBody` is not a valid document for the editor
+        """
+        entry = self._editors.get(id(api))
+        if entry is not None:
+            _, opened_with, editor = entry
+            if opened_with is editor_class and api.get("DefinitionBody") is editor.document:
+                return editor
+
+        editor = editor_class(api.get("DefinitionBody"))
+        api["DefinitionBody"] = editor.document
+        self._editors[id(api)] = (api, editor_class, editor)
+        return editor
+
+    def close(self, api):
+        """
+        Writes back all changes made through the editor of the given API into its `DefinitionBody`. This is cheap and
+        does not copy the document.
+
+        :param dict api: Properties of the Serverless::Api or Serverless::HttpApi resource
+        """
+        entry = self._editors.get(id(api))
+        if entry is not None:
+            api["DefinitionBody"] = entry[2].document
+
+    @contextmanager
+    def edit(self, api, path):
+        """
+        Context manager wrapping the changes an event makes to the given path of an API. If an exception is raised
+        inside the block, the `DefinitionBody` of the API is restored to its state at the start of the block and the
+        exception is re-raised.
+
+        Only the path item of the event and the sections outside of `paths` are saved, because those are the only
+        parts of the document an event changes. Saving them is much cheaper than copying the whole document.
+
+        :param dict api: Properties of the Serverless::Api or Serverless::HttpApi resource
+        :param string path: Path the event adds to the document
+        """
+        savepoint = self._savepoint(api, path)
+        try:
+            yield
+        except Exception:
+            # Any error, not only InvalidEventException, leaves the shared document half-modified. The exception is
+            # always re-raised, this only undoes the changes before the caller handles it.
+            self._rollback(api, path, savepoint)
+            raise
+
+    def _savepoint(self, api, path):
+        entry = self._editors.get(id(api))
+        if entry is None or api.get("DefinitionBody") is not entry[2].document:
+            # No editor has copied this document yet. It is still unmodified if the block fails.
+            return api.get("DefinitionBody"), None
+
+        document = entry[2].document
+        sections = [(key, None if key == "paths" else copy.deepcopy(value)) for key, value in document.items()]
+        return sections, (path in document["paths"], copy.deepcopy(document["paths"].get(path)))
+
+    def _rollback(self, api, path, savepoint):
+        entry = self._editors.pop(id(api), None)
+        saved, saved_path = savepoint
+
+        if saved_path is None:
+            if "DefinitionBody" in api:
+                api["DefinitionBody"] = saved
+            return
+
+        paths = entry[2].document["paths"]
+        had_path, path_item = saved_path
+        if had_path:
+            paths[path] = path_item
+        else:
+            paths.pop(path, None)
+
+        api["DefinitionBody"] = {key: paths if key == "paths" else value for key, value in saved}
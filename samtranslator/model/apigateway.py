@@ -89,8 +89,9 @@ class ApiGatewayDeployment(Resource):
         # redeploy only when the API data changes. First 10 characters of hash is good enough
         # to prevent redeployment when API has not changed
 
-        # NOTE: `str(swagger)` is for backwards compatibility. Changing it to a JSON or something will break compat
-        hash_input = [str(swagger)]
+        # NOTE: `str(swagger)` is for backwards compatibility. Changing it to a JSON or something will break compat.
+        # The Swagger can be several megabytes large, so `str(swagger)` is hashed as it is produced instead of built.
+        hash_input = []
         if openapi_version:
             hash_input.append(str(openapi_version))
         if domain:
@@ -103,8 +104,12 @@ class ApiGatewayDeployment(Resource):
         # The keyword "Deployment" is removed and all the function names associated with api is obtained
         if function_names and function_names.get(self.logical_id[:-10], None):
             hash_input.append(function_names.get(self.logical_id[:-10], ""))
-        data = self._X_HASH_DELIMITER.join(hash_input)
-        generator = logical_id_generator.LogicalIdGenerator(self.logical_id, data)
+        hasher = logical_id_generator.StrHasher()
+        hasher.update_str(swagger)
+        for data in hash_input:
+            hasher.update(self._X_HASH_DELIMITER)
+            hasher.update(data)
+        generator = logical_id_generator.LogicalIdGenerator(self.logical_id, data_hash=hasher.hexdigest())
         self.logical_id = generator.gen()
         digest = generator.get_hash(length=40)  # Get the full hash
         self.Description = "RestApi deployment id: {}".format(digest)
@@ -18,6 +18,7 @@ from samtranslator.model.cognito import CognitoUserPool
 from samtranslator.translator import logical_id_generator
 from samtranslator.translator.arn_generator import ArnGenerator
 from samtranslator.model.exceptions import InvalidEventException, InvalidResourceException
+from samtranslator.model.api.api_editor_session import ApiEditorSession
 from samtranslator.swagger.swagger import SwaggerEditor
 from samtranslator.open_api.open_api import OpenApiEditor
 
@@ -599,7 +600,9 @@ class Api(PushEventSource):
 
         explicit_api = kwargs["explicit_api"]
         if explicit_api.get("__MANAGE_SWAGGER"):
-            self._add_swagger_integration(explicit_api, function, intrinsics_resolver)
+            editor_session = kwargs.get("api_editor_session") or ApiEditorSession()
+            with editor_session.edit(explicit_api, self.Path):
+                self._add_swagger_integration(explicit_api, function, intrinsics_resolver, editor_session)
 
         return resources
 
@@ -642,10 +645,11 @@ class Api(PushEventSource):
 
         return self._construct_permission(resources_to_link["function"], source_arn=source_arn, suffix=suffix)
 
-    def _add_swagger_integration(self, api, function, intrinsics_resolver):
+    def _add_swagger_integration(self, api, function, intrinsics_resolver, editor_session):
         """Adds the path and method for this Api event source to the Swagger body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiEditorSession editor_session: Session holding the editor shared by all events of this API
         """
         swagger_body = api.get("DefinitionBody")
         if swagger_body is None:
@@ -661,7 +665,7 @@ class Api(PushEventSource):
             + "/invocations"
         )
 
-        editor = SwaggerEditor(swagger_body)
+        editor = editor_session.open(api, SwaggerEditor)
 
         if editor.has_integration(self.Path, self.Method):
             # Cannot add the Lambda Integration, if it is already present
@@ -875,7 +879,7 @@ class Api(PushEventSource):
                 path=self.Path, method_name=self.Method, request_parameters=parameters
             )
 
-        api["DefinitionBody"] = editor.swagger
+        editor_session.close(api)
 
 
 class AlexaSkill(PushEventSource):
@@ -1070,7 +1074,9 @@ class HttpApi(PushEventSource):
         resources.extend(self._get_permissions(kwargs))
 
         explicit_api = kwargs["explicit_api"]
-        self._add_openapi_integration(explicit_api, function, explicit_api.get("__MANAGE_SWAGGER"))
+        editor_session = kwargs.get("api_editor_session") or ApiEditorSession()
+        with editor_session.edit(explicit_api, self.Path):
+            self._add_openapi_integration(explicit_api, function, editor_session, explicit_api.get("__MANAGE_SWAGGER"))
 
         return resources
 
@@ -1093,8 +1099,9 @@ class HttpApi(PushEventSource):
 
         editor = None
         if resources_to_link["explicit_api"].get("DefinitionBody"):
+            editor_session = resources_to_link.get("api_editor_session") or ApiEditorSession()
             try:
-                editor = OpenApiEditor(resources_to_link["explicit_api"].get("DefinitionBody"))
+                editor = editor_session.open(resources_to_link["explicit_api"], OpenApiEditor)
             except ValueError as e:
                 api_logical_id = self.ApiId.get("Ref") if isinstance(self.ApiId, dict) else self.ApiId
                 raise InvalidResourceException(api_logical_id, e)
@@ -1128,10 +1135,11 @@ class HttpApi(PushEventSource):
 
         return self._construct_permission(resources_to_link["function"], source_arn=source_arn)
 
-    def _add_openapi_integration(self, api, function, manage_swagger=False):
+    def _add_openapi_integration(self, api, function, editor_session, manage_swagger=False):
         """Adds the path and method for this Api event source to the OpenApi body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiEditorSession editor_session: Session holding the editor shared by all events of this API
         """
         open_api_body = api.get("DefinitionBody")
         if open_api_body is None:
@@ -1144,7 +1152,7 @@ class HttpApi(PushEventSource):
             + "/invocations"
         )
 
-        editor = OpenApiEditor(open_api_body)
+        editor = editor_session.open(api, OpenApiEditor)
 
         if manage_swagger and editor.has_integration(self.Path, self.Method):
             # Cannot add the Lambda Integration, if it is already present
@@ -1174,7 +1182,7 @@ class HttpApi(PushEventSource):
             editor.add_payload_format_version_to_method(
                 api=api, path=self.Path, method_name=self.Method, payload_format_version=self.PayloadFormatVersion
             )
-        api["DefinitionBody"] = editor.openapi
+        editor_session.close(api)
 
     def _add_auth_to_openapi_integration(self, api, editor):
         """Adds authorization to the lambda integration
@@ -1,11 +1,6 @@
 ﻿""" SAM macro definitions """
 from six import string_types
-import copy
 
-import samtranslator.model.eventsources
-import samtranslator.model.eventsources.pull
-import samtranslator.model.eventsources.push
-import samtranslator.model.eventsources.cloudwatchlogs
 from .api.api_generator import ApiGenerator
 from .api.http_api_generator import HttpApiGenerator
 from .packagetype import ZIP, IMAGE
@@ -47,7 +42,6 @@ from samtranslator.model.intrinsics import (
 )
 from samtranslator.model.sqs import SQSQueue
 from samtranslator.model.sns import SNSTopic
-from samtranslator.model.stepfunctions import StateMachineGenerator
 from samtranslator.model.role_utils import construct_role_for_resource
 from samtranslator.model.xray_utils import get_xray_managed_policy_name
 
@@ -91,11 +85,12 @@ class SamFunction(SamResourceMacro):
         "ImageConfig": PropertyType(False, is_type(dict)),
         "CodeSigningConfigArn": PropertyType(False, is_str()),
     }
+    # Event sources are imported the first time a function with events is translated
     event_resolver = ResourceTypeResolver(
-        samtranslator.model.eventsources,
-        samtranslator.model.eventsources.pull,
-        samtranslator.model.eventsources.push,
-        samtranslator.model.eventsources.cloudwatchlogs,
+        "samtranslator.model.eventsources",
+        "samtranslator.model.eventsources.pull",
+        "samtranslator.model.eventsources.push",
+        "samtranslator.model.eventsources.cloudwatchlogs",
     )
 
     # DeadLetterQueue
@@ -192,6 +187,7 @@ class SamFunction(SamResourceMacro):
                 kwargs["event_resources"],
                 intrinsics_resolver,
                 lambda_alias=lambda_alias,
+                api_editor_session=kwargs.get("api_editor_session"),
             )
         except InvalidEventException as e:
             raise InvalidResourceException(self.logical_id, e.message)
@@ -588,7 +584,13 @@ class SamFunction(SamResourceMacro):
         return event_dict.get("Properties", {}).get("Path", logical_id)
 
     def _generate_event_resources(
-        self, lambda_function, execution_role, event_resources, intrinsics_resolver, lambda_alias=None
+        self,
+        lambda_function,
+        execution_role,
+        event_resources,
+        intrinsics_resolver,
+        lambda_alias=None,
+        api_editor_session=None,
     ):
         """Generates and returns the resources associated with this function's events.
 
@@ -599,6 +601,7 @@ class SamFunction(SamResourceMacro):
         :param event_resources: All the event sources associated with this Lambda function
         :param model.lambda_.LambdaAlias lambda_alias: Optional Lambda Alias resource if we want to connect the
             event sources to this alias
+        :param ApiEditorSession api_editor_session: Optional session shared by all API events of the translation
 
         :returns: a list containing the function's event resources
         :rtype: list
@@ -619,6 +622,8 @@ class SamFunction(SamResourceMacro):
                     "role": execution_role,
                     "intrinsics_resolver": intrinsics_resolver,
                 }
+                if api_editor_session:
+                    kwargs["api_editor_session"] = api_editor_session
 
                 for name, resource in event_resources[logical_id].items():
                     kwargs[name] = resource
@@ -1184,8 +1189,9 @@ class SamLayerVersion(SamResourceMacro):
 
         old_logical_id = self.logical_id
 
-        # This is to prevent the passthrough resource attributes to be included for hashing
-        hash_dict = copy.deepcopy(self.to_dict())
+        # This is to prevent the passthrough resource attributes to be included for hashing. to_dict() builds a new
+        # dictionary for the resource, so the attributes can be removed from it without copying the properties.
+        hash_dict = self.to_dict()
         if "DeletionPolicy" in hash_dict.get(old_logical_id):
             del hash_dict[old_logical_id]["DeletionPolicy"]
         if "UpdateReplacePolicy" in hash_dict.get(old_logical_id):
@@ -1265,8 +1271,9 @@ class SamStateMachine(SamResourceMacro):
         "Tracing": PropertyType(False, is_type(dict)),
         "PermissionsBoundary": PropertyType(False, is_str()),
     }
+    # State machine support is imported the first time a state machine is translated
     event_resolver = ResourceTypeResolver(
-        samtranslator.model.stepfunctions.events,
+        "samtranslator.model.stepfunctions.events",
     )
 
     def to_cloudformation(self, **kwargs):
@@ -1274,6 +1281,8 @@ class SamStateMachine(SamResourceMacro):
         intrinsics_resolver = kwargs["intrinsics_resolver"]
         event_resources = kwargs["event_resources"]
 
+        from samtranslator.model.stepfunctions import StateMachineGenerator
+
         state_machine_generator = StateMachineGenerator(
             logical_id=self.logical_id,
             depends_on=self.depends_on,
@@ -1295,6 +1304,7 @@ class SamStateMachine(SamResourceMacro):
             tags=self.Tags,
             resource_attributes=self.resource_attributes,
             passthrough_resource_attributes=self.get_passthrough_resource_attributes(),
+            api_editor_session=kwargs.get("api_editor_session"),
         )
 
         resources = state_machine_generator.to_cloudformation()
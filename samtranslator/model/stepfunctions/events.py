@@ -10,6 +10,7 @@ from samtranslator.translator import logical_id_generator
 from samtranslator.model.exceptions import InvalidEventException, InvalidResourceException
 from samtranslator.model.eventbridge_utils import EventBridgeRuleUtils
 from samtranslator.translator.arn_generator import ArnGenerator
+from samtranslator.model.api.api_editor_session import ApiEditorSession
 from samtranslator.swagger.swagger import SwaggerEditor
 from samtranslator.open_api.open_api import OpenApiEditor
 
@@ -313,14 +314,17 @@ class Api(EventSource):
 
         explicit_api = kwargs["explicit_api"]
         if explicit_api.get("__MANAGE_SWAGGER"):
-            self._add_swagger_integration(explicit_api, resource, role, intrinsics_resolver)
+            editor_session = kwargs.get("api_editor_session") or ApiEditorSession()
+            with editor_session.edit(explicit_api, self.Path):
+                self._add_swagger_integration(explicit_api, resource, role, intrinsics_resolver, editor_session)
 
         return resources
 
-    def _add_swagger_integration(self, api, resource, role, intrinsics_resolver):
+    def _add_swagger_integration(self, api, resource, role, intrinsics_resolver, editor_session):
         """Adds the path and method for this Api event source to the Swagger body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiEditorSession editor_session: Session holding the editor shared by all events of this API
         """
         swagger_body = api.get("DefinitionBody")
         if swagger_body is None:
@@ -329,7 +333,7 @@ class Api(EventSource):
         resource_arn = resource.get_runtime_attr("arn")
         integration_uri = fnSub("arn:${AWS::Partition}:apigateway:${AWS::Region}:states:action/StartExecution")
 
-        editor = SwaggerEditor(swagger_body)
+        editor = editor_session.open(api, SwaggerEditor)
 
         if editor.has_integration(self.Path, self.Method):
             # Cannot add the integration, if it is already present
@@ -420,7 +424,7 @@ class Api(EventSource):
                 if resource_policy.get("CustomStatements"):
                     editor.add_custom_statements(resource_policy.get("CustomStatements"))
 
-        api["DefinitionBody"] = editor.swagger
+        editor_session.close(api)
 
     def _generate_request_template(self, resource):
         """Generates the Body mapping request template for the Api. This allows for the input
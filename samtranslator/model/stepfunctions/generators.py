@@ -4,7 +4,6 @@ from copy import deepcopy
 
 from six import string_types
 
-import samtranslator.model.eventsources.push
 from samtranslator.model import ResourceTypeResolver
 from samtranslator.model.exceptions import InvalidEventException, InvalidResourceException
 from samtranslator.model.iam import IAMRolePolicies
@@ -49,6 +48,7 @@ class StateMachineGenerator(object):
         tags=None,
         resource_attributes=None,
         passthrough_resource_attributes=None,
+        api_editor_session=None,
     ):
         """
         Constructs an State Machine Generator class that generates a State Machine resource
@@ -73,6 +73,7 @@ class StateMachineGenerator(object):
         :param tags: Tags to be associated with the State Machine resource
         :param resource_attributes: Resource attributes to add to the State Machine resource
         :param passthrough_resource_attributes: Attributes such as `Condition` that are added to derived resources
+        :param api_editor_session: Optional ApiEditorSession shared by all API events of the translation
         """
         self.logical_id = logical_id
         self.depends_on = depends_on
@@ -93,6 +94,7 @@ class StateMachineGenerator(object):
         self.events = events
         self.event_resources = event_resources
         self.event_resolver = event_resolver
+        self.api_editor_session = api_editor_session
         self.tags = tags
         self.state_machine = StepFunctionsStateMachine(
             logical_id, depends_on=depends_on, attributes=resource_attributes
@@ -255,6 +257,8 @@ class StateMachineGenerator(object):
                     "intrinsics_resolver": self.intrinsics_resolver,
                     "permissions_boundary": self.permissions_boundary,
                 }
+                if self.api_editor_session:
+                    kwargs["api_editor_session"] = self.api_editor_session
                 try:
                     eventsource = self.event_resolver.resolve_resource_type(event_dict).from_dict(
                         self.state_machine.logical_id + logical_id, event_dict, logical_id
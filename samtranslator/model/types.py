@@ -43,8 +43,9 @@ def list_of(validate_item):
     :rtype: callable
     """
 
+    validate_type = is_type(list)
+
     def validate(value, should_raise=True):
-        validate_type = is_type(list)
         if not validate_type(value, should_raise=should_raise):
             return False
 
@@ -71,8 +72,9 @@ def dict_of(validate_key, validate_item):
     :rtype: callable
     """
 
+    validate_type = is_type(dict)
+
     def validate(value, should_raise=True):
-        validate_type = is_type(dict)
         if not validate_type(value, should_raise=should_raise):
             return False
 
@@ -553,6 +553,17 @@ class OpenApiEditor(object):
         :return dict: Dictionary containing the OpenApi specification
         """
 
+        return copy.deepcopy(self.document)
+
+    @property
+    def document(self):
+        """
+        Returns the OpenApi specification owned by this editor, with all changes applied. This is *not* a copy. Any
+        further modification made through this editor is reflected in the returned dictionary.
+
+        :return dict: Dictionary containing the OpenApi specification
+        """
+
         # Make sure any changes to the paths are reflected back in output
         self._doc["paths"] = self.paths
 
@@ -566,7 +577,7 @@ class OpenApiEditor(object):
         if self.info:
             self._doc["info"] = self.info
 
-        return copy.deepcopy(self._doc)
+        return self._doc
 
     @staticmethod
     def is_valid(data):
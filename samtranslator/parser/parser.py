@@ -1,3 +1,4 @@
+from samtranslator.metrics.metrics import LatencyTimer
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidTemplateException, InvalidResourceException
 from samtranslator.validator.validator import SamTemplateValidator
 from samtranslator.plugins import LifeCycleEvents
@@ -5,11 +6,16 @@ from samtranslator.public.sdk.template import SamTemplate
 
 
 class Parser:
-    def __init__(self):
-        pass
+    def __init__(self, validate_schema=True):
+        """
+        :param bool validate_schema: Validate templates against the SAM JSON schema. Validation results are not used to
+            reject templates, so callers that do not need them can set this to False to skip the cost
+        """
+        self.validate_schema = validate_schema
 
     def parse(self, sam_template, parameter_values, sam_plugins):
-        self._validate(sam_template, parameter_values)
+        with LatencyTimer(sam_plugins.metrics, "ValidationLatency"):
+            self._validate(sam_template, parameter_values)
         sam_plugins.act(LifeCycleEvents.before_transform_template, sam_template)
 
     # private methods
@@ -55,4 +61,5 @@ class Parser:
                     ]
                 )
 
-        SamTemplateValidator.validate(sam_template)
+        if self.validate_schema:
+            SamTemplateValidator.validate(sam_template)
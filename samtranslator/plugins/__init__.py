@@ -1,5 +1,6 @@
 import logging
 
+from samtranslator.metrics.metrics import LatencyTimer
 from samtranslator.model.exceptions import InvalidResourceException, InvalidDocumentException
 from enum import Enum
 
@@ -40,19 +41,32 @@ class SamPlugins(object):
     Arguments passed to the hook method is different for each life cycle event. Check out the hook methods in the
     `BasePlugin` class for detailed description of the method signature
 
+    ### Dispatch
+    Hooks are looked up once, when the plugin is registered. Hooks a plugin inherits from `BasePlugin` do nothing, so
+    they are not called at all. A plugin that only acts on some resource types declares them in its `resource_types`
+    class attribute, and its resource level hooks are then only called for resources of these types.
+
     ### Raising validation errors
     Plugins must raise an `samtranslator.model.exception.InvalidResourceException` when the input SAM template does
     not conform to the expectation
     set by the plugin. SAM translator will convert this into a nice error message and display to the user.
     """
 
-    def __init__(self, initial_plugins=None):
+    def __init__(self, initial_plugins=None, metrics=None):
         """
         Initialize the plugins class with an optional list of plugins
 
         :param BasePlugin or list initial_plugins: Single plugin or a List of plugins to initialize with
+        :param samtranslator.metrics.metrics.Metrics metrics: Optional, metrics to record the latency of template level
+            hooks of each plugin to. Nothing is timed if not provided
         """
         self._plugins = []
+        self.metrics = metrics
+        # Event name -> list of (plugin, hook) to invoke, in the order plugins were registered. The hook is None when
+        # the plugin does not have it, which is only an error if the event is acted upon.
+        self._dispatch_table = {}
+        # (Event name, resource type) -> subset of the dispatch table of the event interested in the resource type
+        self._resource_dispatch_table = {}
 
         if initial_plugins is None:
             initial_plugins = []
@@ -81,6 +95,12 @@ class SamPlugins(object):
 
         self._plugins.append(plugin)
 
+        for event in LifeCycleEvents:
+            self._dispatch_table.setdefault(event.name, [])
+        for event_name, hooks in self._dispatch_table.items():
+            hooks.extend(self._get_hooks(plugin, event_name))
+        self._resource_dispatch_table.clear()
+
     def is_registered(self, plugin_name):
         """
         Checks if a plugin with given name is already registered
@@ -120,17 +140,32 @@ class SamPlugins(object):
         if not isinstance(event, LifeCycleEvents):
             raise ValueError("'event' must be an instance of LifeCycleEvents class")
 
-        method_name = "on_" + event.name
+        if event is LifeCycleEvents.before_transform_resource:
+            resource_type = args[1] if len(args) > 1 else kwargs.get("resource_type")
+            hooks = self._get_resource_dispatch_table(event.name, resource_type)
+            # Only template level hooks are timed. Resource level hooks run once per resource, their time is included
+            # in the latency of the resource they act on.
+            metrics = None
+        else:
+            hooks = self._get_dispatch_table(event.name)
+            metrics = self.metrics
 
-        for plugin in self._plugins:
+        for plugin, hook in hooks:
 
-            if not hasattr(plugin, method_name):
+            if hook is None:
                 raise NameError(
-                    "'{}' method is not found in the plugin with name '{}'".format(method_name, plugin.name)
+                    "'{}' method is not found in the plugin with name '{}'".format("on_" + event.name, plugin.name)
                 )
 
             try:
-                getattr(plugin, method_name)(*args, **kwargs)
+                dimensions = None
+                if metrics is not None:
+                    dimensions = [
+                        {"Name": "PluginName", "Value": plugin.name},
+                        {"Name": "LifeCycleEvent", "Value": event.name},
+                    ]
+                with LatencyTimer(metrics, "PluginLatency", dimensions):
+                    hook(*args, **kwargs)
             except (InvalidResourceException, InvalidDocumentException) as ex:
                 # Don't need to log these because they don't result in crashes
                 raise ex
@@ -138,6 +173,58 @@ class SamPlugins(object):
                 LOG.exception("Plugin '%s' raised an exception: %s", plugin.name, ex)
                 raise ex
 
+    def _get_dispatch_table(self, event_name):
+        """
+        Returns the hooks to invoke for the given event. Tables of all life cycle events are built when plugins are
+        registered, the table of any other event is built the first time it is acted upon.
+
+        :param string event_name: Name of the event
+        :return list: List of (plugin, hook) tuples
+        """
+        if event_name not in self._dispatch_table:
+            self._dispatch_table[event_name] = [
+                hook for plugin in self._plugins for hook in self._get_hooks(plugin, event_name)
+            ]
+        return self._dispatch_table[event_name]
+
+    def _get_resource_dispatch_table(self, event_name, resource_type):
+        """
+        Returns the hooks to invoke for the given resource level event on a resource of the given type
+
+        :param string event_name: Name of the event
+        :param string resource_type: Type of the resource the event is about
+        :return list: List of (plugin, hook) tuples
+        """
+        key = (event_name, resource_type)
+        if key not in self._resource_dispatch_table:
+            self._resource_dispatch_table[key] = [
+                (plugin, hook)
+                for plugin, hook in self._get_dispatch_table(event_name)
+                if _is_interested(plugin, resource_type)
+            ]
+        return self._resource_dispatch_table[key]
+
+    @staticmethod
+    def _get_hooks(plugin, event_name):
+        """
+        Returns the hook of the plugin to invoke for the given event, unless it is the NoOp hook of `BasePlugin`
+
+        :param samtranslator.plugins.BasePlugin plugin: Plugin to get the hook of
+        :param string event_name: Name of the event
+        :return list: Empty list if the hook does nothing, a list with a single (plugin, hook) tuple otherwise
+        """
+        method_name = "on_" + event_name
+        if not hasattr(plugin, method_name):
+            return [(plugin, None)]
+
+        class_hook = getattr(type(plugin), method_name, None)
+        inherited = method_name not in getattr(plugin, "__dict__", {}) and getattr(
+            class_hook, "__func__", class_hook
+        ) is BasePlugin.__dict__.get(method_name)
+        if inherited:
+            return []
+        return [(plugin, getattr(plugin, method_name))]
+
     def __len__(self):
         """
         Returns the number of plugins registered with this class
@@ -157,11 +244,28 @@ class LifeCycleEvents(Enum):
     after_transform_template = "after_transform_template"
 
 
+def _is_interested(plugin, resource_type):
+    """
+    Is the plugin interested in resource level events of the given resource type? Interest is declared by the class
+    of the plugin, in its `resource_types` attribute.
+
+    :param samtranslator.plugins.BasePlugin plugin: Plugin to check
+    :param string resource_type: Type of the resource
+    :return bool: True if the plugin did not declare resource types, or declared this one
+    """
+    resource_types = getattr(type(plugin), "resource_types", None)
+    return resource_types is None or resource_type in resource_types
+
+
 class BasePlugin(object):
     """
     Base class for a NoOp plugin that implements all available hooks
     """
 
+    # Types of the resources whose resource level events the plugin acts on. None means all resources. Plugins that
+    # only handle some resource types should set it, so they are not invoked at all for other resources.
+    resource_types = None
+
     def __init__(self, name):
         """
         Initialize the plugin with given name. Name is always required to register a plugin
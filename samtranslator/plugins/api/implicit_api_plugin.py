@@ -1,5 +1,6 @@
 import copy
 
+from samtranslator.model.api.api_editor_session import ApiEditorSession
 from samtranslator.model.intrinsics import make_combined_condition
 from samtranslator.public.plugins import BasePlugin
 from samtranslator.public.exceptions import InvalidDocumentException, InvalidResourceException, InvalidEventException
@@ -41,6 +42,8 @@ class ImplicitApiPlugin(BasePlugin):
         self.api_conditions = {}
         self.api_deletion_policies = {}
         self.api_update_replace_policies = {}
+        # Editors of the API definitions modified by this plugin. One editor is shared by all events of an API
+        self.editor_session = ApiEditorSession()
         self._setup_api_properties()
 
     def _setup_api_properties(self):
@@ -58,6 +61,7 @@ class ImplicitApiPlugin(BasePlugin):
         """
 
         template = SamTemplate(template_dict)
+        self.editor_session = ApiEditorSession()
 
         # Temporarily add Serverless::Api resource corresponding to Implicit API to the template.
         # This will allow the processing code to work the same way for both Implicit & Explicit APIs
@@ -201,14 +205,12 @@ class ImplicitApiPlugin(BasePlugin):
             # Until then, we will not modify explicit explicit APIs.
             return
 
-        swagger = resource.properties.get("DefinitionBody")
-
         path = event_properties["Path"]
         method = event_properties["Method"]
-        editor = self.editor(swagger)
+        editor = self.editor_session.open(resource.properties, self.editor)
         editor.add_path(path, method)
 
-        resource.properties["DefinitionBody"] = self._get_api_definition_from_editor(editor)
+        self.editor_session.close(resource.properties)
         template.set(api_id, resource)
 
     def _get_api_id(self, event_properties):
@@ -360,8 +362,7 @@ class ImplicitApiPlugin(BasePlugin):
             if not api.properties.get("__MANAGE_SWAGGER"):
                 continue
 
-            swagger = api.properties.get("DefinitionBody")
-            editor = self.editor(swagger)
+            editor = self.editor_session.open(api.properties, self.editor)
 
             for path in editor.iter_on_path():
                 all_method_conditions = set(
@@ -379,17 +380,9 @@ class ImplicitApiPlugin(BasePlugin):
                         )
                         editor.make_path_conditional(path, path_condition_name)
 
-            api.properties["DefinitionBody"] = self._get_api_definition_from_editor(editor)  # TODO make static method
+            self.editor_session.close(api.properties)
             template.set(api_id, api)
 
-    def _get_api_definition_from_editor(self, editor):
-        """
-        Required function that returns the api body from the respective editor
-        """
-        raise NotImplementedError(
-            "Method _setup_api_properties() must be implemented in a " "subclass of ImplicitApiPlugin"
-        )
-
     def _path_condition_name(self, api_id, path):
         """
         Generate valid condition logical id from the given API logical id and swagger resource path.
@@ -126,12 +126,6 @@ class ImplicitHttpApiPlugin(ImplicitApiPlugin):
         """
         return ImplicitHttpApiResource().to_dict()
 
-    def _get_api_definition_from_editor(self, editor):
-        """
-        Helper function to return the OAS definition from the editor
-        """
-        return editor.openapi
-
     def _get_api_resource_type_name(self):
         """
         Returns the type of API resource
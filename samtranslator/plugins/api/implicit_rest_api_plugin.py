@@ -123,12 +123,6 @@ class ImplicitRestApiPlugin(ImplicitApiPlugin):
         """
         return ImplicitApiResource().to_dict()
 
-    def _get_api_definition_from_editor(self, editor):
-        """
-        Helper function to return the OAS definition from the editor
-        """
-        return editor.swagger
-
     def _get_api_resource_type_name(self):
         """
         Returns the type of API resource
@@ -1,6 +1,4 @@
-import boto3
 import json
-from botocore.exceptions import ClientError, EndpointConnectionError
 import logging
 from time import sleep, time
 import copy
@@ -30,10 +28,17 @@ class ServerlessAppPlugin(BasePlugin):
     reaches ACTIVE status, all assets have been successfully copied and are
     ready to be deployed. This plugin verfies that applications are in an
     ACTIVE state by calling the GetCloudFormation API from SAR.
+
+    Requests for different applications are sent concurrently, and so are the
+    status checks of all templates that are not ACTIVE yet. Status checks are
+    retried with an increasing delay while no template becomes ACTIVE.
     """
 
     SUPPORTED_RESOURCE_TYPE = "AWS::Serverless::Application"
-    SLEEP_TIME_SECONDS = 2
+    resource_types = {SUPPORTED_RESOURCE_TYPE}
+    SLEEP_TIME_SECONDS = 1
+    MAX_SLEEP_TIME_SECONDS = 8
+    MAX_CONCURRENT_REQUESTS = 10
     # CloudFormation times out on transforms after 2 minutes, so setting this
     # timeout below that to leave some buffer
     TEMPLATE_WAIT_TIMEOUT_SECONDS = 105
@@ -42,7 +47,15 @@ class ServerlessAppPlugin(BasePlugin):
     LOCATION_KEY = "Location"
     TEMPLATE_URL_KEY = "TemplateUrl"
 
-    def __init__(self, sar_client=None, wait_for_template_active_status=False, validate_only=False, parameters=None):
+    def __init__(
+        self,
+        sar_client=None,
+        wait_for_template_active_status=False,
+        validate_only=False,
+        parameters=None,
+        max_concurrent_requests=None,
+        template_url_cache=None,
+    ):
         """
         Initialize the plugin.
 
@@ -50,6 +63,11 @@ class ServerlessAppPlugin(BasePlugin):
         :param boto3.client sar_client: The boto3 client to use to access the Serverless Application Repository
         :param bool wait_for_template_active_status: Flag to wait for all templates to become active
         :param bool validate_only: Flag to only validate application access (uses get_application API instead)
+        :param int max_concurrent_requests: Maximum number of requests sent to the Serverless Application Repository
+            at the same time. Defaults to MAX_CONCURRENT_REQUESTS, 1 sends them one after the other
+        :param TemplateUrlCache template_url_cache: Optional, cache of the templates created by the Serverless
+            Application Repository, usually shared by the plugins of all translations. Cached templates are not
+            requested again
         """
         super(ServerlessAppPlugin, self).__init__(ServerlessAppPlugin.__name__)
         if parameters is None:
@@ -60,6 +78,10 @@ class ServerlessAppPlugin(BasePlugin):
         self._wait_for_template_active_status = wait_for_template_active_status
         self._validate_only = validate_only
         self._parameters = parameters
+        self._max_concurrent_requests = max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS
+        self._template_url_cache = template_url_cache
+        # TemplateId -> key in the template url cache, of the cached templates that are not ACTIVE yet
+        self._cached_in_progress_templates = {}
 
         # make sure the flag combination makes sense
         if self._validate_only is True and self._wait_for_template_active_status is True:
@@ -80,11 +102,7 @@ class ServerlessAppPlugin(BasePlugin):
         template = SamTemplate(template_dict)
         intrinsic_resolvers = self._get_intrinsic_resolvers(template_dict.get("Mappings", {}))
 
-        service_call = None
-        if self._validate_only:
-            service_call = self._handle_get_application_request
-        else:
-            service_call = self._handle_create_cfn_template_request
+        requests = []
         for logical_id, app in template.iterate({SamResourceType.Application.value}):
             if not self._can_process_application(app):
                 # Handle these cases in the on_before_transform_resource event
@@ -106,18 +124,70 @@ class ServerlessAppPlugin(BasePlugin):
             key = (app_id, semver)
 
             if key not in self._applications:
-                try:
-                    if not RegionConfiguration.is_sar_supported():
-                        raise InvalidResourceException(
-                            logical_id, "Serverless Application Repository is not available in this region."
-                        )
-                    # Lazy initialization of the client- create it when it is needed
-                    if not self._sar_client:
-                        self._sar_client = boto3.client("serverlessrepo")
-                    service_call(app_id, semver, key, logical_id)
-                except InvalidResourceException as e:
-                    # Catch all InvalidResourceExceptions, raise those in the before_resource_transform target.
-                    self._applications[key] = e
+                if not RegionConfiguration.is_sar_supported():
+                    # Raised in the before_resource_transform target, like errors of the service calls.
+                    self._applications[key] = InvalidResourceException(
+                        logical_id, "Serverless Application Repository is not available in this region."
+                    )
+                    continue
+                # Placeholder until the request completes, so that each application is only requested once
+                self._applications[key] = None
+                requests.append((app_id, semver, logical_id))
+
+        if not requests:
+            return
+
+        # Lazy initialization of the client- create it when it is needed. Clients can be shared between threads, but
+        # creating one is not thread safe.
+        if not self._sar_client:
+            import boto3
+
+            self._sar_client = boto3.client("serverlessrepo")
+
+        results = self._map_concurrently(self._request_application, requests)
+        for (app_id, semver, _), (application, in_progress_template) in zip(requests, results):
+            self._applications[(app_id, semver)] = application
+            if in_progress_template is not None:
+                self._in_progress_templates.append(in_progress_template)
+
+    def _request_application(self, request):
+        """
+        Sends the request of an application to the serverless application repo. Called from worker threads, so it
+        returns its result instead of storing it in the plugin.
+
+        :param tuple request: ApplicationId, SemanticVersion and the logical_id of the application resource
+        :return: Tuple of the value to store in `_applications` for this application, and the (ApplicationId,
+            TemplateId) of its template if it is not ACTIVE yet, or None
+        """
+        app_id, semver, logical_id = request
+        try:
+            if self._validate_only:
+                return self._handle_get_application_request(app_id, semver, logical_id)
+            return self._handle_create_cfn_template_request(app_id, semver, logical_id)
+        except InvalidResourceException as e:
+            # Catch all InvalidResourceExceptions, raise those in the before_resource_transform target.
+            return e, None
+
+    def _map_concurrently(self, function, items):
+        """
+        Calls the function on each item, from up to `max_concurrent_requests` threads
+
+        :param function: Function to call with each item
+        :param list items: Items to call the function with
+        :return list: Results of the function, in the order of the items
+        :raises Exception: The first exception raised by the function, once all calls completed
+        """
+        if len(items) <= 1 or self._max_concurrent_requests <= 1:
+            return [function(item) for item in items]
+
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(min(len(items), self._max_concurrent_requests))
+        try:
+            return pool.map(function, items, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
 
     def _replace_value(self, input_dict, key, intrinsic_resolvers):
         value = self._resolve_location_value(input_dict.get(key), intrinsic_resolvers)
@@ -151,50 +221,69 @@ class ServerlessAppPlugin(BasePlugin):
             and app.properties[self.LOCATION_KEY][self.SEMANTIC_VERSION_KEY] is not None
         )
 
-    def _handle_get_application_request(self, app_id, semver, key, logical_id):
+    def _handle_get_application_request(self, app_id, semver, logical_id):
         """
         Method that handles the get_application API call to the serverless application repo
 
-        This method puts something in the `_applications` dictionary because the plugin expects
+        This method returns something to put in the `_applications` dictionary because the plugin expects
         something there in a later event.
 
         :param string app_id: ApplicationId
         :param string semver: SemanticVersion
-        :param string key: The dictionary key consisting of (ApplicationId, SemanticVersion)
         :param string logical_id: the logical_id of this application resource
+        :return: Tuple of the value to store in `_applications`, and None as there is no template to wait for
         """
+        from botocore.exceptions import EndpointConnectionError
+
         LOG.info("Getting application {}/{} from serverless application repo...".format(app_id, semver))
         get_application = lambda app_id, semver: self._sar_client.get_application(
             ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
         )
         try:
             self._sar_service_call(get_application, logical_id, app_id, semver)
-            self._applications[key] = {"Available"}
             LOG.info("Finished getting application {}/{}.".format(app_id, semver))
+            return {"Available"}, None
         except EndpointConnectionError as e:
             # No internet connection. Don't break verification, but do show a warning.
             warning_message = "{}. Unable to verify access to {}/{}.".format(e, app_id, semver)
             LOG.warning(warning_message)
-            self._applications[key] = {"Unable to verify"}
+            return {"Unable to verify"}, None
 
-    def _handle_create_cfn_template_request(self, app_id, semver, key, logical_id):
+    def _handle_create_cfn_template_request(self, app_id, semver, logical_id):
         """
         Method that handles the create_cloud_formation_template API call to the serverless application repo
 
         :param string app_id: ApplicationId
         :param string semver: SemanticVersion
-        :param string key: The dictionary key consisting of (ApplicationId, SemanticVersion)
         :param string logical_id: the logical_id of this application resource
+        :return: Tuple of the TemplateUrl, and the (ApplicationId, TemplateId) of the template if it is not ACTIVE yet
         """
-        LOG.info("Requesting to create CFN template {}/{} in serverless application repo...".format(app_id, semver))
-        create_cfn_template = lambda app_id, semver: self._sar_client.create_cloud_formation_template(
-            ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
-        )
-        response = self._sar_service_call(create_cfn_template, logical_id, app_id, semver)
-        LOG.info("Requested to create CFN template {}/{} in serverless application repo.".format(app_id, semver))
-        self._applications[key] = response[self.TEMPLATE_URL_KEY]
+        cache_key = None
+        response = None
+        if self._template_url_cache is not None:
+            region = getattr(getattr(self._sar_client, "meta", None), "region_name", None)
+            cache_key = (self._sanitize_sar_str_param(app_id), self._sanitize_sar_str_param(semver), region)
+            response = self._template_url_cache.get(*cache_key)
+
+        if response is not None:
+            LOG.info("Using cached CFN template {}/{} of serverless application repo.".format(app_id, semver))
+        else:
+            LOG.info("Requesting to create CFN template {}/{} in serverless application repo...".format(app_id, semver))
+            create_cfn_template = lambda app_id, semver: self._sar_client.create_cloud_formation_template(
+                ApplicationId=self._sanitize_sar_str_param(app_id),
+                SemanticVersion=self._sanitize_sar_str_param(semver),
+            )
+            response = self._sar_service_call(create_cfn_template, logical_id, app_id, semver)
+            LOG.info("Requested to create CFN template {}/{} in serverless application repo.".format(app_id, semver))
+            if cache_key is not None:
+                self._template_url_cache.put(*cache_key, template=response)
+
+        in_progress_template = None
         if response["Status"] != "ACTIVE":
-            self._in_progress_templates.append((response[self.APPLICATION_ID_KEY], response["TemplateId"]))
+            in_progress_template = (response[self.APPLICATION_ID_KEY], response["TemplateId"])
+            if cache_key is not None:
+                self._cached_in_progress_templates[response["TemplateId"]] = cache_key
+        return response[self.TEMPLATE_URL_KEY], in_progress_template
 
     def _sanitize_sar_str_param(self, param):
         """
@@ -299,29 +388,34 @@ class ServerlessAppPlugin(BasePlugin):
         """
         if self._wait_for_template_active_status and not self._validate_only:
             start_time = time()
+            sleep_time = self.SLEEP_TIME_SECONDS
             while (time() - start_time) < self.TEMPLATE_WAIT_TIMEOUT_SECONDS:
                 temp = self._in_progress_templates
                 self._in_progress_templates = []
 
-                # Check each resource to make sure it's active
+                # Check all resources at once to make sure they're active
                 LOG.info("Checking resources in serverless application repo...")
-                for application_id, template_id in temp:
-                    get_cfn_template = (
-                        lambda application_id, template_id: self._sar_client.get_cloud_formation_template(
-                            ApplicationId=self._sanitize_sar_str_param(application_id),
-                            TemplateId=self._sanitize_sar_str_param(template_id),
-                        )
-                    )
-                    response = self._sar_service_call(get_cfn_template, application_id, application_id, template_id)
-                    self._handle_get_cfn_template_response(response, application_id, template_id)
+                responses = self._map_concurrently(self._get_cfn_template, temp)
+                for (application_id, template_id), response in zip(temp, responses):
+                    if response is None:
+                        self._in_progress_templates.append((application_id, template_id))
+                    else:
+                        self._handle_get_cfn_template_response(response, application_id, template_id)
                 LOG.info("Finished checking resources in serverless application repo.")
 
                 # Don't sleep if there are no more templates with PREPARING status
                 if len(self._in_progress_templates) == 0:
                     break
 
-                # Sleep a little so we don't spam service calls
-                sleep(self.SLEEP_TIME_SECONDS)
+                # Sleep a little so we don't spam service calls, but not past the timeout
+                remaining_time = self.TEMPLATE_WAIT_TIMEOUT_SECONDS - (time() - start_time)
+                sleep(max(0, min(sleep_time, remaining_time)))
+
+                # Check again quickly while templates keep becoming active, back off while none does
+                if len(self._in_progress_templates) < len(temp):
+                    sleep_time = self.SLEEP_TIME_SECONDS
+                else:
+                    sleep_time = min(sleep_time * 2, self.MAX_SLEEP_TIME_SECONDS)
 
             # Not all templates reached active status
             if len(self._in_progress_templates) != 0:
@@ -330,6 +424,28 @@ class ServerlessAppPlugin(BasePlugin):
                     application_ids, "Timed out waiting for nested stack templates " "to reach ACTIVE status."
                 )
 
+    def _get_cfn_template(self, in_progress_template):
+        """
+        Gets the status of a template from the serverless application repo. Called from worker threads.
+
+        :param tuple in_progress_template: ApplicationId and TemplateId of the template
+        :return dict: Response of the serverless application repo, or None if the request was throttled
+        """
+        from botocore.exceptions import ClientError
+
+        application_id, template_id = in_progress_template
+        get_cfn_template = lambda application_id, template_id: self._sar_client.get_cloud_formation_template(
+            ApplicationId=self._sanitize_sar_str_param(application_id),
+            TemplateId=self._sanitize_sar_str_param(template_id),
+        )
+        try:
+            return self._sar_service_call(get_cfn_template, application_id, application_id, template_id)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TooManyRequestsException":
+                raise e
+            LOG.info("Checking template {} of {} was throttled.".format(template_id, application_id))
+            return None
+
     def _handle_get_cfn_template_response(self, response, application_id, template_id):
         """
         Handles the response from the SAR service call
@@ -348,6 +464,10 @@ class ServerlessAppPlugin(BasePlugin):
                 )
                 raise InvalidResourceException(application_id, message)
             self._in_progress_templates.append((application_id, template_id))
+        elif template_id in self._cached_in_progress_templates:
+            # So that the next translations do not wait for the template again
+            cache_key = self._cached_in_progress_templates.pop(template_id)
+            self._template_url_cache.put(*cache_key, template=response)
 
     def _sar_service_call(self, service_call_lambda, logical_id, *args):
         """
@@ -358,6 +478,8 @@ class ServerlessAppPlugin(BasePlugin):
         :param string logical_id: Logical ID of the resource being processed
         :param list *args: arguments for the service call lambda
         """
+        from botocore.exceptions import ClientError
+
         try:
             response = service_call_lambda(*args)
             return response
@@ -365,6 +487,9 @@ class ServerlessAppPlugin(BasePlugin):
             error_code = e.response["Error"]["Code"]
             if error_code in ("AccessDeniedException", "NotFoundException"):
                 raise InvalidResourceException(logical_id, e.response["Error"]["Message"])
+            if error_code == "TooManyRequestsException":
+                # Retried when checking the status of templates, and logged by the caller otherwise
+                raise e
 
             # 'ForbiddenException'- SAR rejects connection
             LOG.exception(e)
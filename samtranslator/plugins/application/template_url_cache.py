@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from samtranslator.utils.files import write_json_atomically
+
+LOG = logging.getLogger(__name__)
+
+
+class TemplateUrlCache(object):
+    """
+    Cache of the templates that the Serverless Application Repository (SAR) created for applications, keyed by
+    ApplicationId, SemanticVersion and region. Sharing one cache between the ServerlessAppPlugin of every translation
+    lets repeated translations of templates with the same applications skip the CreateCloudFormationTemplate calls.
+
+    SAR templates expire 1 hour after they are created, along with their pre-signed TemplateUrl, so entries are only
+    kept for `ttl_seconds`, 30 minutes by default. The least recently used entries are evicted beyond `max_size`
+    entries. The cache can be persisted to a JSON file, read when the cache is created and written by `save()`.
+
+    Access to an application is only checked by SAR when its template is created. Only share a cache between
+    translations made with the same credentials.
+
+    The cache is thread safe. Copies of it, ex: in the worker processes of transform_many, are independent caches.
+    """
+
+    VERSION = 1
+    DEFAULT_TTL_SECONDS = 30 * 60
+    DEFAULT_MAX_SIZE = 1024
+    # Fields of the CreateCloudFormationTemplate response that are cached
+    TEMPLATE_KEYS = ("ApplicationId", "SemanticVersion", "Status", "TemplateId", "TemplateUrl")
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS, max_size=DEFAULT_MAX_SIZE, cache_file=None):
+        """
+        :param int ttl_seconds: Number of seconds a template is cached for. Must be shorter than 1 hour
+        :param int max_size: Maximum number of templates in the cache
+        :param string cache_file: Optional, path of the file to persist the cache to
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        # (ApplicationId, SemanticVersion, region) -> (expiration time, template), least recently used first
+        self._entries = OrderedDict()
+
+        if cache_file:
+            self._load()
+
+    def get(self, application_id, semantic_version, region):
+        """
+        Returns the cached template of an application
+
+        :param string application_id: ApplicationId of the application
+        :param string semantic_version: SemanticVersion of the application
+        :param string region: Region the template was created in
+        :return dict: Cached fields of the CreateCloudFormationTemplate response, None if not cached or expired
+        """
+        key = (application_id, semantic_version, region)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= time.time():
+                return None
+            self._entries[key] = entry
+            return dict(entry[1])
+
+    def put(self, application_id, semantic_version, region, template):
+        """
+        Caches the template of an application. A template that is already cached keeps its expiration time, so that
+        updating its status does not extend the lifetime of its TemplateUrl.
+
+        :param string application_id: ApplicationId of the application
+        :param string semantic_version: SemanticVersion of the application
+        :param string region: Region the template was created in
+        :param dict template: Response of CreateCloudFormationTemplate or GetCloudFormationTemplate
+        """
+        key = (application_id, semantic_version, region)
+        template = {name: template.get(name) for name in self.TEMPLATE_KEYS}
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[1]["TemplateId"] == template["TemplateId"]:
+                expires_at = entry[0]
+            else:
+                expires_at = time.time() + self.ttl_seconds
+            self._entries[key] = (expires_at, template)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all templates from the cache. The cache file, if any, is left untouched until the next `save()`
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def save(self):
+        """
+        Writes the templates that did not expire to the cache file. The file is replaced atomically, so concurrent
+        readers never see a partially written cache.
+        """
+        if not self.cache_file:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = [[list(key), expires_at, template] for key, (expires_at, template) in self._entries.items()]
+        content = {"version": self.VERSION, "entries": [entry for entry in entries if entry[1] > now]}
+
+        try:
+            write_json_atomically(self.cache_file, content)
+        except (IOError, OSError) as e:
+            LOG.warning("Unable to write template url cache %s: %s", self.cache_file, e)
+
+    def __getstate__(self):
+        # Locks cannot be pickled, ex: to send the cache to the worker processes of transform_many
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        :return: Number of templates in the cache, including the ones that expired but were not evicted yet
+        """
+        return len(self._entries)
+
+    def _load(self):
+        """
+        Reads the templates of the cache file. A missing, unreadable or foreign file is ignored
+        """
+        try:
+            with open(self.cache_file, "r") as fp:
+                content = json.load(fp)
+        except (IOError, OSError, ValueError) as e:
+            if os.path.exists(self.cache_file):
+                LOG.warning("Ignoring unreadable template url cache %s: %s", self.cache_file, e)
+            return
+
+        if not isinstance(content, dict) or content.get("version") != self.VERSION:
+            LOG.warning("Ignoring template url cache %s written by another version", self.cache_file)
+            return
+
+        now = time.time()
+        for key, expires_at, template in content.get("entries", [])[-self.max_size :]:
+            if expires_at > now:
+                self._entries[tuple(key)] = (expires_at, template)
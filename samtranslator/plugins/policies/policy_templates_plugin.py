@@ -15,6 +15,7 @@ class PolicyTemplatesForResourcePlugin(BasePlugin):
 
     _plugin_name = ""
     SUPPORTED_RESOURCE_TYPE = {"AWS::Serverless::Function", "AWS::Serverless::StateMachine"}
+    resource_types = SUPPORTED_RESOURCE_TYPE
 
     def __init__(self, policy_template_processor):
         """
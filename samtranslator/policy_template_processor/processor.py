@@ -1,8 +1,8 @@
+import hashlib
 import json
-import jsonschema
 from samtranslator import policy_templates_data
+from samtranslator.policy_templates_data import validated
 
-from jsonschema.exceptions import ValidationError
 from samtranslator.policy_template_processor.template import Template
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
 
@@ -48,15 +48,21 @@ class PolicyTemplatesProcessor(object):
     # ./policy_templates.json
     DEFAULT_POLICY_TEMPLATES_FILE = policy_templates_data.POLICY_TEMPLATES_FILE
 
-    def __init__(self, policy_templates_dict, schema=None):
+    # Processor of the default policy templates, shared by all translations. Created by `get_default()`
+    _default = None
+
+    def __init__(self, policy_templates_dict, schema=None, validate=True):
         """
         Initialize the class
 
         :param policy_templates_dict: Dictionary containing the policy templates definition
         :param dict schema: Dictionary containing the JSON Schema of policy templates
+        :param bool validate: Validate the policy templates against the schema. Only skip it for templates that are
+            known to be valid
         :raises ValueError: If policy templates does not match up with the schema
         """
-        PolicyTemplatesProcessor._is_valid_templates_dict(policy_templates_dict, schema)
+        if validate:
+            PolicyTemplatesProcessor._is_valid_templates_dict(policy_templates_dict, schema)
 
         self.policy_templates = {}
         for template_name, template_value_dict in policy_templates_dict["Templates"].items():
@@ -113,6 +119,9 @@ class PolicyTemplatesProcessor(object):
         if not schema:
             schema = PolicyTemplatesProcessor._read_schema()
 
+        import jsonschema
+        from jsonschema.exceptions import ValidationError
+
         try:
             jsonschema.validate(policy_templates_dict, schema)
         except ValidationError as ex:
@@ -131,6 +140,35 @@ class PolicyTemplatesProcessor(object):
 
         return PolicyTemplatesProcessor._read_json(PolicyTemplatesProcessor.DEFAULT_POLICY_TEMPLATES_FILE)
 
+    @classmethod
+    def get_default(cls):
+        """
+        Returns the processor of the default policy templates. It is created on first use and shared afterwards.
+
+        The default policy templates are validated when the package is built, by bin/validate-policy-templates.py.
+        They are only validated again if they do not match the digest recorded then.
+
+        :return PolicyTemplatesProcessor: Processor of the default policy templates
+        """
+        if cls._default is None:
+            policy_templates = cls.get_default_policy_templates_json()
+            is_validated = cls._digest(policy_templates, cls._read_schema()) == validated.DIGEST
+            cls._default = cls(policy_templates, validate=not is_validated)
+        return cls._default
+
+    @staticmethod
+    def _digest(policy_templates, schema):
+        """
+        Digest of the policy templates and their schema. It is computed from their canonical JSON form, so it does not
+        depend on the formatting of the files, ex: their line endings.
+
+        :param dict policy_templates: Policy templates
+        :param dict schema: JSON Schema of the policy templates
+        :return string: Digest of both documents
+        """
+        content = json.dumps([policy_templates, schema], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     @staticmethod
     def _read_schema():
         """
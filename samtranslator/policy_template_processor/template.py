@@ -1,4 +1,4 @@
-import copy
+from six import string_types
 
 from samtranslator.intrinsics.resolver import IntrinsicsResolver
 from samtranslator.intrinsics.actions import RefAction
@@ -26,6 +26,8 @@ class Template(object):
         self.name = template_name
         self.parameters = parameters
         self.definition = template_definition
+        # Substitution plan of the definition, compiled the first time the template is used
+        self._plan = None
 
     def to_statement(self, parameter_values):
         """
@@ -55,13 +57,10 @@ class Template(object):
             name: value for name, value in parameter_values.items() if name in self.parameters
         }
 
-        # Only "Ref" is supported
-        supported_intrinsics = {RefAction.intrinsic_name: RefAction()}
+        if self._plan is None:
+            self._plan = _compile(self.definition, self.parameters) or _compile_constant(self.definition)
 
-        resolver = IntrinsicsResolver(necessary_parameter_values, supported_intrinsics)
-        definition_copy = copy.deepcopy(self.definition)
-
-        return resolver.resolve_parameter_refs(definition_copy)
+        return self._plan(_ParameterValues(necessary_parameter_values))
 
     def missing_parameter_values(self, parameter_values):
         """
@@ -115,3 +114,78 @@ class Template(object):
         definition = template_values_dict.get("Definition", {})
 
         return Template(template_name, parameters, definition)
+
+
+class _ParameterValues(object):
+    """
+    Values of the parameters of a template, as used by a substitution plan. Values that are dictionaries or lists may
+    themselves contain references to parameters, which are resolved like the rest of the definition.
+    """
+
+    def __init__(self, values):
+        self._values = values
+        self._resolver = None
+
+    def get(self, name):
+        value = self._values[name]
+        if isinstance(value, (dict, list)):
+            # Only "Ref" is supported. The value itself is not resolved again, only its content
+            if self._resolver is None:
+                self._resolver = IntrinsicsResolver(self._values, {RefAction.intrinsic_name: RefAction()})
+            children = value.items() if isinstance(value, dict) else enumerate(value)
+            for key, child in list(children):
+                value[key] = self._resolver.resolve_parameter_refs(child)
+        return value
+
+
+def _compile(definition, parameters):
+    """
+    Compiles a template definition into a substitution plan: a function that builds a new copy of the definition,
+    with every `{"Ref": <parameter>}` replaced by the value of the parameter. Finding the references is done once
+    here, building a statement is then a walk over the parts of the definition that are not constant.
+
+    The result is the same as resolving a deep copy of the definition with an IntrinsicsResolver that supports "Ref".
+
+    :param definition: Template definition, or a part of it
+    :param dict parameters: Parameters of the template
+    :return: Function that takes the `_ParameterValues` and returns the statement. None if the definition does not
+        reference any parameter
+    """
+    if isinstance(definition, dict):
+        if len(definition) == 1:
+            name = definition.get(RefAction.intrinsic_name)
+            if isinstance(name, string_types) and name in parameters:
+                return lambda values: values.get(name)
+
+        items = [(key, _compile(value, parameters)) for key, value in definition.items()]
+        if all(build is None for _, build in items):
+            return None
+        items = [(key, build or _compile_constant(definition[key])) for key, build in items]
+        return lambda values: {key: build(values) for key, build in items}
+
+    if isinstance(definition, list):
+        builds = [_compile(value, parameters) for value in definition]
+        if all(build is None for build in builds):
+            return None
+        builds = [build or _compile_constant(value) for build, value in zip(builds, definition)]
+        return lambda values: [build(values) for build in builds]
+
+    return None
+
+
+def _compile_constant(definition):
+    """
+    :return: Function that returns a new copy of a part of the definition that does not reference any parameter
+    """
+    if isinstance(definition, (dict, list)):
+        return lambda values: _copy(definition)
+    return lambda values: definition
+
+
+def _copy(value):
+    # Definitions are parsed from JSON. Copying only dicts and lists is enough, and much faster than copy.deepcopy
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
@@ -0,0 +1,6 @@
+# Generated by bin/validate-policy-templates.py, do not edit.
+#
+# Digest of the content of policy_templates.json and schema.json, computed after the policy templates were validated
+# against the schema. The default policy templates are not validated again when their content matches this digest.
+
+DIGEST = "3413d516afc4afc7a69951133a703669c1f92f3104610a9e3156d7b2476dcb46"
@@ -6,3 +6,6 @@
 
 from samtranslator.translator.translator import Translator
 from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
+from samtranslator.translator.managed_policy_cache import ManagedPolicyCache
+from samtranslator.translator.translation_cache import TranslationCache
+from samtranslator.plugins.application.template_url_cache import TemplateUrlCache
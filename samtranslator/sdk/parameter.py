@@ -1,4 +1,3 @@
-import boto3
 import copy
 
 from samtranslator.translator.arn_generator import ArnGenerator, NoRegionFound
@@ -63,17 +62,17 @@ class SamParameterValues(object):
     def add_pseudo_parameter_values(self, session=None):
         """
         Add pseudo parameter values
+        :param session: Optional, Boto3 session of the region. If not provided, the region where this code is running
+            is used, see `ArnGenerator.get_region_name`
         :return: parameter values that have pseudo parameter in it
         """
 
-        if session is None:
-            session = boto3.session.Session()
-
-        if not session.region_name:
+        region_name = session.region_name if session is not None else ArnGenerator.get_region_name()
+        if not region_name:
             raise NoRegionFound("AWS Region cannot be found")
 
         if "AWS::Region" not in self.parameter_values:
-            self.parameter_values["AWS::Region"] = session.region_name
+            self.parameter_values["AWS::Region"] = region_name
 
         if "AWS::Partition" not in self.parameter_values:
-            self.parameter_values["AWS::Partition"] = ArnGenerator.get_partition_name(session.region_name)
+            self.parameter_values["AWS::Partition"] = ArnGenerator.get_partition_name(region_name)
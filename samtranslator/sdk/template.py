@@ -1,3 +1,8 @@
+import itertools
+
+from six import viewkeys
+
+from samtranslator.model.exceptions import InvalidDocumentException
 from samtranslator.sdk.resource import SamResource
 
 """
@@ -8,6 +13,11 @@ Classes representing SAM template and resources.
 class SamTemplate(object):
     """
     Class representing the SAM template
+
+    SAM resources are indexed by type on first iteration, so that iterating over the resources of some types only
+    visits those resources. The index is kept up to date by `set` and `delete`, and rebuilt when resources are added
+    to or deleted from the template dictionary directly, or when a resource that is iterated over was modified in
+    place. Changing the Type of a resource in place is only noticed when iterating over its previous type, use `set`.
     """
 
     def __init__(self, template_dict):
@@ -18,6 +28,11 @@ class SamTemplate(object):
         """
         self.template_dict = template_dict
         self.resources = template_dict["Resources"]
+        # Type -> {logicalId -> SamResource} of the valid SAM resources, None until the first iteration
+        self._index = None
+        # logicalId -> position of the resource in the template, to iterate over several types in template order
+        self._positions = {}
+        self._next_positions = itertools.count()
 
     def iterate(self, resource_types=None):
         """
@@ -26,17 +41,15 @@ class SamTemplate(object):
         :param dict resource_types: Optional types to filter the resources by
         :yields (string, SamResource): Tuple containing LogicalId and the resource
         """
-        if resource_types is None:
-            resource_types = {}
-        for logicalId, resource_dict in self.resources.items():
-
-            resource = SamResource(resource_dict)
-            needs_filter = resource.valid()
-            if resource_types:
-                needs_filter = needs_filter and resource.type in resource_types
+        resources = self._list(resource_types)
+        if not all(self._is_current(logicalId, resource) for logicalId, resource in resources):
+            # Resources were modified directly in the template dictionary
+            self._index = None
+            resources = self._list(resource_types)
 
-            if needs_filter:
-                yield logicalId, resource
+        # Resources are listed before they are yielded, the caller may set or delete resources while iterating
+        for logicalId, resource in resources:
+            yield logicalId, resource
 
     def set(self, logicalId, resource):
         """
@@ -50,7 +63,21 @@ class SamTemplate(object):
         if isinstance(resource, SamResource):
             resource_dict = resource.to_dict()
 
+        if self._index is None or not self._is_indexed():
+            self.resources[logicalId] = resource_dict
+            return
+
+        if not isinstance(resource, SamResource):
+            resource = SamResource(resource_dict)
+        self._unindex(logicalId)
         self.resources[logicalId] = resource_dict
+        self._positions.setdefault(logicalId, next(self._next_positions))
+        try:
+            if resource.valid():
+                self._index.setdefault(resource.type, {})[logicalId] = resource
+        except InvalidDocumentException:
+            # Raised by the next iteration, which rebuilds the index, like it was before the index existed
+            self._index = None
 
     def get(self, logicalId):
         """
@@ -73,6 +100,9 @@ class SamTemplate(object):
 
         if logicalId in self.resources:
             del self.resources[logicalId]
+            if self._index is not None:
+                self._unindex(logicalId)
+                self._positions.pop(logicalId, None)
 
     def to_dict(self):
         """
@@ -82,3 +112,60 @@ class SamTemplate(object):
         """
         self.template_dict["Resource"] = self.resources
         return self.template_dict
+
+    def _get_index(self):
+        """
+        Returns the index of the SAM resources by type, building it if the resources were modified directly in the
+        template dictionary since it was built
+
+        :return dict: Type -> {logicalId -> SamResource}
+        """
+        if self._index is not None and self._is_indexed():
+            return self._index
+
+        index = {}
+        self._positions = {}
+        self._next_positions = itertools.count()
+        for logicalId, resource_dict in self.resources.items():
+            self._positions[logicalId] = next(self._next_positions)
+            resource = SamResource(resource_dict)
+            if resource.valid():
+                index.setdefault(resource.type, {})[logicalId] = resource
+        self._index = index
+        return index
+
+    def _list(self, resource_types):
+        """
+        Lists the indexed resources of the given types, or of all types, in template order
+
+        :return list: List of (logicalId, SamResource)
+        """
+        index = self._get_index()
+        types = [resource_type for resource_type in (resource_types or index) if resource_type in index]
+        resources = [item for resource_type in types for item in index[resource_type].items()]
+        resources.sort(key=lambda item: self._positions[item[0]])
+        return resources
+
+    def _is_indexed(self):
+        # Resources added or deleted without `set` or `delete` change the logical ids of the template. Comparing the key
+        # views is done in C, without building SamResource objects
+        return len(self._positions) == len(self.resources) and viewkeys(self._positions) == viewkeys(self.resources)
+
+    def _is_current(self, logicalId, resource):
+        """
+        Checks that an indexed resource still wraps the resource dictionary of the template, and that none of the
+        attributes read from it changed since it was indexed
+        """
+        resource_dict = self.resources.get(logicalId)
+        return (
+            resource.resource_dict is resource_dict
+            and resource_dict.get("Type") == resource.type
+            and resource_dict.get("Properties", resource.properties) is resource.properties
+            and resource_dict.get("Condition") == resource.condition
+            and resource_dict.get("DeletionPolicy") == resource.deletion_policy
+            and resource_dict.get("UpdateReplacePolicy") == resource.update_replace_policy
+        )
+
+    def _unindex(self, logicalId):
+        for resources in self._index.values():
+            resources.pop(logicalId, None)
@@ -1213,6 +1213,17 @@ class SwaggerEditor(object):
         :return dict: Dictionary containing the Swagger document
         """
 
+        return copy.deepcopy(self.document)
+
+    @property
+    def document(self):
+        """
+        Returns the Swagger document owned by this editor, with all changes applied. This is *not* a copy. Any further
+        modification made through this editor is reflected in the returned dictionary.
+
+        :return dict: Dictionary containing the Swagger document
+        """
+
         # Make sure any changes to the paths are reflected back in output
         self._doc["paths"] = self.paths
 
@@ -1223,7 +1234,7 @@ class SwaggerEditor(object):
         if self.definitions:
             self._doc["definitions"] = self.definitions
 
-        return copy.deepcopy(self._doc)
+        return self._doc
 
     @staticmethod
     def is_valid(data):
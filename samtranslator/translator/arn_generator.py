@@ -1,12 +1,24 @@
-import boto3
+import os
+import threading
+from contextlib import contextmanager
 
 
 class NoRegionFound(Exception):
     pass
 
 
+# Environment variables Boto3 resolves the default region from
+_REGION_ENVIRONMENT_VARIABLES = ("AWS_DEFAULT_REGION", "AWS_PROFILE", "AWS_DEFAULT_PROFILE", "AWS_CONFIG_FILE")
+
+
 class ArnGenerator(object):
     BOTO_SESSION_REGION_NAME = None
+    # Partition of each region name seen so far
+    _partitions = {}
+    # Region resolved by Boto3 for each value of the environment variables it is resolved from
+    _region_names = {}
+    # Region of the translation running in the current thread, see `use_region_name`
+    _context = threading.local()
 
     @classmethod
     def generate_arn(cls, partition, service, resource, include_account_id=True):
@@ -47,13 +59,7 @@ class ArnGenerator(object):
         """
 
         if region is None:
-            # Use Boto3 to get the region where code is running. This uses Boto's regular region resolution
-            # mechanism, starting from AWS_DEFAULT_REGION environment variable.
-
-            if ArnGenerator.BOTO_SESSION_REGION_NAME is None:
-                region = boto3.session.Session().region_name
-            else:
-                region = ArnGenerator.BOTO_SESSION_REGION_NAME
+            region = ArnGenerator.get_region_name()
 
         # If region is still None, then we could not find the region. This will only happen
         # in the local context. When this is deployed, we will be able to find the region like
@@ -61,6 +67,55 @@ class ArnGenerator(object):
         if region is None:
             raise NoRegionFound("AWS Region cannot be found")
 
+        partition = ArnGenerator._partitions.get(region)
+        if partition is None:
+            partition = ArnGenerator._partitions[region] = ArnGenerator._get_partition_of_region(region)
+        return partition
+
+    @classmethod
+    def get_region_name(cls):
+        """
+        Gets the name of the region where this code is running: the region of the translation running in the current
+        thread, else BOTO_SESSION_REGION_NAME if it is set, else the region Boto3 resolves, starting from
+        AWS_DEFAULT_REGION environment variable. Creating a Boto3 session reads the AWS config files, so the region
+        Boto3 resolves is memoized for the process, and only resolved again when the environment variables it depends
+        on change.
+
+        :return: Name of the region, None if it cannot be found
+        """
+        region = getattr(ArnGenerator._context, "region_name", None)
+        if region is not None:
+            return region
+
+        if ArnGenerator.BOTO_SESSION_REGION_NAME is not None:
+            return ArnGenerator.BOTO_SESSION_REGION_NAME
+
+        environment = tuple(os.environ.get(name) for name in _REGION_ENVIRONMENT_VARIABLES)
+        if environment not in ArnGenerator._region_names:
+            import boto3
+
+            ArnGenerator._region_names[environment] = boto3.session.Session().region_name
+        return ArnGenerator._region_names[environment]
+
+    @classmethod
+    @contextmanager
+    def use_region_name(cls, region):
+        """
+        Context manager that sets the region used when no region is given to `get_partition_name`, for the duration of
+        a translation, and restores the previous one afterwards. The region only applies to the current thread, so
+        translations for different regions can run concurrently.
+
+        :param region: Name of the region, None to use the region where this code is running
+        """
+        previous = getattr(ArnGenerator._context, "region_name", None)
+        ArnGenerator._context.region_name = region
+        try:
+            yield
+        finally:
+            ArnGenerator._context.region_name = previous
+
+    @staticmethod
+    def _get_partition_of_region(region):
         # setting default partition to aws, this will be overwritten by checking the region below
         partition = "aws"
 
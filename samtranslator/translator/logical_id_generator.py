@@ -3,6 +3,10 @@ import json
 import sys
 from six import string_types
 
+# Encoder of the stable string of data objects. It is the encoder `json.dumps` would create on every call with the
+# same arguments, so it produces exactly the same strings.
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
 
 class LogicalIdGenerator(object):
 
@@ -25,6 +29,8 @@ class LogicalIdGenerator(object):
         self._prefix = prefix
         self.data_str = data_str
         self.data_hash = data_hash
+        # Full SHA1 of data_str, computed on first use. Callers often ask for the logicalId and the full hash
+        self._sha1 = None
 
     def gen(self):
         """
@@ -62,18 +68,19 @@ class LogicalIdGenerator(object):
         if not self.data_str:
             return data_hash
 
-        encoded_data_str = self.data_str
-        if sys.version_info.major == 2:
-            # In Py2, only unicode needs to be encoded.
-            if isinstance(self.data_str, unicode):
+        if self._sha1 is None:
+            encoded_data_str = self.data_str
+            if sys.version_info.major == 2:
+                # In Py2, only unicode needs to be encoded.
+                if isinstance(self.data_str, unicode):
+                    encoded_data_str = self.data_str.encode("utf-8")
+            else:
+                # data_str should always be unicode on python 3
                 encoded_data_str = self.data_str.encode("utf-8")
-        else:
-            # data_str should always be unicode on python 3
-            encoded_data_str = self.data_str.encode("utf-8")
 
-        data_hash = hashlib.sha1(encoded_data_str).hexdigest()
+            self._sha1 = hashlib.sha1(encoded_data_str).hexdigest()
 
-        return data_hash[:length]
+        return self._sha1[:length]
 
     def _stringify(self, data):
         """
@@ -91,4 +98,143 @@ class LogicalIdGenerator(object):
             return data
 
         # Get the most compact dictionary (separators) and sort the keys recursively to get a stable output
-        return json.dumps(data, separators=(",", ":"), sort_keys=True)
+        return _CANONICAL_JSON_ENCODER.encode(data)
+
+
+class StrHasher(object):
+    """
+    Computes the SHA1 of `str()` of a data object, without building that string. `str()` of a large dictionary, like
+    the Swagger of an API, is a string as large as the whole document. This produces exactly the same digest, the one
+    `LogicalIdGenerator` would compute from that string, by hashing the string in chunks as it is produced.
+
+    Only dicts, lists and tuples are streamed. Any other value, including subclasses of these types, is hashed as its
+    `repr()`, exactly like `str()` of a container does.
+    """
+
+    # Size of the chunks of text given to SHA1
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self):
+        self._sha1 = hashlib.sha1()
+        self._pieces = []
+        self._size = 0
+
+    def update(self, string):
+        """
+        Adds a string to the hashed data
+
+        :param string: String to add
+        """
+        self._pieces.append(string)
+        self._size += len(string)
+        if self._size >= self.CHUNK_SIZE:
+            self._flush()
+
+    def update_str(self, data):
+        """
+        Adds `str(data)` to the hashed data
+
+        :param data: Object to add the string representation of
+        """
+        if type(data) not in _STREAMED_TYPES:
+            self.update(str(data))
+            return
+
+        for piece in _str_pieces(data):
+            self.update(piece)
+
+    def hexdigest(self):
+        """
+        :return: SHA1 of all the data added so far, in hexadecimal
+        """
+        self._flush()
+        return self._sha1.hexdigest()
+
+    def _flush(self):
+        chunk = "".join(self._pieces)
+        if sys.version_info.major > 2 or isinstance(chunk, unicode):
+            chunk = chunk.encode("utf-8")
+        self._sha1.update(chunk)
+        self._pieces = []
+        self._size = 0
+
+
+_STREAMED_TYPES = (dict, list, tuple)
+# Containers with at most this many values in total are written with repr() instead of being streamed
+_SMALL_CONTAINER_SIZE = 1024
+_NOTHING = object()
+
+
+def _is_small(data, containers):
+    """
+    Returns True if the given container holds at most `_SMALL_CONTAINER_SIZE` values in total, and does not contain
+    any of the given containers
+    """
+    size = 0
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if id(value) in containers:
+            return False
+        size += len(value)
+        if size > _SMALL_CONTAINER_SIZE:
+            return False
+        stack.extend(
+            item for item in (value.values() if type(value) is dict else value) if type(item) in _STREAMED_TYPES
+        )
+    return True
+
+
+def _str_pieces(data):
+    """
+    Yields the pieces of `str(data)` in order, for a dict, list or tuple. Containers are iterated lazily, so memory
+    use does not grow with the number of values they hold.
+    """
+    # Containers being written. Like `repr()`, a container that contains itself is written as {...}, [...] or (...)
+    containers = set()
+    # Containers being written, as [values iterator, closing text, id, is a dict, is the first value]
+    stack = []
+    value = data
+    while True:
+        if value is not _NOTHING:
+            value_type = type(value)
+            if value_type not in _STREAMED_TYPES:
+                yield repr(value)
+            elif id(value) in containers:
+                yield {dict: "{...}", list: "[...]", tuple: "(...)"}[value_type]
+            elif value is not data and _is_small(value, containers):
+                # Small containers, ex: an operation of a path, are much faster to write with a single repr() call
+                yield repr(value)
+            else:
+                containers.add(id(value))
+                if value_type is dict:
+                    yield "{"
+                    stack.append([iter(value.items()), "}", id(value), True, True])
+                elif value_type is list:
+                    yield "["
+                    stack.append([iter(value), "]", id(value), False, True])
+                else:
+                    yield "("
+                    stack.append([iter(value), ",)" if len(value) == 1 else ")", id(value), False, True])
+
+        if not stack:
+            return
+
+        frame = stack[-1]
+        item = next(frame[0], _NOTHING)
+        if item is _NOTHING:
+            stack.pop()
+            containers.discard(frame[2])
+            yield frame[1]
+            value = _NOTHING
+            continue
+
+        if frame[4]:
+            frame[4] = False
+        else:
+            yield ", "
+        if frame[3]:
+            yield repr(item[0]) + ": "
+            value = item[1]
+        else:
+            value = item
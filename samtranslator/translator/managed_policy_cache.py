@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import time
+
+from samtranslator.utils.files import write_json_atomically
+
+LOG = logging.getLogger(__name__)
+
+
+class ManagedPolicyCache(object):
+    """
+    On-disk cache of the map of AWS managed policy names to ARNs, for one partition. Loading this map from IAM takes
+    many paginated calls, the cache lets a new process start translating without any of them.
+
+    The cache is a JSON file named after the partition, so caches of different partitions can share a directory.
+    Entries older than the TTL are still returned, but reported as stale so that the caller can refresh them.
+    A snapshot file, ex: one bundled with an application, can be provided to be used when there is no cache file yet.
+    """
+
+    VERSION = 1
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, cache_dir, partition, ttl_seconds=DEFAULT_TTL_SECONDS, snapshot_file=None):
+        """
+        :param string cache_dir: Directory to store the cache file in. It is created if it does not exist
+        :param string partition: Partition the policies belong to, ex: aws, aws-cn
+        :param int ttl_seconds: Age after which a cached policy map is stale
+        :param string snapshot_file: Optional, cache file to fall back to when there is no cache file in `cache_dir`
+        """
+        self.partition = partition
+        self.ttl_seconds = ttl_seconds
+        self.snapshot_file = snapshot_file
+        self.cache_file = os.path.join(cache_dir, "managed-policies-{}.json".format(partition))
+
+    def load(self):
+        """
+        Reads the cached policy map, or the snapshot if there is no cache yet
+
+        :return: Tuple of the policy map and whether it is still fresh. (None, False) if nothing is cached
+        """
+        for path in (self.cache_file, self.snapshot_file):
+            if not path:
+                continue
+
+            entry = self._read(path)
+            if entry is not None:
+                is_fresh = time.time() - entry["created_at"] < self.ttl_seconds
+                return entry["policies"], is_fresh
+
+        return None, False
+
+    def save(self, policy_map):
+        """
+        Writes the policy map to the cache file. The file is replaced atomically, so concurrent readers never see a
+        partially written cache.
+
+        :param dict policy_map: Map of managed policy names to their ARNs
+        """
+        entry = {
+            "version": self.VERSION,
+            "partition": self.partition,
+            "created_at": time.time(),
+            "policies": policy_map,
+        }
+
+        try:
+            write_json_atomically(self.cache_file, entry)
+        except (IOError, OSError) as e:
+            LOG.warning("Unable to write managed policy cache %s: %s", self.cache_file, e)
+
+    def invalidate(self):
+        """
+        Deletes the cache file. The snapshot, if any, is left untouched
+        """
+        if os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
+
+    def _read(self, path):
+        """
+        Reads a cache file of this partition. Missing, unreadable or foreign files are ignored
+
+        :param string path: Path of the cache file
+        :return dict: Cache entry, or None if the file cannot be used
+        """
+        try:
+            with open(path, "r") as fp:
+                entry = json.load(fp)
+        except (IOError, OSError, ValueError) as e:
+            if os.path.exists(path):
+                LOG.warning("Ignoring unreadable managed policy cache %s: %s", path, e)
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != self.VERSION
+            or entry.get("partition") != self.partition
+            or not isinstance(entry.get("policies"), dict)
+            or not isinstance(entry.get("created_at"), (int, float))
+        ):
+            LOG.warning("Ignoring managed policy cache %s written for another version or partition", path)
+            return None
+
+        return entry
@@ -1,30 +1,90 @@
 import logging
+import threading
 
 LOG = logging.getLogger(__name__)
 
 
 class ManagedPolicyLoader(object):
-    def __init__(self, iam_client):
+    def __init__(self, iam_client, cache=None, background_refresh=False):
+        """
+        :param iam_client: boto3 IAM client used to list the AWS managed policies
+        :param ManagedPolicyCache cache: Optional, on-disk cache of the policy map. When it holds a fresh policy map,
+            policies are not loaded from IAM at all
+        :param bool background_refresh: When the cached policy map is stale, return it right away and refresh the
+            cache from IAM in a background thread, instead of waiting for IAM
+        """
         self._iam_client = iam_client
+        self._cache = cache
+        self._background_refresh = background_refresh
+        self._refresh_thread = None
         self._policy_map = None
         self.max_items = 1000
 
     def load(self):
         if self._policy_map is None:
-            LOG.info("Loading policies from IAM...")
-
-            paginator = self._iam_client.get_paginator("list_policies")
-            # Setting the scope to AWS limits the returned values to only AWS Managed Policies and will
-            # not returned policies owned by any specific account.
-            # http://docs.aws.amazon.com/IAM/latest/APIReference/API_ListPolicies.html#API_ListPolicies_RequestParameters
-            # Note(jfuss): boto3 PaginationConfig MaxItems does not control the number of items returned from the API
-            # call. This is actually controlled by PageSize.
-            page_iterator = paginator.paginate(Scope="AWS", PaginationConfig={"PageSize": self.max_items})
-            name_to_arn_map = {}
-
-            for page in page_iterator:
-                name_to_arn_map.update(map(lambda x: (x["PolicyName"], x["Arn"]), page["Policies"]))
-
-            LOG.info("Finished loading policies from IAM.")
-            self._policy_map = name_to_arn_map
+            cached_policy_map, is_fresh = self._cache.load() if self._cache else (None, False)
+
+            if cached_policy_map is not None and is_fresh:
+                LOG.info("Loaded policies from cache %s.", self._cache.cache_file)
+                self._policy_map = cached_policy_map
+            elif cached_policy_map is not None and self._background_refresh:
+                LOG.info(
+                    "Loaded stale policies from cache %s, refreshing them in the background.", self._cache.cache_file
+                )
+                self._policy_map = cached_policy_map
+                self._refresh_thread = threading.Thread(target=self._refresh_in_background)
+                self._refresh_thread.daemon = True
+                self._refresh_thread.start()
+            else:
+                self._refresh()
         return self._policy_map
+
+    def invalidate(self):
+        """
+        Forgets the loaded policy map and deletes the cache, so the next call to `load()` lists policies from IAM
+        """
+        self._policy_map = None
+        if self._cache:
+            self._cache.invalidate()
+
+    def wait_for_refresh(self, timeout=None):
+        """
+        Waits for the background refresh started by `load()`, if any, to finish. The refresh thread does not keep the
+        process alive, so short-lived processes must call this before exiting to get their cache refreshed.
+
+        :param float timeout: Optional, maximum number of seconds to wait
+        """
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout)
+
+    def _refresh(self):
+        policy_map = self._load_from_iam()
+        if self._cache:
+            self._cache.save(policy_map)
+        self._policy_map = policy_map
+
+    def _refresh_in_background(self):
+        try:
+            self._refresh()
+        except Exception:
+            # The stale policy map is already in use, so a failure to refresh it must not surface anywhere. It is only
+            # logged, and the next process will try again.
+            LOG.warning("Unable to refresh managed policies from IAM.", exc_info=True)
+
+    def _load_from_iam(self):
+        LOG.info("Loading policies from IAM...")
+
+        paginator = self._iam_client.get_paginator("list_policies")
+        # Setting the scope to AWS limits the returned values to only AWS Managed Policies and will
+        # not returned policies owned by any specific account.
+        # http://docs.aws.amazon.com/IAM/latest/APIReference/API_ListPolicies.html#API_ListPolicies_RequestParameters
+        # Note(jfuss): boto3 PaginationConfig MaxItems does not control the number of items returned from the API
+        # call. This is actually controlled by PageSize.
+        page_iterator = paginator.paginate(Scope="AWS", PaginationConfig={"PageSize": self.max_items})
+        name_to_arn_map = {}
+
+        for page in page_iterator:
+            name_to_arn_map.update(map(lambda x: (x["PolicyName"], x["Arn"]), page["Policies"]))
+
+        LOG.info("Finished loading policies from IAM.")
+        return name_to_arn_map
@@ -1,16 +1,99 @@
-from samtranslator.translator.translator import Translator
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.translator.translator import Translator, make_default_policy_templates_processor
 from samtranslator.parser.parser import Parser
 
+# Translator of the current worker process of `transform_many`, created once by `_initialize_worker`
+_worker_translator = None
+_worker_feature_toggle = None
 
-def transform(input_fragment, parameter_values, managed_policy_loader, feature_toggle=None):
+
+def transform(input_fragment, parameter_values, managed_policy_loader, feature_toggle=None, template_url_cache=None):
     """Translates the SAM manifest provided in the and returns the translation to CloudFormation.
 
     :param dict input_fragment: the SAM template to transform
     :param dict parameter_values: Parameter values provided by the user
+    :param TemplateUrlCache template_url_cache: Optional, cache of the templates created by the Serverless Application
+        Repository, to share between the calls to `transform`
     :returns: the transformed CloudFormation template
     :rtype: dict
     """
 
     sam_parser = Parser()
-    translator = Translator(managed_policy_loader.load(), sam_parser)
+    translator = Translator(managed_policy_loader.load(), sam_parser, template_url_cache=template_url_cache)
     return translator.translate(input_fragment, parameter_values=parameter_values, feature_toggle=feature_toggle)
+
+
+def transform_many(
+    input_fragments,
+    parameter_values,
+    managed_policy_loader,
+    feature_toggle=None,
+    processes=None,
+    template_url_cache=None,
+):
+    """Translates many SAM manifests to CloudFormation in parallel, over a pool of worker processes.
+
+    The managed policy map is loaded once and, like the default policy templates, sent once to each worker, which
+    reuses a single Translator for all the templates it is given. Results are yielded as soon as each template is
+    translated, in completion order. A template that is invalid does not stop the others from being translated: its
+    `InvalidDocumentException` is yielded as its result instead.
+
+    :param iterable input_fragments: the SAM templates to transform
+    :param dict parameter_values: Parameter values provided by the user, used for every template
+    :param managed_policy_loader: Loader of the managed policy map, called once for all templates
+    :param FeatureToggle feature_toggle: Optional, feature toggle used for every template
+    :param int processes: Optional, number of worker processes. Defaults to the number of CPUs
+    :param TemplateUrlCache template_url_cache: Optional, cache of the templates created by the Serverless Application
+        Repository. Each worker starts from a copy of it, shared by all the templates it translates
+    :returns: generator of `(index, result)` tuples, where `index` is the position of the template in
+        `input_fragments` and `result` is either the transformed CloudFormation template or the
+        `InvalidDocumentException` raised while transforming it
+    """
+
+    initargs = (
+        managed_policy_loader.load(),
+        make_default_policy_templates_processor(),
+        feature_toggle,
+        template_url_cache,
+    )
+    tasks = ((index, input_fragment, parameter_values) for index, input_fragment in enumerate(input_fragments))
+
+    from multiprocessing import Pool
+
+    pool = Pool(processes, _initialize_worker, initargs)
+    try:
+        for result in pool.imap_unordered(_transform_in_worker, tasks):
+            yield result
+        pool.close()
+    finally:
+        # Stops the workers right away if the caller did not consume all results, or a template raised an exception
+        # other than InvalidDocumentException
+        pool.terminate()
+        pool.join()
+
+
+def _initialize_worker(managed_policy_map, policy_templates_processor, feature_toggle, template_url_cache):
+    global _worker_translator, _worker_feature_toggle
+
+    _worker_translator = Translator(
+        managed_policy_map,
+        Parser(),
+        policy_templates_processor=policy_templates_processor,
+        template_url_cache=template_url_cache,
+    )
+    _worker_feature_toggle = feature_toggle
+
+
+def _transform_in_worker(task):
+    index, input_fragment, parameter_values = task
+    try:
+        # The template was copied into this process, so the translator does not need another copy of it
+        output_fragment = _worker_translator.translate(
+            input_fragment,
+            parameter_values=parameter_values,
+            feature_toggle=_worker_feature_toggle,
+            copy_template=False,
+        )
+    except InvalidDocumentException as e:
+        return index, e
+    return index, output_fragment
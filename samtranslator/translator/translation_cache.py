@@ -0,0 +1,348 @@
+import copy
+import hashlib
+import json
+import logging
+import re
+
+from six import string_types
+
+from samtranslator import __version__
+from samtranslator.model.naming import GeneratedLogicalId
+from samtranslator.translator.verify_logical_id import is_unique_logical_id
+from samtranslator.utils.files import write_json_atomically
+
+LOG = logging.getLogger(__name__)
+
+# Properties of events whose target resource is modified by the event, through `resources_to_link`: an Api event adds
+# its path to the DefinitionBody of its API, an S3 event adds its notification to the bucket, etc.
+_LINKED_EVENT_PROPERTIES = ("RestApiId", "ApiId", "Bucket", "UserPool")
+_IMPLICIT_APIS = {"Api": GeneratedLogicalId.implicit_api(), "HttpApi": GeneratedLogicalId.implicit_http_api()}
+# Serverless::Api resources with a usage plan may share it. Prefixed so that it cannot be mistaken for a logical id.
+_SHARED_USAGE_PLAN_KEY = "::SharedApiUsagePlan"
+_SUB_VARIABLE_PATTERN = re.compile(r"\$\{([^!}][^}]*)\}")
+# Resources whose translation depends on more than their inputs, so they are always translated again. The
+# ServerlessAppPlugin sets the TemplateUrl of applications to a pre-signed URL of the Serverless Application
+# Repository, which expires.
+_UNCACHEABLE_RESOURCE_TYPES = ("AWS::Serverless::Application",)
+
+
+class TranslationCache(object):
+    """
+    Memoizes the CloudFormation resources generated for each SAM resource, so that translating a new revision of a
+    template only runs `to_cloudformation` for the SAM resources that changed since the previous translation.
+
+    Each SAM resource is fingerprinted after the template was parsed, ie. with Globals merged, along with the values
+    of the parameters and mappings it references. Translating a resource may modify another one though, ex: an Api
+    event adds its path to the Swagger of the API it refers to. Resources linked this way are grouped, and a group is
+    reused only when none of its members changed, and translated again as a whole otherwise. Groups are formed by:
+
+        * the API, S3 bucket or Cognito user pool an event refers to, and the resource of the event
+        * the shared usage plan of Serverless::Api resources
+
+    Other effects of a translation on the template are recorded with the generated resources and replayed when they
+    are reused: resource references, the logical id of resources that change it, the Conditions that are added to the
+    template, and deployment preferences.
+
+    The cache only keeps the groups of the last translated template. Plugins are expected to produce the same output
+    for the same input, as their `before_transform_resource` hook is not run for reused resources. Serverless
+    applications are never reused, their TemplateUrl is a pre-signed URL that expires.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        # Group fingerprint -> {logical id -> entry recorded when translating the member}
+        self._groups = {}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a cache previously written with `save()`. A cache written by another version of SAM is ignored, because
+        its resources may not be the ones this version would generate.
+
+        :param string path: Path of the cache file
+        :return TranslationCache: The cache read from the file, or an empty cache if it cannot be used
+        """
+        cache = cls()
+        try:
+            with open(path, "r") as fp:
+                data = json.load(fp)
+        except (IOError, OSError, ValueError) as e:
+            LOG.info("Ignoring translation cache %s: %s", path, e)
+            return cache
+
+        if isinstance(data, dict) and data.get("version") == cls.VERSION and data.get("samtranslator") == __version__:
+            cache._groups = data["groups"]
+        else:
+            LOG.info("Ignoring translation cache %s written by another version", path)
+        return cache
+
+    def save(self, path):
+        """
+        Writes the cache to a file, to be read with `load()` by the next translation. The file is replaced atomically,
+        so concurrent readers never see a partially written cache.
+
+        :param string path: Path of the cache file
+        :raises IOError, OSError: if the file cannot be written. The previous cache file, if any, is left untouched
+        """
+        write_json_atomically(path, {"version": self.VERSION, "samtranslator": __version__, "groups": self._groups})
+
+    def __len__(self):
+        """
+        :return: Number of SAM resources in the cache
+        """
+        return sum(len(members) for members in self._groups.values())
+
+    def begin(self, sam_template, resources, parameter_values, context, conditions, deployment_preference_collection):
+        """
+        Starts the incremental translation of a template, by grouping and fingerprinting the SAM resources to
+        translate.
+
+        :param dict sam_template: Parsed SAM template
+        :param list resources: List of (logical id, resource dict) of the SAM resources to translate
+        :param dict parameter_values: Values of the template and pseudo parameters
+        :param context: JSON serializable value of everything else the translation depends on, ex: feature toggles
+        :param dict conditions: Conditions section of the output template, which translated resources may add to
+        :param DeploymentPreferenceCollection deployment_preference_collection: Collection of this translation
+        :return IncrementalTranslation: State of the translation
+        """
+        context = _fingerprint(context)
+        template_resources = sam_template["Resources"]
+        mappings = sam_template.get("Mappings")
+        groups = _UnionFind()
+        fingerprints = {}
+        for logical_id, resource_dict in resources:
+            if resource_dict.get("Type") in _UNCACHEABLE_RESOURCE_TYPES:
+                continue
+            groups.add(logical_id)
+            for key in _linked_keys(resource_dict):
+                groups.union(logical_id, key)
+            fingerprints[logical_id] = _fingerprint(_resource_inputs(resource_dict, parameter_values, mappings))
+
+        group_keys = {}
+        for root, keys in groups.groups().items():
+            members = sorted((key, fingerprints[key]) for key in keys if key in fingerprints)
+            # Resources that are not translated but modified by the members, ex: S3 buckets, are inputs of the group
+            linked = sorted((key, template_resources.get(key)) for key in keys if key not in fingerprints)
+            group_key = _fingerprint([context, members, linked])
+            for logical_id, _ in members:
+                group_keys[logical_id] = group_key
+
+        return IncrementalTranslation(self, group_keys, conditions, deployment_preference_collection)
+
+
+class IncrementalTranslation(object):
+    """
+    Decides which SAM resources of a template are reused from a TranslationCache, replays their effects and records
+    the translation of the others. Created by `TranslationCache.begin()`.
+    """
+
+    def __init__(self, cache, group_keys, conditions, deployment_preference_collection):
+        self._cache = cache
+        self._group_keys = group_keys
+        self._conditions = conditions
+        self._deployment_preference_collection = deployment_preference_collection
+        self._recorded = {}
+        self._failed_groups = set()
+
+    def reuse(self, logical_id, existing_resources, supported_resource_refs):
+        """
+        Returns the cached translation of the given SAM resource if its group did not change, after replaying its
+        effects on the template.
+
+        :param string logical_id: Logical id of the SAM resource
+        :param dict existing_resources: Resources of the input template, to verify generated logical ids against
+        :param SupportedResourceReferences supported_resource_refs: References to add the references of the resource to
+        :return: Tuple of the new logical id of the resource, the dict of generated resources, and the logical ids
+            that collide with existing resources. None if the resource must be translated
+        """
+        if logical_id not in self._group_keys:
+            return None
+
+        entry = self._cache._groups.get(self._group_keys[logical_id], {}).get(logical_id)
+        if entry is None:
+            return None
+
+        for property_name, value in entry["references"].items():
+            supported_resource_refs.add(entry["logical_id"], property_name, value)
+        if entry["deployment_preference"] is not None:
+            self._deployment_preference_collection.add(logical_id, copy.deepcopy(entry["deployment_preference"]))
+        if self._conditions is not None:
+            self._conditions.update(copy.deepcopy(entry["conditions"]))
+            for name in entry["removed_conditions"]:
+                self._conditions.pop(name, None)
+
+        generated = {}
+        duplicates = []
+        for generated_id, resource in copy.deepcopy(entry["resources"]):
+            if is_unique_logical_id(generated_id, resource.get("Type"), existing_resources):
+                generated[generated_id] = resource
+            else:
+                duplicates.append((generated_id, resource.get("Type")))
+        return entry["logical_id"], generated, duplicates
+
+    def snapshot(self):
+        """
+        Captures the state of the template that translating a resource may change. To be called right before it.
+
+        :return: Value to pass to `record()`
+        """
+        return dict(self._conditions) if self._conditions is not None else None
+
+    def record(self, logical_id, macro, resources, supported_resource_refs, snapshot):
+        """
+        Records the successful translation of a SAM resource
+
+        :param string logical_id: Logical id of the SAM resource in the input template
+        :param macro: SAM resource that was translated
+        :param list resources: Dicts of the generated resources, `{logical_id: resource}`, before they are resolved
+        :param SupportedResourceReferences supported_resource_refs: References that include those of the resource
+        :param snapshot: Value returned by `snapshot()` before the resource was translated
+        """
+        if logical_id not in self._group_keys:
+            return
+
+        deployment_preference = None
+        if self._deployment_preference_collection.get(logical_id) is not None:
+            deployment_preference = getattr(macro, "DeploymentPreference", None)
+
+        conditions = {}
+        removed_conditions = []
+        if snapshot is not None:
+            conditions = {name: value for name, value in self._conditions.items() if snapshot.get(name) is not value}
+            removed_conditions = [name for name in snapshot if name not in self._conditions]
+
+        self._recorded.setdefault(self._group_keys[logical_id], {})[logical_id] = {
+            "logical_id": macro.logical_id,
+            "resources": copy.deepcopy([item for resource in resources for item in resource.items()]),
+            "references": dict(supported_resource_refs.get_all(macro.logical_id) or {}),
+            "conditions": copy.deepcopy(conditions),
+            "removed_conditions": removed_conditions,
+            "deployment_preference": copy.deepcopy(deployment_preference),
+        }
+
+    def discard(self, logical_id):
+        """
+        Marks the translation of a SAM resource as failed. Its group is not cached, so it is translated again next time
+
+        :param string logical_id: Logical id of the SAM resource
+        """
+        if logical_id in self._group_keys:
+            self._failed_groups.add(self._group_keys[logical_id])
+
+    def commit(self):
+        """
+        Replaces the content of the cache with the groups of this translation, reused or fully translated
+        """
+        members = {}
+        for logical_id, group_key in self._group_keys.items():
+            members.setdefault(group_key, set()).add(logical_id)
+
+        groups = {}
+        for group_key, logical_ids in members.items():
+            if group_key in self._failed_groups:
+                continue
+            if group_key in self._recorded and set(self._recorded[group_key]) == logical_ids:
+                groups[group_key] = self._recorded[group_key]
+            elif group_key in self._cache._groups:
+                groups[group_key] = self._cache._groups[group_key]
+        self._cache._groups = groups
+
+
+class _UnionFind(object):
+    def __init__(self):
+        self._parents = {}
+
+    def add(self, key):
+        self._parents.setdefault(key, key)
+
+    def find(self, key):
+        self.add(key)
+        root = key
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[key] != root:
+            self._parents[key], key = root, self._parents[key]
+        return root
+
+    def union(self, key, other):
+        self._parents[self.find(other)] = self.find(key)
+
+    def groups(self):
+        groups = {}
+        for key in self._parents:
+            groups.setdefault(self.find(key), []).append(key)
+        return groups
+
+
+def _linked_keys(resource_dict):
+    """
+    Returns the keys of the shared state a SAM resource modifies when it is translated: logical ids of the resources
+    its events refer to, and the shared usage plan.
+    """
+    properties = resource_dict.get("Properties")
+    if not isinstance(properties, dict):
+        return []
+
+    keys = []
+    events = properties.get("Events")
+    if isinstance(events, dict):
+        for event in events.values():
+            event_properties = event.get("Properties") if isinstance(event, dict) else None
+            if not isinstance(event_properties, dict):
+                continue
+            for property_name in _LINKED_EVENT_PROPERTIES:
+                target = event_properties.get(property_name)
+                if isinstance(target, dict) and isinstance(target.get("Ref"), string_types):
+                    keys.append(target["Ref"])
+                elif isinstance(target, string_types):
+                    keys.append(target)
+            if event.get("Type") in _IMPLICIT_APIS:
+                keys.append(_IMPLICIT_APIS[event["Type"]])
+
+    auth = properties.get("Auth")
+    if resource_dict.get("Type") == "AWS::Serverless::Api" and isinstance(auth, dict) and auth.get("UsagePlan"):
+        keys.append(_SHARED_USAGE_PLAN_KEY)
+    return keys
+
+
+def _resource_inputs(resource_dict, parameter_values, mappings):
+    """
+    Returns the resource along with the values of the parameters and mappings it references
+    """
+    parameter_names = set()
+    mapping_names = set()
+    all_mappings = False
+
+    stack = [resource_dict]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if len(node) == 1:
+                key, value = next(iter(node.items()))
+                if key == "Ref" and isinstance(value, string_types):
+                    parameter_names.add(value)
+                elif key == "Fn::Sub":
+                    template = value[0] if isinstance(value, list) and value else value
+                    if isinstance(template, string_types):
+                        parameter_names.update(_SUB_VARIABLE_PATTERN.findall(template))
+                elif key == "Fn::FindInMap":
+                    if isinstance(value, list) and value and isinstance(value[0], string_types):
+                        mapping_names.add(value[0])
+                    else:
+                        all_mappings = True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+    parameters = sorted((name, parameter_values[name]) for name in parameter_names if name in parameter_values)
+    if all_mappings or not isinstance(mappings, dict):
+        referenced_mappings = mappings
+    else:
+        referenced_mappings = sorted((name, mappings.get(name)) for name in mapping_names)
+    return [resource_dict, parameters, referenced_mappings]
+
+
+def _fingerprint(value):
+    # Keys are not sorted: the order of properties is kept in the output, so it is part of the input
+    return hashlib.sha1(json.dumps(value, default=repr).encode("utf-8")).hexdigest()
@@ -1,5 +1,5 @@
 import copy
-from samtranslator.metrics.metrics import DummyMetricsPublisher, Metrics
+from samtranslator.metrics.metrics import DummyMetricsPublisher, LatencyTimer, Metrics
 
 from samtranslator.feature_toggle.feature_toggle import (
     FeatureToggle,
@@ -7,6 +7,7 @@ from samtranslator.feature_toggle.feature_toggle import (
 )
 from samtranslator.model import ResourceTypeResolver, sam_resources
 from samtranslator.model.api.api_generator import SharedApiUsagePlan
+from samtranslator.model.api.api_editor_session import ApiEditorSession
 from samtranslator.translator.verify_logical_id import verify_unique_logical_id
 from samtranslator.model.preferences.deployment_preference_collection import DeploymentPreferenceCollection
 from samtranslator.model.exceptions import (
@@ -30,14 +31,41 @@ from samtranslator.translator.arn_generator import ArnGenerator
 
 
 class Translator:
-    """Translates SAM templates into CloudFormation templates"""
+    """Translates SAM templates into CloudFormation templates
 
-    def __init__(self, managed_policy_map, sam_parser, plugins=None, boto_session=None, metrics=None):
+    A single instance can be reused to translate many templates. Artifacts that do not depend on the input template,
+    like the resource type resolver and the default policy templates, are built on first use and shared by every
+    subsequent call to :func:`translate`. Plugin instances hold per-template state and are always created fresh.
+    Instances are not thread-safe; use one Translator per thread.
+    """
+
+    def __init__(
+        self,
+        managed_policy_map,
+        sam_parser,
+        plugins=None,
+        boto_session=None,
+        metrics=None,
+        policy_templates_processor=None,
+        translation_cache=None,
+        template_url_cache=None,
+    ):
         """
         :param dict managed_policy_map: Map of managed policy names to the ARNs
         :param sam_parser: Instance of a SAM Parser
         :param list of samtranslator.plugins.BasePlugin plugins: List of plugins to be installed in the translator,
             in addition to the default ones.
+        :param samtranslator.metrics.metrics.Metrics metrics: Optional, metrics to record to. When provided, the
+            latency of each phase of the translation is recorded, with the resource type or plugin name as dimension
+        :param samtranslator.policy_template_processor.processor.PolicyTemplatesProcessor policy_templates_processor:
+            Optional, already constructed processor of the policy templates. If not provided, one is created from the
+            default policy templates on first use
+        :param samtranslator.translator.translation_cache.TranslationCache translation_cache: Optional, cache of the
+            resources generated by previous translations. When provided, translations are incremental: SAM resources
+            that did not change since the previous translation are not translated again
+        :param samtranslator.plugins.application.template_url_cache.TemplateUrlCache template_url_cache: Optional,
+            cache of the templates created by the Serverless Application Repository for the applications of the
+            template, shared by all translations of this Translator
         """
         self.managed_policy_map = managed_policy_map
         self.plugins = plugins
@@ -45,6 +73,13 @@ class Translator:
         self.feature_toggle = None
         self.boto_session = boto_session
         self.metrics = metrics if metrics else Metrics("ServerlessTransform", DummyMetricsPublisher())
+        # Phases are only timed for callers that provided metrics. Nobody publishes the default metrics, recording
+        # latencies to them would only grow their cache.
+        self._latency_metrics = metrics if metrics else None
+        self._macro_resolver = None
+        self._policy_templates_processor = policy_templates_processor
+        self.translation_cache = translation_cache
+        self.template_url_cache = template_url_cache
 
         if self.boto_session:
             ArnGenerator.BOTO_SESSION_REGION_NAME = self.boto_session.region_name
@@ -69,9 +104,9 @@ class Translator:
                         else:
                             api_name = item.get("Properties").get("RestApiId")
                         if api_name:
-                            resource_dict_copy = copy.deepcopy(resource_dict)
+                            # Resolution modifies its input, so copy only the value being resolved
                             function_name = intrinsics_resolver.resolve_parameter_refs(
-                                resource_dict_copy.get("Properties").get("FunctionName")
+                                copy.deepcopy(resource_dict.get("Properties").get("FunctionName"))
                             )
                             if function_name:
                                 self.function_names[api_name] = str(self.function_names.get(api_name, "")) + str(
@@ -79,7 +114,7 @@ class Translator:
                                 )
         return self.function_names
 
-    def translate(self, sam_template, parameter_values, feature_toggle=None):
+    def translate(self, sam_template, parameter_values, feature_toggle=None, copy_template=True):
         """Loads the SAM resources from the given SAM manifest, replaces them with their corresponding
         CloudFormation resources, and returns the resulting CloudFormation template.
 
@@ -90,10 +125,24 @@ class Translator:
                 that some functionality that relies on resolving parameter references might not work as expected
                 (ex: auto-creating new Lambda Version when CodeUri contains reference to template parameter). This is
                 why this parameter is required
+        :param bool copy_template: Output is built from a copy of `sam_template`, so the input is never aliased by the
+                output. Set this to False if the input is no longer needed after translation: parts of the input that
+                are passed through unchanged (ex: non-SAM resources, Outputs) are then shared with the output instead
+                of being copied, and may be modified in place by the translator.
 
         :returns: a copy of the template with SAM resources replaced with the corresponding CloudFormation, which may \
                 be dumped into a valid CloudFormation JSON or YAML template
         """
+        # The region is resolved once, resources look up their partition for every ARN they generate
+        region_name = self.boto_session.region_name if self.boto_session else ArnGenerator.get_region_name()
+        with ArnGenerator.use_region_name(region_name):
+            return self._translate(sam_template, parameter_values, feature_toggle, copy_template)
+
+    def _translate(self, sam_template, parameter_values, feature_toggle, copy_template):
+        """
+        Translates the template, see `translate`. The region where SAM runs is set on ArnGenerator for the current
+        thread.
+        """
         self.feature_toggle = (
             feature_toggle
             if feature_toggle
@@ -106,12 +155,18 @@ class Translator:
         sam_parameter_values.add_pseudo_parameter_values(self.boto_session)
         parameter_values = sam_parameter_values.parameter_values
         # Create & Install plugins
-        sam_plugins = prepare_plugins(self.plugins, parameter_values)
+        sam_plugins = prepare_plugins(
+            self.plugins,
+            parameter_values,
+            policy_templates_processor=self._get_policy_templates_processor(),
+            metrics=self._latency_metrics,
+            template_url_cache=self.template_url_cache,
+        )
 
         self.sam_parser.parse(sam_template=sam_template, parameter_values=parameter_values, sam_plugins=sam_plugins)
 
-        template = copy.deepcopy(sam_template)
-        macro_resolver = ResourceTypeResolver(sam_resources)
+        macro_resolver = self._get_macro_resolver()
+        template = self._prepare_output_template(sam_template, macro_resolver, copy_template)
         intrinsics_resolver = IntrinsicsResolver(parameter_values)
         mappings_resolver = IntrinsicsResolver(
             template.get("Mappings", {}), {FindInMapAction.intrinsic_name: FindInMapAction()}
@@ -119,13 +174,46 @@ class Translator:
         deployment_preference_collection = DeploymentPreferenceCollection()
         supported_resource_refs = SupportedResourceReferences()
         shared_api_usage_plan = SharedApiUsagePlan()
+        api_editor_session = ApiEditorSession()
         document_errors = []
         changed_logical_ids = {}
-        for logical_id, resource_dict in self._get_resources_to_iterate(sam_template, macro_resolver):
-            try:
-                macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
-                    logical_id, resource_dict, sam_plugins=sam_plugins
+        resources_to_iterate = self._get_resources_to_iterate(sam_template, macro_resolver)
+        incremental = None
+        if self.translation_cache is not None:
+            incremental = self.translation_cache.begin(
+                sam_template,
+                resources_to_iterate,
+                parameter_values,
+                self._get_translation_context(template, parameter_values),
+                template.get("Conditions"),
+                deployment_preference_collection,
+            )
+        for logical_id, resource_dict in resources_to_iterate:
+            dimensions = [{"Name": "ResourceType", "Value": resource_dict.get("Type")}]
+            reused = (
+                incremental.reuse(logical_id, sam_template["Resources"], supported_resource_refs)
+                if incremental
+                else None
+            )
+            if reused is not None:
+                new_logical_id, generated, duplicates = reused
+                self.redeploy_restapi_parameters["function_names"] = self._get_function_names(
+                    resource_dict, intrinsics_resolver
                 )
+                if logical_id != new_logical_id:
+                    changed_logical_ids[logical_id] = new_logical_id
+                del template["Resources"][logical_id]
+                template["Resources"].update(generated)
+                for duplicate_id, resource_type in duplicates:
+                    document_errors.append(DuplicateLogicalIdException(logical_id, duplicate_id, resource_type))
+                continue
+
+            snapshot = incremental.snapshot() if incremental else None
+            try:
+                with LatencyTimer(self._latency_metrics, "FromDictLatency", dimensions):
+                    macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
+                        logical_id, resource_dict, sam_plugins=sam_plugins
+                    )
 
                 kwargs = macro.resources_to_link(sam_template["Resources"])
                 kwargs["managed_policy_map"] = self.managed_policy_map
@@ -139,7 +227,9 @@ class Translator:
                 )
                 kwargs["redeploy_restapi_parameters"] = self.redeploy_restapi_parameters
                 kwargs["shared_api_usage_plan"] = shared_api_usage_plan
-                translated = macro.to_cloudformation(**kwargs)
+                kwargs["api_editor_session"] = api_editor_session
+                with LatencyTimer(self._latency_metrics, "ToCloudFormationLatency", dimensions):
+                    translated = macro.to_cloudformation(**kwargs)
 
                 supported_resource_refs = macro.get_resource_references(translated, supported_resource_refs)
 
@@ -148,29 +238,43 @@ class Translator:
                     changed_logical_ids[logical_id] = macro.logical_id
 
                 del template["Resources"][logical_id]
+                generated = []
                 for resource in translated:
                     if verify_unique_logical_id(resource, sam_template["Resources"]):
-                        template["Resources"].update(resource.to_dict())
+                        generated.append(resource.to_dict())
+                        template["Resources"].update(generated[-1])
                     else:
                         document_errors.append(
                             DuplicateLogicalIdException(logical_id, resource.logical_id, resource.resource_type)
                         )
+
+                if incremental:
+                    if len(generated) == len(translated):
+                        incremental.record(logical_id, macro, generated, supported_resource_refs, snapshot)
+                    else:
+                        incremental.discard(logical_id)
             except (InvalidResourceException, InvalidEventException) as e:
                 document_errors.append(e)
+                if incremental:
+                    incremental.discard(logical_id)
+
+        if incremental:
+            incremental.commit()
 
         if deployment_preference_collection.any_enabled():
-            template["Resources"].update(deployment_preference_collection.codedeploy_application.to_dict())
+            with LatencyTimer(self._latency_metrics, "DeploymentPreferenceLatency"):
+                template["Resources"].update(deployment_preference_collection.codedeploy_application.to_dict())
 
-            if not deployment_preference_collection.can_skip_service_role():
-                template["Resources"].update(deployment_preference_collection.codedeploy_iam_role.to_dict())
+                if not deployment_preference_collection.can_skip_service_role():
+                    template["Resources"].update(deployment_preference_collection.codedeploy_iam_role.to_dict())
 
-            for logical_id in deployment_preference_collection.enabled_logical_ids():
-                try:
-                    template["Resources"].update(
-                        deployment_preference_collection.deployment_group(logical_id).to_dict()
-                    )
-                except InvalidResourceException as e:
-                    document_errors.append(e)
+                for logical_id in deployment_preference_collection.enabled_logical_ids():
+                    try:
+                        template["Resources"].update(
+                            deployment_preference_collection.deployment_group(logical_id).to_dict()
+                        )
+                    except InvalidResourceException as e:
+                        document_errors.append(e)
 
         # Run the after-transform plugin target
         try:
@@ -183,13 +287,86 @@ class Translator:
             del template["Transform"]
 
         if len(document_errors) == 0:
-            template = intrinsics_resolver.resolve_sam_resource_id_refs(template, changed_logical_ids)
-            template = intrinsics_resolver.resolve_sam_resource_refs(template, supported_resource_refs)
+            with LatencyTimer(self._latency_metrics, "ResolutionLatency"):
+                template = intrinsics_resolver.resolve_sam_resource_id_and_resource_refs(
+                    template, changed_logical_ids, supported_resource_refs
+                )
             return template
         else:
             raise InvalidDocumentException(document_errors)
 
     # private methods
+    def _get_macro_resolver(self):
+        """
+        Returns the resolver that maps SAM resource types to their classes. It is built once per Translator instance
+        because inspecting the `sam_resources` module is expensive and the result never changes.
+
+        :return samtranslator.model.ResourceTypeResolver: Resolver for SAM resource types
+        """
+        if self._macro_resolver is None:
+            self._macro_resolver = ResourceTypeResolver(sam_resources)
+        return self._macro_resolver
+
+    def _get_policy_templates_processor(self):
+        """
+        Returns the processor for the default policy templates. Reading and validating the policy templates JSON is
+        expensive, so the processor is built once per Translator instance and shared by all translations.
+
+        :return samtranslator.policy_template_processor.processor.PolicyTemplatesProcessor: Processor instance
+        """
+        if self._policy_templates_processor is None:
+            self._policy_templates_processor = make_default_policy_templates_processor()
+        return self._policy_templates_processor
+
+    def _get_translation_context(self, template, parameter_values):
+        """
+        Returns what the translation of every SAM resource depends on, besides its own properties and the parameters
+        and mappings it references. Cached translations are only reused when this context did not change.
+
+        :param dict template: Output template, before any SAM resource is translated
+        :param dict parameter_values: Values of the template and pseudo parameters
+        :return list: JSON serializable context
+        """
+        feature_toggle = self.feature_toggle
+        return [
+            sorted(self.managed_policy_map.items()) if self.managed_policy_map else None,
+            [feature_toggle.feature_config, feature_toggle.stage, feature_toggle.account_id, feature_toggle.region],
+            template.get("Conditions"),
+            # Some ARNs are generated for the partition of the region SAM runs in, instead of using AWS::Partition
+            [ArnGenerator.get_region_name(), parameter_values.get("AWS::Region")],
+        ]
+
+    def _prepare_output_template(self, sam_template, macro_resolver, copy_template=True):
+        """
+        Returns the template that will be turned into the output. SAM resources are removed from the output and
+        replaced with their translation, so they are never copied. Everything else is deep-copied only when
+        `copy_template` is set.
+
+        :param dict sam_template: SAM template
+        :param macro_resolver: Resolver that knows if a resource can be processed or not
+        :param bool copy_template: Deep-copy the parts of the template that are passed through to the output
+        :return dict: Template whose "Resources" section can be modified without affecting `sam_template`
+        """
+
+        # Share one memo across all copies so that objects referenced from several places (ex: YAML aliases) stay
+        # shared in the copy, just like a single deepcopy of the whole template would do.
+        memo = {}
+
+        def _copy(value):
+            return copy.deepcopy(value, memo) if copy_template else value
+
+        template = {}
+        for key, value in sam_template.items():
+            if key == "Resources":
+                template[key] = {
+                    logical_id: resource if macro_resolver.can_resolve(resource) else _copy(resource)
+                    for logical_id, resource in value.items()
+                }
+            else:
+                template[key] = _copy(value)
+
+        return template
+
     def _get_resources_to_iterate(self, sam_template, macro_resolver):
         """
         Returns a list of resources to iterate, order them based on the following order:
@@ -232,13 +409,17 @@ class Translator:
         return functions + statemachines + apis + others
 
 
-def prepare_plugins(plugins, parameters=None):
+def prepare_plugins(plugins, parameters=None, policy_templates_processor=None, metrics=None, template_url_cache=None):
     """
     Creates & returns a plugins object with the given list of plugins installed. In addition to the given plugins,
     we will also install a few "required" plugins that are necessary to provide complete support for SAM template spec.
 
     :param plugins: list of samtranslator.plugins.BasePlugin plugins: List of plugins to install
     :param parameters: Dictionary of parameter values
+    :param policy_templates_processor: Optional, already constructed PolicyTemplatesProcessor to share with the
+        policy templates plugin. If not provided, one will be created from the default policy templates.
+    :param metrics: Optional, metrics to record the latency of the template level hooks of each plugin to
+    :param template_url_cache: Optional, TemplateUrlCache to share with the ServerlessAppPlugin created here
     :return samtranslator.plugins.SamPlugins: Instance of `SamPlugins`
     """
 
@@ -249,18 +430,18 @@ def prepare_plugins(plugins, parameters=None):
         make_implicit_rest_api_plugin(),
         make_implicit_http_api_plugin(),
         GlobalsPlugin(),
-        make_policy_template_for_function_plugin(),
+        make_policy_template_for_function_plugin(policy_templates_processor),
     ]
 
     plugins = [] if not plugins else plugins
 
     # If a ServerlessAppPlugin does not yet exist, create one and add to the beginning of the required plugins list.
     if not any(isinstance(plugin, ServerlessAppPlugin) for plugin in plugins):
-        required_plugins.insert(0, ServerlessAppPlugin(parameters=parameters))
+        required_plugins.insert(0, ServerlessAppPlugin(parameters=parameters, template_url_cache=template_url_cache))
 
     # Execute customer's plugins first before running SAM plugins. It is very important to retain this order because
     # other plugins will be dependent on this ordering.
-    return SamPlugins(plugins + required_plugins)
+    return SamPlugins(plugins + required_plugins, metrics=metrics)
 
 
 def make_implicit_rest_api_plugin():
@@ -277,13 +458,23 @@ def make_implicit_http_api_plugin():
     return ImplicitHttpApiPlugin()
 
 
-def make_policy_template_for_function_plugin():
+def make_policy_template_for_function_plugin(policy_templates_processor=None):
     """
     Constructs an instance of policy templates processing plugin using default policy templates JSON data
 
+    :param policy_templates_processor: Optional, processor to use instead of building one from the default templates
     :return plugins.policies.policy_templates_plugin.PolicyTemplatesForResourcePlugin: Instance of the plugin
     """
 
-    policy_templates = PolicyTemplatesProcessor.get_default_policy_templates_json()
-    processor = PolicyTemplatesProcessor(policy_templates)
+    processor = policy_templates_processor if policy_templates_processor else make_default_policy_templates_processor()
     return PolicyTemplatesForResourcePlugin(processor)
+
+
+def make_default_policy_templates_processor():
+    """
+    Returns the policy templates processor of the default policy templates JSON data, shared by all translators
+
+    :return samtranslator.policy_template_processor.processor.PolicyTemplatesProcessor: Processor instance
+    """
+
+    return PolicyTemplatesProcessor.get_default()
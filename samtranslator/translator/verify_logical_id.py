@@ -16,12 +16,16 @@ do_not_verify = {
 
 
 def verify_unique_logical_id(resource, existing_resources):
+    return is_unique_logical_id(resource.logical_id, resource.resource_type, existing_resources)
+
+
+def is_unique_logical_id(logical_id, resource_type, existing_resources):
     # new resource logicalid exists in the template before transform
-    if resource.logical_id is not None and resource.logical_id in existing_resources:
+    if logical_id is not None and logical_id in existing_resources:
         # new resource logicalid is in  the do_not_resolve list
         if (
-            resource.resource_type not in do_not_verify
-            or existing_resources[resource.logical_id]["Type"] not in do_not_verify[resource.resource_type]
+            resource_type not in do_not_verify
+            or existing_resources[logical_id]["Type"] not in do_not_verify[resource_type]
         ):
             return False
     return True
@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+
+
+def write_json_atomically(path, content):
+    """
+    Writes content as compact JSON to a file, creating its directory if needed. The content is written to a temporary
+    file that then replaces the file, so concurrent readers never see a partially written file.
+
+    :param string path: Path of the file to write
+    :param content: JSON serializable content
+    :raises IOError, OSError: if the file cannot be written. The temporary file is removed
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump(content, fp, separators=(",", ":"))
+        _replace(temp_path, path)
+    except (IOError, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _replace(source, destination):
+    # os.replace is not available in Python 2. os.rename also replaces existing files atomically, but only on POSIX
+    replace = getattr(os, "replace", os.rename)
+    replace(source, destination)
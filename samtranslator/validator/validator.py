@@ -1,12 +1,14 @@
 import json
 
-import jsonschema
-from jsonschema.exceptions import ValidationError
-
 from . import sam_schema
 
 
 class SamTemplateValidator(object):
+
+    # Compiled validator for the default SAM schema. Loading and checking the schema is expensive, so it is done once
+    # on first use and the validator is shared by all callers. Validators are stateless and safe to share.
+    _default_validator = None
+
     @staticmethod
     def validate(template_dict, schema=None):
         """
@@ -17,21 +19,67 @@ class SamTemplateValidator(object):
         :return: Empty string if there are no validation errors in template
         """
 
-        if not schema:
-            schema = SamTemplateValidator._read_schema()
+        from jsonschema.exceptions import best_match
+
+        # Same error selection as `jsonschema.validate`, without re-checking the schema on every call
+        error = best_match(SamTemplateValidator.iter_errors(template_dict, schema))
 
-        validation_errors = ""
+        # Stringifying the error will give us useful error message
+        return str(error) if error else ""
 
-        try:
-            jsonschema.validate(template_dict, schema)
-        except ValidationError as ex:
-            # Stringifying the exception will give us useful error message
-            validation_errors = str(ex)
-            # Swallowing expected exception here as our caller is expecting validation errors and
-            # not the valiation exception itself
-            pass
+    @staticmethod
+    def validate_all(template_dict, schema=None):
+        """
+        Collects every validation error in the template instead of only the most relevant one
+
+        :param dict template_dict: Data to be validated
+        :param dict schema: Optional, dictionary containing JSON Schema representing SAM template
+        :return list: List of validation error messages. Empty if the template is valid
+        """
+        return [str(error) for error in SamTemplateValidator.iter_errors(template_dict, schema)]
+
+    @staticmethod
+    def iter_errors(template_dict, schema=None):
+        """
+        Lazily yields validation errors found in the template. Callers that only need to know whether the template is
+        valid can stop after the first error.
+
+        :param dict template_dict: Data to be validated
+        :param dict schema: Optional, dictionary containing JSON Schema representing SAM template
+        :return: Generator of jsonschema.exceptions.ValidationError
+        """
+        return SamTemplateValidator._get_validator(schema).iter_errors(template_dict)
+
+    @staticmethod
+    def _get_validator(schema=None):
+        """
+        Returns a compiled validator for the given schema. The validator for the default SAM schema is cached.
+
+        :param dict schema: Optional, dictionary containing JSON Schema. If not provided, the SAM schema is used
+        :return: jsonschema validator instance
+        """
+        if schema:
+            return SamTemplateValidator._compile(schema)
+
+        if SamTemplateValidator._default_validator is None:
+            SamTemplateValidator._default_validator = SamTemplateValidator._compile(SamTemplateValidator._read_schema())
+
+        return SamTemplateValidator._default_validator
+
+    @staticmethod
+    def _compile(schema):
+        """
+        Checks the schema and builds a validator of the draft declared by the schema
+
+        :param dict schema: Dictionary containing JSON Schema
+        :return: jsonschema validator instance
+        :raises jsonschema.exceptions.SchemaError: If the schema itself is invalid
+        """
+        from jsonschema.validators import validator_for
 
-        return validation_errors
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
 
     @staticmethod
     def _read_schema():
@@ -1,15 +1,50 @@
 import yaml
 from yaml import ScalarNode, SequenceNode
+from yaml.events import (
+    DocumentEndEvent,
+    DocumentStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.representer import SafeRepresenter
+from yaml.resolver import Resolver
 from six import string_types
 
 # This helper copied almost entirely from
 # https://github.com/aws/aws-cli/blob/develop/awscli/customizations/cloudformation/yamlhelper.py
 
+try:
+    # Parser and emitter of LibYAML, several times faster than the pure Python SafeLoader and SafeDumper
+    from yaml import CSafeLoader as _BaseLoader, CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader, SafeDumper as _BaseDumper
+
+# Intrinsics whose short form is not prefixed with "Fn::"
+_UNPREFIXED_INTRINSICS = ("Ref", "Condition")
+
 
 def yaml_parse(yamlstr):
     """Parse a yaml string"""
-    yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-    return yaml.safe_load(yamlstr)
+    return yaml.load(yamlstr, Loader=_IntrinsicsLoader)
+
+
+def yaml_dump(data, stream=None, sort_keys=False):
+    """
+    Dump a template to YAML, writing CloudFormation intrinsics in their short form, ex: !Ref, so that `yaml_parse`
+    reads back the same template. The document is written to the stream as it is generated, without building the
+    whole text or a YAML representation of the template in memory first.
+
+    :param dict data: Template to dump
+    :param stream: Optional, file-like object to write to
+    :param bool sort_keys: Write the keys of mappings in sorted order instead of the order of the template
+    :return: The YAML text if no stream is given, None otherwise
+    """
+    return yaml.emit(_document_events(data, sort_keys), stream, Dumper=_BaseDumper)
 
 
 def intrinsics_multi_constructor(loader, tag_prefix, node):
@@ -23,7 +58,7 @@ def intrinsics_multi_constructor(loader, tag_prefix, node):
 
     # Some intrinsic functions doesn't support prefix "Fn::"
     prefix = "Fn::"
-    if tag in ["Ref", "Condition"]:
+    if tag in _UNPREFIXED_INTRINSICS:
         prefix = ""
 
     cfntag = prefix + tag
@@ -47,3 +82,104 @@ def intrinsics_multi_constructor(loader, tag_prefix, node):
         value = loader.construct_mapping(node)
 
     return {cfntag: value}
+
+
+def _intrinsic_tag(value):
+    """
+    Returns the short form tag of a CloudFormation intrinsic, ex: "!GetAtt" for {"Fn::GetAtt": [...]}, or None if the
+    value is not an intrinsic that `intrinsics_multi_constructor` would read back to the same value
+    """
+    if not isinstance(value, dict) or len(value) != 1:
+        return None
+
+    key, argument = next(iter(value.items()))
+    if not isinstance(key, string_types) or not isinstance(argument, (string_types, list, dict)):
+        return None
+
+    if key in _UNPREFIXED_INTRINSICS:
+        name = key
+    elif key.startswith("Fn::") and key[4:] not in _UNPREFIXED_INTRINSICS:
+        name = key[4:]
+    else:
+        return None
+
+    # !GetAtt splits its string argument in two at the first dot
+    if not name.isalnum() or (name == "GetAtt" and isinstance(argument, string_types)):
+        return None
+    return "!" + name
+
+
+class _ScalarRepresenter(SafeRepresenter, Resolver):
+    """
+    Represents scalars the way yaml.safe_dump does, to generate the events of `yaml_dump`
+    """
+
+    def __init__(self):
+        SafeRepresenter.__init__(self)
+        Resolver.__init__(self)
+
+    def scalar_event(self, value, tag=None):
+        node = self.represent_data(value)
+        if tag is not None:
+            return ScalarEvent(None, tag, (False, False), node.value, style=node.style)
+
+        # Same as yaml.serializer.Serializer: the tag is implicit when the value resolves to it, ex: 1 to an int
+        implicit = (
+            node.tag == self.resolve(ScalarNode, node.value, (True, False)),
+            node.tag == self.resolve(ScalarNode, node.value, (False, True)),
+        )
+        return ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+
+
+def _document_events(data, sort_keys):
+    representer = _ScalarRepresenter()
+    yield StreamStartEvent()
+    yield DocumentStartEvent(explicit=False)
+
+    # Depth first traversal of the template with an explicit stack, templates can be deeply nested
+    stack = [(data, None)]
+    while stack:
+        value, tag = stack.pop()
+        if isinstance(value, _EndEvent):
+            yield value.event()
+            continue
+
+        # A node has one tag, the argument of a short form intrinsic is written in the long form if it is one too
+        intrinsic_tag = _intrinsic_tag(value) if tag is None else None
+        if intrinsic_tag is not None:
+            stack.append((next(iter(value.values())), intrinsic_tag))
+        elif isinstance(value, dict):
+            yield MappingStartEvent(None, tag, tag is None, flow_style=False)
+            items = sorted(value.items()) if sort_keys else list(value.items())
+            stack.append((_EndEvent(MappingEndEvent), None))
+            for key, item in reversed(items):
+                stack.append((item, None))
+                stack.append((key, None))
+        elif isinstance(value, list):
+            yield SequenceStartEvent(None, tag, tag is None, flow_style=False)
+            stack.append((_EndEvent(SequenceEndEvent), None))
+            stack.extend((item, None) for item in reversed(value))
+        else:
+            yield representer.scalar_event(value, tag)
+
+    yield DocumentEndEvent(explicit=False)
+    yield StreamEndEvent()
+
+
+class _EndEvent(object):
+    """
+    Marks the end of a mapping or sequence on the stack of `_document_events`
+    """
+
+    def __init__(self, event_class):
+        self.event = event_class
+
+
+class _IntrinsicsLoader(_BaseLoader):
+    """
+    Safe loader that parses the short form of CloudFormation intrinsics, ex: !Ref. Registering the constructor on a
+    subclass leaves yaml.SafeLoader untouched.
+    """
+
+
+_IntrinsicsLoader.add_multi_constructor("!", intrinsics_multi_constructor)
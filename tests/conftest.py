@@ -0,0 +1,13 @@
+import pytest
+
+from samtranslator.translator.arn_generator import ArnGenerator
+
+
+@pytest.fixture(autouse=True)
+def forget_region_name():
+    """
+    Tests patch the region Boto3 resolves, so the region memoized by ArnGenerator must not leak between tests
+    """
+    ArnGenerator._region_names.clear()
+    yield
+    ArnGenerator._region_names.clear()
@@ -104,11 +104,11 @@ class TestFeatureToggleAppConfig(TestCase):
             param("feature-1", "beta", None, "123456789123", False),
         ]
     )
-    @patch("samtranslator.feature_toggle.feature_toggle.boto3")
+    @patch("boto3.client")
     def test_feature_toggle_with_appconfig_provider(
-        self, feature_name, stage, region, account_id, expected, boto3_mock
+        self, feature_name, stage, region, account_id, expected, boto3_client_mock
     ):
-        boto3_mock.client.return_value = self.app_config_mock
+        boto3_client_mock.return_value = self.app_config_mock
         feature_toggle_config_provider = FeatureToggleAppConfigConfigProvider(
             "test_app_id", "test_env_id", "test_conf_id"
         )
@@ -119,9 +119,9 @@ class TestFeatureToggleAppConfig(TestCase):
 
 
 class TestFeatureToggleAppConfigConfigProvider(TestCase):
-    @patch("samtranslator.feature_toggle.feature_toggle.boto3")
-    def test_feature_toggle_with_exception(self, boto3_mock):
-        boto3_mock.client.raiseError.side_effect = Exception()
+    @patch("boto3.client")
+    def test_feature_toggle_with_exception(self, boto3_client_mock):
+        boto3_client_mock.side_effect = Exception()
         feature_toggle_config_provider = FeatureToggleAppConfigConfigProvider(
             "test_app_id", "test_env_id", "test_conf_id"
         )
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from samtranslator.intrinsics.reference_index import ReferenceIndex
+
+
+class TestReferenceIndex(TestCase):
+    def setUp(self):
+        self.template = {
+            "Resources": {
+                "Function": {
+                    "Properties": {
+                        "Role": {"Fn::GetAtt": ["FunctionRole", "Arn"]},
+                        "Alias": {"Ref": "Function.Alias"},
+                        "Layers": [{"Ref": "Layer"}, {"Ref": "AWS::NoValue"}],
+                        "Sub": {"Fn::Sub": ["${Layer}-${Function.Alias.Arn}-${!Literal}", {"Var": {"Ref": "Layer"}}]},
+                    }
+                }
+            },
+            "Outputs": {"Arn": {"Value": {"Fn::GetAtt": ["Function", "Arn"]}}},
+        }
+        self.index = ReferenceIndex(self.template)
+
+    def test_must_index_referenced_logical_ids(self):
+        self.assertEqual({"FunctionRole", "Function", "Layer", "AWS::NoValue"}, self.index.logical_ids())
+
+    def test_references_must_return_intrinsics_referencing_logical_id(self):
+        properties = self.template["Resources"]["Function"]["Properties"]
+
+        self.assertEqual(
+            sorted([properties["Layers"][0], properties["Sub"], properties["Sub"]["Fn::Sub"][1]["Var"]], key=repr),
+            sorted(self.index.references("Layer"), key=repr),
+        )
+        self.assertEqual([], self.index.references("Unknown"))
+
+    def test_locations_must_list_intrinsics_once_with_containers_first(self):
+        properties = self.template["Resources"]["Function"]["Properties"]
+
+        locations = self.index.locations(["Layer", "Function"])
+
+        self.assertEqual(5, len(locations))
+        self.assertLess(locations.index((properties, "Sub")), locations.index((properties["Sub"]["Fn::Sub"][1], "Var")))
+        for container, key in locations:
+            self.assertIs(container[key], self.index.get((container, key)))
+
+    def test_must_index_intrinsic_at_root(self):
+        template = {"Ref": "Layer"}
+
+        self.assertEqual([template], ReferenceIndex(template).references("Layer"))
+
+    def test_must_not_index_intrinsics_without_references(self):
+        index = ReferenceIndex(
+            {"A": {"Fn::Sub": "no references"}, "B": {"Ref": ["not", "a", "string"]}, "C": {"Fn::GetAtt": "Short.Arn"}}
+        )
+
+        self.assertEqual(set(), index.logical_ids())
+        self.assertEqual([], index.locations([], include_unreadable=True))
+
+    def test_must_list_unreadable_get_att_only_when_asked(self):
+        template = {"A": {"Fn::GetAtt": ["Resource", {"Ref": "Attribute"}]}}
+        index = ReferenceIndex(template)
+
+        self.assertEqual([], index.locations(["Resource"]))
+        self.assertEqual([(template, "A")], index.locations([], include_unreadable=True))
+        self.assertEqual({"Attribute"}, index.logical_ids())
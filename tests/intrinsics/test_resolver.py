@@ -1,7 +1,10 @@
+import sys
+import copy
 from unittest import TestCase
 from mock import Mock, patch
 from samtranslator.intrinsics.resolver import IntrinsicsResolver
 from samtranslator.intrinsics.actions import Action
+from samtranslator.intrinsics.resource_refs import SupportedResourceReferences
 from samtranslator.model.exceptions import InvalidDocumentException
 
 
@@ -162,6 +165,128 @@ class TestResourceReferenceResolution(TestCase):
         resolver._try_resolve_sam_resource_refs.assert_not_called()
 
 
+class TestResolveAll(TestCase):
+    def setUp(self):
+        self.resolver = IntrinsicsResolver({})
+        self.resource_id_refs = {"MyLayer": "MyLayerABC123"}
+        self.resource_refs = SupportedResourceReferences()
+        self.resource_refs.add("MyFunction", "Alias", "MyFunctionAliasLive")
+
+    def make_template(self):
+        return {
+            "Resources": {
+                "Function": {
+                    "Properties": {
+                        "Layers": [{"Ref": "MyLayer"}],
+                        "Alias": {"Ref": "MyFunction.Alias"},
+                        "Arn": {"Fn::GetAtt": ["MyFunction.Alias", "Arn"]},
+                        "Sub": {"Fn::Sub": ["${MyLayer} ${MyFunction.Alias}", {"Var": {"Ref": "MyLayer"}}]},
+                    }
+                }
+            },
+            "Outputs": {"Layer": {"Value": {"Fn::GetAtt": ["MyLayer", "Arn"]}}},
+        }
+
+    def test_must_match_resolutions_run_one_after_another(self):
+        expected = self.resolver.resolve_sam_resource_id_refs(self.make_template(), self.resource_id_refs)
+        expected = self.resolver.resolve_sam_resource_refs(expected, self.resource_refs)
+
+        result = self.resolver.resolve_sam_resource_id_and_resource_refs(
+            self.make_template(), self.resource_id_refs, self.resource_refs
+        )
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            {"Fn::Sub": ["${MyLayerABC123} ${MyFunctionAliasLive}", {"Var": {"Ref": "MyLayerABC123"}}]},
+            result["Resources"]["Function"]["Properties"]["Sub"],
+        )
+
+    def test_must_resolve_only_intrinsics_referencing_changed_resources(self):
+        template = {"Unrelated": {"Ref": "Other"}, "Layer": {"Ref": "MyLayer"}, "Alias": {"Ref": "MyFunction.Alias"}}
+
+        with patch.object(
+            IntrinsicsResolver, "_try_resolve_sam_resource_id_refs", autospec=True, side_effect=lambda self, i, d: i
+        ) as resolve_id_refs:
+            self.resolver.resolve_sam_resource_id_and_resource_refs(template, self.resource_id_refs, self.resource_refs)
+
+        self.assertEqual(
+            [{"Ref": "MyFunction.Alias"}, {"Ref": "MyLayer"}],
+            sorted((call[0][1] for call in resolve_id_refs.call_args_list), key=lambda ref: ref["Ref"]),
+        )
+
+    def test_must_resolve_intrinsic_at_root_of_input(self):
+        result = self.resolver.resolve_sam_resource_id_and_resource_refs(
+            {"Ref": "MyLayer"}, self.resource_id_refs, self.resource_refs
+        )
+
+        self.assertEqual({"Ref": "MyLayerABC123"}, result)
+
+    def test_must_reject_invalid_get_att_like_a_full_traversal(self):
+        template = {"Value": {"Fn::GetAtt": ["Other", {"Ref": "Attribute"}]}}
+
+        with self.assertRaises(InvalidDocumentException):
+            self.resolver.resolve_sam_resource_id_and_resource_refs(template, {}, self.resource_refs)
+
+    def test_must_resolve_deeply_nested_input(self):
+        depth = sys.getrecursionlimit() * 2
+        template = leaf = {}
+        for _ in range(depth):
+            leaf["Nested"] = {}
+            leaf = leaf["Nested"]
+        leaf["Nested"] = [{"Ref": "MyLayer"}]
+
+        self.resolver.resolve_sam_resource_id_refs(template, self.resource_id_refs)
+
+        self.assertEqual([{"Ref": "MyLayerABC123"}], leaf["Nested"])
+
+    def test_must_apply_resolutions_in_order_at_every_node(self):
+        calls = []
+
+        def first(input, data):
+            calls.append(("first", copy.deepcopy(input)))
+            return input
+
+        def second(input, data):
+            calls.append(("second", copy.deepcopy(input)))
+            return "resolved" if input == {"Ref": "leaf"} else input
+
+        result = self.resolver.resolve_all({"Key": [{"Ref": "leaf"}]}, [(first, {"a": 1}), (second, {"b": 2})])
+
+        self.assertEqual({"Key": ["resolved"]}, result)
+        self.assertEqual(
+            [
+                ("first", {"Key": [{"Ref": "leaf"}]}),
+                ("second", {"Key": [{"Ref": "leaf"}]}),
+                ("first", {"Ref": "leaf"}),
+                ("second", {"Ref": "leaf"}),
+            ],
+            calls,
+        )
+
+    def test_must_resolve_only_nodes_shaped_like_intrinsics(self):
+        resolver_method = Mock(side_effect=lambda input, data: input)
+
+        self.resolver.resolve_all({"A": "leaf", "B": [1, {"Ref": "foo"}], "C": {}}, [(resolver_method, {"foo": "bar"})])
+
+        resolver_method.assert_called_once_with({"Ref": "foo"}, {"foo": "bar"})
+
+    def test_must_skip_resolutions_with_empty_data(self):
+        skipped = Mock()
+        applied = Mock(side_effect=lambda input, data: input)
+
+        self.resolver.resolve_all({"Ref": "foo"}, [(skipped, {}), (applied, {"foo": "bar"})])
+
+        skipped.assert_not_called()
+        applied.assert_called_once_with({"Ref": "foo"}, {"foo": "bar"})
+
+    def test_short_circuit_when_all_resolution_data_is_empty(self):
+        resolver_method = Mock()
+        input = {"Ref": "foo"}
+
+        self.assertIs(input, self.resolver.resolve_all(input, [(resolver_method, {}), (resolver_method, {})]))
+        resolver_method.assert_not_called()
+
+
 class TestSupportedIntrinsics(TestCase):
     def test_by_default_all_intrinsics_must_be_supported(self):
         # Just make sure we never remove support for some intrinsic
@@ -26,6 +26,15 @@ class TestSupportedResourceReferences(TestCase):
         self.assertEqual({"property2": "value2"}, resource_refs.get_all("logicalId2"))
         self.assertEqual({"property3": "value3"}, resource_refs.get_all("logicalId3"))
 
+    def test_logical_ids_must_list_resources_with_references(self):
+        resource_refs = SupportedResourceReferences()
+
+        resource_refs.add("logicalId1", "property1", "value1")
+        resource_refs.add("logicalId1", "property2", "value2")
+        resource_refs.add("logicalId2", "property1", "value3")
+
+        self.assertEqual(["logicalId1", "logicalId2"], sorted(resource_refs.logical_ids()))
+
     def test_add_must_error_on_duplicate_value(self):
 
         resource_refs = SupportedResourceReferences()
@@ -1,6 +1,6 @@
 from parameterized import parameterized, param
 from unittest import TestCase
-from mock import MagicMock
+from mock import MagicMock, patch
 from samtranslator.metrics.metrics import (
     Metrics,
     MetricsPublisher,
@@ -8,6 +8,7 @@ from samtranslator.metrics.metrics import (
     DummyMetricsPublisher,
     Unit,
     MetricDatum,
+    LatencyTimer,
 )
 
 
@@ -189,3 +190,45 @@ class TestCWMetricPublisher(TestCase):
         dummy_publisher = DummyMetricsPublisher()
         dummy_publisher.publish("NS", [None])
         self.assertTrue(True)
+
+
+class TestLatencyTimer(TestCase):
+    @patch("samtranslator.metrics.metrics.default_timer")
+    def test_must_record_time_spent_in_block_in_milliseconds(self, default_timer_mock):
+        default_timer_mock.side_effect = [10.0, 10.25]
+        publisher = MetricPublisherTestHelper()
+        metrics = Metrics("DummyNamespace", publisher)
+        dimensions = [{"Name": "ResourceType", "Value": "AWS::Serverless::Function"}]
+
+        with metrics.timer("ToCloudFormationLatency", dimensions):
+            pass
+        metrics.publish()
+
+        self.assertEqual(1, len(publisher.metrics_cache))
+        self.assertEqual(
+            {
+                "MetricName": "ToCloudFormationLatency",
+                "Value": 250.0,
+                "Unit": Unit.Milliseconds,
+                "Dimensions": dimensions,
+            },
+            publisher.metrics_cache[0].get_metric_data(),
+        )
+
+    def test_must_record_latency_when_block_raises(self):
+        metrics = MagicMock()
+
+        with self.assertRaises(ValueError):
+            with LatencyTimer(metrics, "ValidationLatency"):
+                raise ValueError()
+
+        metrics.record_latency.assert_called_once()
+        self.assertEqual("ValidationLatency", metrics.record_latency.call_args[0][0])
+        self.assertEqual([], metrics.record_latency.call_args[0][2])
+
+    @patch("samtranslator.metrics.metrics.default_timer")
+    def test_must_do_nothing_without_metrics(self, default_timer_mock):
+        with LatencyTimer(None, "ValidationLatency"):
+            pass
+
+        default_timer_mock.assert_not_called()
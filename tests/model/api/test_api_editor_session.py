@@ -0,0 +1,111 @@
+from unittest import TestCase
+from mock import patch
+
+from samtranslator.model.api.api_editor_session import ApiEditorSession
+from samtranslator.open_api.open_api import OpenApiEditor
+from samtranslator.swagger.swagger import SwaggerEditor
+
+
+class TestApiEditorSession(TestCase):
+    def setUp(self):
+        self.session = ApiEditorSession()
+        self.original_body = {"swagger": "2.0", "paths": {}}
+        self.api = {"StageName": "Prod", "DefinitionBody": self.original_body}
+
+    def test_open_must_install_copy_of_definition_body(self):
+        editor = self.session.open(self.api, SwaggerEditor)
+        editor.add_path("/foo", "get")
+
+        self.assertIsNot(self.original_body, self.api["DefinitionBody"])
+        self.assertEqual({}, self.original_body["paths"])
+        self.assertEqual({"/foo": {"get": {}}}, self.api["DefinitionBody"]["paths"])
+
+    def test_open_must_reuse_editor_of_same_api(self):
+        editor = self.session.open(self.api, SwaggerEditor)
+        editor.add_path("/foo", "get")
+        self.session.close(self.api)
+
+        with patch("samtranslator.swagger.swagger.copy.deepcopy") as deepcopy_mock:
+            self.assertIs(editor, self.session.open(self.api, SwaggerEditor))
+            deepcopy_mock.assert_not_called()
+
+    def test_open_must_create_new_editor_when_definition_body_was_replaced(self):
+        editor = self.session.open(self.api, SwaggerEditor)
+
+        self.api["DefinitionBody"] = {"swagger": "2.0", "paths": {"/bar": {}}}
+        new_editor = self.session.open(self.api, SwaggerEditor)
+
+        self.assertIsNot(editor, new_editor)
+        self.assertTrue(new_editor.has_path("/bar"))
+
+    def test_open_must_create_new_editor_for_different_editor_class(self):
+        self.api["DefinitionBody"] = {"openapi": "3.0.1", "paths": {}}
+        editor = self.session.open(self.api, SwaggerEditor)
+
+        self.assertIsInstance(self.session.open(self.api, OpenApiEditor), OpenApiEditor)
+        self.assertIsInstance(editor, SwaggerEditor)
+
+    def test_open_must_keep_separate_editors_per_api(self):
+        other_api = {"DefinitionBody": self.original_body}
+
+        self.session.open(self.api, SwaggerEditor).add_path("/foo", "get")
+        self.session.open(other_api, SwaggerEditor).add_path("/bar", "get")
+
+        self.assertEqual(["/foo"], list(self.api["DefinitionBody"]["paths"]))
+        self.assertEqual(["/bar"], list(other_api["DefinitionBody"]["paths"]))
+
+    def test_open_must_raise_on_invalid_definition_body(self):
+        self.api["DefinitionBody"] = {"paths": {}}
+
+        with self.assertRaises(ValueError):
+            self.session.open(self.api, SwaggerEditor)
+
+    def test_close_must_write_back_new_sections(self):
+        editor = self.session.open(self.api, SwaggerEditor)
+        editor.security_definitions["key"] = {"type": "apiKey"}
+
+        self.session.close(self.api)
+
+        self.assertEqual({"key": {"type": "apiKey"}}, self.api["DefinitionBody"]["securityDefinitions"])
+
+    def test_close_must_ignore_api_that_was_never_opened(self):
+        self.session.close(self.api)
+
+        self.assertIs(self.original_body, self.api["DefinitionBody"])
+
+    def test_edit_must_keep_changes_when_no_error_is_raised(self):
+        with self.session.edit(self.api, "/foo"):
+            self.session.open(self.api, SwaggerEditor).add_path("/foo", "get")
+            self.session.close(self.api)
+
+        self.assertEqual({"/foo": {"get": {}}}, self.api["DefinitionBody"]["paths"])
+
+    def test_edit_must_restore_original_body_when_first_change_fails(self):
+        with self.assertRaises(KeyError):
+            with self.session.edit(self.api, "/foo"):
+                self.session.open(self.api, SwaggerEditor).add_path("/foo", "get")
+                raise KeyError()
+
+        self.assertIs(self.original_body, self.api["DefinitionBody"])
+        self.assertEqual({}, self.session.open(self.api, SwaggerEditor).paths)
+
+    def test_edit_must_undo_only_changes_made_inside_the_block(self):
+        editor = self.session.open(self.api, SwaggerEditor)
+        editor.add_path("/foo", "get")
+        self.session.close(self.api)
+
+        with self.assertRaises(KeyError):
+            with self.session.edit(self.api, "/foo"):
+                editor = self.session.open(self.api, SwaggerEditor)
+                editor.add_path("/foo", "post")
+                editor.security_definitions["key"] = {"type": "apiKey"}
+                self.session.close(self.api)
+                raise KeyError()
+
+        with self.assertRaises(KeyError):
+            with self.session.edit(self.api, "/bar"):
+                self.session.open(self.api, SwaggerEditor).add_path("/bar", "get")
+                raise KeyError()
+
+        self.assertEqual({"swagger": "2.0", "paths": {"/foo": {"get": {}}}}, self.api["DefinitionBody"])
+        self.assertEqual({}, self.original_body["paths"])
@@ -1,6 +1,7 @@
 from mock import Mock, patch
 from unittest import TestCase
 
+from samtranslator.model.api.api_editor_session import ApiEditorSession
 from samtranslator.model.eventsources.push import Api
 from samtranslator.model.lambda_ import LambdaFunction, LambdaPermission
 
@@ -117,6 +118,27 @@ class ApiEventSource(TestCase):
 
         self.assertEqual(arn, "arn:aws:execute-api:${AWS::Region}:${AWS::AccountId}:${__ApiId__}/${__Stage__}/GET/")
 
+    @patch("boto3.session.Session.region_name", "eu-west-2")
+    def test_events_must_share_editor_from_session(self):
+        session = ApiEditorSession()
+        swagger = {"swagger": "2.0", "paths": {}}
+        explicit_api = {"__MANAGE_SWAGGER": True, "DefinitionBody": swagger}
+
+        self.api_event_source.to_cloudformation(
+            function=self.func, explicit_api=explicit_api, api_editor_session=session
+        )
+        definition_body = explicit_api["DefinitionBody"]
+
+        other_event_source = Api("OtherApi")
+        other_event_source.Path = "/bar"
+        other_event_source.Method = "POST"
+        other_event_source.RestApiId = "abc123"
+        other_event_source.to_cloudformation(function=self.func, explicit_api=explicit_api, api_editor_session=session)
+
+        self.assertIs(definition_body, explicit_api["DefinitionBody"])
+        self.assertEqual(["/foo", "/bar"], list(definition_body["paths"]))
+        self.assertEqual({}, swagger["paths"])
+
     def _extract_path_from_arn(self, logical_id, perm):
         arn = perm.to_dict().get(logical_id, {}).get("Properties", {}).get("SourceArn", {}).get("Fn::Sub", [])[0]
 
@@ -327,6 +327,18 @@ class TestOpenApiEditor_openapi_property(TestCase):
         self.assertEqual({}, input["paths"])  # Editor works on a diff copy of input
 
 
+class TestOpenApiEditor_document_property(TestCase):
+    def test_must_return_document_owned_by_editor(self):
+        editor = OpenApiEditor({"openapi": "3.0.1", "paths": {}})
+        document = editor.document
+
+        editor.add_path("/foo", "get")
+
+        self.assertIs(document, editor.document)
+        self.assertEqual({"/foo": {"get": {}}}, document["paths"])
+        self.assertEqual(editor.document, editor.openapi)
+
+
 class TestOpenApiEditor_is_valid(TestCase):
     @parameterized.expand(
         [
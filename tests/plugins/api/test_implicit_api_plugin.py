@@ -553,7 +553,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         SwaggerEditorMock.is_valid.return_value = True
         editor_mock = Mock()
         SwaggerEditorMock.return_value = editor_mock
-        editor_mock.swagger = updated_swagger
+        editor_mock.document = updated_swagger
         self.plugin.editor = SwaggerEditorMock
 
         template_mock = Mock()
@@ -591,7 +591,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         SwaggerEditorMock.is_valid.return_value = True
         editor_mock = Mock()
         SwaggerEditorMock.return_value = editor_mock
-        editor_mock.swagger = updated_swagger
+        editor_mock.document = updated_swagger
         self.plugin.editor = SwaggerEditorMock
 
         template_mock = Mock()
@@ -1,11 +1,17 @@
 import boto3
 import itertools
+import threading
+import time
+from contextlib import contextmanager
 
-from mock import Mock, patch
+from botocore.exceptions import ClientError
+from mock import Mock, patch, call
 from unittest import TestCase
 from parameterized import parameterized, param
 
+from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.plugins.application.template_url_cache import TemplateUrlCache
 from samtranslator.plugins.exceptions import InvalidPluginException
 
 # TODO: run tests when AWS CLI is not configured (so they can run in brazil)
@@ -219,6 +225,205 @@ class TestServerlessAppPlugin_on_before_transform_template_translate(TestCase):
         self.assertEqual("value1", output)
 
 
+class FakeSarClient(object):
+    """
+    Offline stand-in for the boto3 serverlessrepo client. The template of an application becomes ACTIVE once its status
+    was checked `checks_until_active[application_id]` times. Each request takes `latency` seconds, and the highest
+    number of requests in flight at the same time is recorded.
+    """
+
+    def __init__(self, checks_until_active=None, latency=0, errors=None):
+        """
+        :param dict checks_until_active: ApplicationId -> number of status checks before its template is ACTIVE
+        :param float latency: Duration of each request, in seconds
+        :param dict errors: (operation name, ApplicationId) -> list of error codes to fail the next requests with
+        """
+        self.checks_until_active = checks_until_active or {}
+        self.latency = latency
+        self.errors = errors or {}
+        self.calls = []
+        self.max_requests_in_flight = 0
+        self._requests_in_flight = 0
+        self._checks = {}
+        self._lock = threading.Lock()
+
+    def create_cloud_formation_template(self, ApplicationId=None, SemanticVersion=None):
+        with self._request("CreateCloudFormationTemplate", ApplicationId):
+            template_id = "{}/{}".format(ApplicationId, SemanticVersion)
+            return self._template(ApplicationId, SemanticVersion, template_id)
+
+    def get_application(self, ApplicationId=None, SemanticVersion=None):
+        with self._request("GetApplication", ApplicationId):
+            return mock_get_application(ApplicationId, SemanticVersion)
+
+    def get_cloud_formation_template(self, ApplicationId=None, TemplateId=None):
+        with self._request("GetCloudFormationTemplate", ApplicationId):
+            with self._lock:
+                self._checks[TemplateId] = self._checks.get(TemplateId, 0) + 1
+            return self._template(ApplicationId, TemplateId.split("/")[-1], TemplateId)
+
+    def _template(self, application_id, semver, template_id):
+        active = self._checks.get(template_id, 0) >= self.checks_until_active.get(application_id, 0)
+        return {
+            "ApplicationId": application_id,
+            "SemanticVersion": semver,
+            "Status": STATUS_ACTIVE if active else STATUS_PREPARING,
+            "TemplateId": template_id,
+            "TemplateUrl": "{}/{}".format(MOCK_TEMPLATE_URL, application_id),
+        }
+
+    @contextmanager
+    def _request(self, operation_name, application_id):
+        with self._lock:
+            self.calls.append((operation_name, application_id))
+            self._requests_in_flight += 1
+            self.max_requests_in_flight = max(self.max_requests_in_flight, self._requests_in_flight)
+            errors = self.errors.get((operation_name, application_id))
+            error_code = errors.pop(0) if errors else None
+        try:
+            time.sleep(self.latency)
+            if error_code:
+                raise ClientError({"Error": {"Code": error_code, "Message": error_code}}, operation_name)
+            yield
+        finally:
+            with self._lock:
+                self._requests_in_flight -= 1
+
+
+def make_application_template(*app_ids):
+    return {
+        "Resources": {
+            "App{}".format(index): {
+                "Type": "AWS::Serverless::Application",
+                "Properties": {"Location": {"ApplicationId": app_id, "SemanticVersion": "1.0.0"}},
+            }
+            for index, app_id in enumerate(app_ids)
+        }
+    }
+
+
+@patch(
+    "samtranslator.plugins.application.serverless_app_plugin.RegionConfiguration.is_sar_supported",
+    Mock(return_value=True),
+)
+class TestServerlessAppPlugin_with_fake_sar_client(TestCase):
+    def test_must_request_applications_concurrently(self):
+        client = FakeSarClient(latency=0.05)
+        plugin = ServerlessAppPlugin(sar_client=client)
+
+        plugin.on_before_transform_template(make_application_template("app1", "app2", "app3", "app1"))
+
+        self.assertEqual(3, len(client.calls))
+        self.assertEqual(3, client.max_requests_in_flight)
+        self.assertEqual(
+            {("app" + n, "1.0.0"): "{}/app{}".format(MOCK_TEMPLATE_URL, n) for n in "123"}, plugin._applications
+        )
+        self.assertEqual([], plugin._in_progress_templates)
+
+    def test_must_limit_concurrent_requests(self):
+        client = FakeSarClient(latency=0.01)
+        plugin = ServerlessAppPlugin(sar_client=client, validate_only=True, max_concurrent_requests=1)
+
+        plugin.on_before_transform_template(make_application_template("app1", "app2", "app3"))
+
+        self.assertEqual(3, len(client.calls))
+        self.assertEqual(1, client.max_requests_in_flight)
+        self.assertEqual({"Available"}, plugin._applications[("app2", "1.0.0")])
+
+    def test_must_store_errors_of_applications(self):
+        client = FakeSarClient(errors={("CreateCloudFormationTemplate", "app2"): ["NotFoundException"]})
+        plugin = ServerlessAppPlugin(sar_client=client)
+
+        plugin.on_before_transform_template(make_application_template("app1", "app2"))
+
+        self.assertIsInstance(plugin._applications[("app2", "1.0.0")], InvalidResourceException)
+        self.assertEqual(MOCK_TEMPLATE_URL + "/app1", plugin._applications[("app1", "1.0.0")])
+        with self.assertRaises(InvalidResourceException):
+            plugin.on_before_transform_resource(
+                "App1",
+                "AWS::Serverless::Application",
+                {"Location": {"ApplicationId": "app2", "SemanticVersion": "1.0.0"}},
+            )
+
+    def test_must_raise_other_client_errors(self):
+        client = FakeSarClient(errors={("CreateCloudFormationTemplate", "app2"): ["ForbiddenException"]})
+        plugin = ServerlessAppPlugin(sar_client=client)
+
+        with self.assertRaises(ClientError):
+            plugin.on_before_transform_template(make_application_template("app1", "app2"))
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.sleep")
+    def test_must_check_templates_together_and_back_off(self, sleep_mock):
+        client = FakeSarClient(checks_until_active={"app1": 3, "app2": 3})
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True)
+        plugin.on_before_transform_template(make_application_template("app1", "app2"))
+
+        plugin.on_after_transform_template({})
+
+        self.assertEqual(3, client.calls.count(("GetCloudFormationTemplate", "app1")))
+        self.assertEqual(3, client.calls.count(("GetCloudFormationTemplate", "app2")))
+        self.assertEqual([call(1), call(2)], sleep_mock.call_args_list)
+        self.assertEqual([], plugin._in_progress_templates)
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.sleep")
+    def test_must_check_again_quickly_when_templates_become_active(self, sleep_mock):
+        client = FakeSarClient(checks_until_active={"app1": 1, "app2": 2, "app3": 4})
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True)
+        plugin.on_before_transform_template(make_application_template("app1", "app2", "app3"))
+
+        plugin.on_after_transform_template({})
+
+        self.assertEqual([call(1), call(1), call(1)], sleep_mock.call_args_list)
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.sleep")
+    def test_must_retry_throttled_checks(self, sleep_mock):
+        client = FakeSarClient(
+            checks_until_active={"app1": 1},
+            errors={("GetCloudFormationTemplate", "app1"): ["TooManyRequestsException"]},
+        )
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True)
+        plugin.on_before_transform_template(make_application_template("app1"))
+
+        plugin.on_after_transform_template({})
+
+        self.assertEqual(2, client.calls.count(("GetCloudFormationTemplate", "app1")))
+        self.assertEqual([call(1)], sleep_mock.call_args_list)
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.time")
+    @patch("samtranslator.plugins.application.serverless_app_plugin.sleep")
+    def test_must_time_out_waiting_for_templates(self, sleep_mock, time_mock):
+        now = [0]
+        time_mock.side_effect = lambda: now[0]
+        sleep_mock.side_effect = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        client = FakeSarClient(checks_until_active={"app1": 1000})
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True)
+        plugin.on_before_transform_template(make_application_template("app1"))
+
+        with self.assertRaises(InvalidResourceException):
+            plugin.on_after_transform_template({})
+
+        self.assertEqual(ServerlessAppPlugin.TEMPLATE_WAIT_TIMEOUT_SECONDS, now[0])
+        self.assertEqual(ServerlessAppPlugin.MAX_SLEEP_TIME_SECONDS, max(c[0][0] for c in sleep_mock.call_args_list))
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.sleep", Mock())
+    def test_must_reuse_cached_templates(self):
+        cache = TemplateUrlCache()
+        client = FakeSarClient(checks_until_active={"app1": 1})
+        template = make_application_template("app1", "app2")
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True, template_url_cache=cache)
+        plugin.on_before_transform_template(template)
+        plugin.on_after_transform_template(template)
+        client.calls = []
+
+        plugin = ServerlessAppPlugin(sar_client=client, wait_for_template_active_status=True, template_url_cache=cache)
+        plugin.on_before_transform_template(make_application_template("app2", "app1", "app3"))
+        plugin.on_after_transform_template(template)
+
+        self.assertEqual([("CreateCloudFormationTemplate", "app3")], client.calls)
+        self.assertEqual(MOCK_TEMPLATE_URL + "/app1", plugin._applications[("app1", "1.0.0")])
+        self.assertEqual("ACTIVE", cache.get("app1", "1.0.0", None)["Status"])
+
+
 class ApplicationResource(object):
     def __init__(self, app_id="app_id", semver="1.3.5"):
         self.properties = {"ApplicationId": app_id, "SemanticVersion": semver}
@@ -0,0 +1,117 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import patch
+
+from samtranslator.plugins.application.template_url_cache import TemplateUrlCache
+
+
+def make_template(template_id="template1", status="ACTIVE"):
+    return {
+        "ApplicationId": "app",
+        "SemanticVersion": "1.0.0",
+        "Status": status,
+        "TemplateId": template_id,
+        "TemplateUrl": "https://example.com/" + template_id,
+        "CreationTime": "2020-01-01T00:00:00.000Z",
+    }
+
+
+@patch("samtranslator.plugins.application.template_url_cache.time")
+class TestTemplateUrlCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache_file = os.path.join(self.directory, "cache", "templates.json")
+
+    def test_must_return_cached_fields(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache()
+        cache.put("app", "1.0.0", "us-east-1", make_template())
+
+        template = cache.get("app", "1.0.0", "us-east-1")
+
+        self.assertEqual("https://example.com/template1", template["TemplateUrl"])
+        self.assertNotIn("CreationTime", template)
+        self.assertIsNone(cache.get("app", "1.0.0", "us-west-2"))
+        self.assertIsNone(cache.get("app", "2.0.0", "us-east-1"))
+
+    def test_must_expire_templates(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache(ttl_seconds=60)
+        cache.put("app", "1.0.0", "us-east-1", make_template(status="PREPARING"))
+
+        time_mock.time.return_value = 1030
+        cache.put("app", "1.0.0", "us-east-1", make_template())
+        self.assertEqual("ACTIVE", cache.get("app", "1.0.0", "us-east-1")["Status"])
+
+        time_mock.time.return_value = 1060
+        self.assertIsNone(cache.get("app", "1.0.0", "us-east-1"))
+
+    def test_must_evict_least_recently_used_templates(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache(max_size=2)
+        cache.put("app1", "1.0.0", "us-east-1", make_template("template1"))
+        cache.put("app2", "1.0.0", "us-east-1", make_template("template2"))
+        cache.get("app1", "1.0.0", "us-east-1")
+
+        cache.put("app3", "1.0.0", "us-east-1", make_template("template3"))
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("app2", "1.0.0", "us-east-1"))
+        self.assertIsNotNone(cache.get("app1", "1.0.0", "us-east-1"))
+
+    def test_must_persist_templates_that_did_not_expire(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache(ttl_seconds=60, cache_file=self.cache_file)
+        cache.put("app1", "1.0.0", "us-east-1", make_template("template1"))
+        time_mock.time.return_value = 1030
+        cache.put("app2", "1.0.0", "us-east-1", make_template("template2"))
+
+        time_mock.time.return_value = 1070
+        cache.save()
+        loaded = TemplateUrlCache(cache_file=self.cache_file)
+
+        self.assertEqual(1, len(loaded))
+        self.assertEqual(
+            make_template("template2")["TemplateUrl"], loaded.get("app2", "1.0.0", "us-east-1")["TemplateUrl"]
+        )
+        time_mock.time.return_value = 1090
+        self.assertIsNone(loaded.get("app2", "1.0.0", "us-east-1"))
+
+    def test_must_ignore_unusable_cache_files(self, time_mock):
+        time_mock.time.return_value = 1000
+        self.assertEqual(0, len(TemplateUrlCache(cache_file=self.cache_file)))
+
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w") as fp:
+            fp.write("{")
+        self.assertEqual(0, len(TemplateUrlCache(cache_file=self.cache_file)))
+
+        with open(self.cache_file, "w") as fp:
+            json.dump({"version": 0, "entries": [[["app", "1.0.0", "us-east-1"], 2000, make_template()]]}, fp)
+        self.assertEqual(0, len(TemplateUrlCache(cache_file=self.cache_file)))
+
+    def test_clear_must_remove_all_templates(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache()
+        cache.put("app", "1.0.0", "us-east-1", make_template())
+
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+
+    def test_must_be_copied_to_other_processes(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TemplateUrlCache()
+        cache.put("app", "1.0.0", "us-east-1", make_template())
+
+        copied = pickle.loads(pickle.dumps(cache))
+        copied.put("app2", "1.0.0", "us-east-1", make_template("template2"))
+
+        self.assertEqual(make_template()["TemplateUrl"], copied.get("app", "1.0.0", "us-east-1")["TemplateUrl"])
+        self.assertEqual(1, len(cache))
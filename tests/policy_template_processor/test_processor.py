@@ -8,6 +8,7 @@ from jsonschema.exceptions import ValidationError
 from samtranslator.policy_template_processor.processor import PolicyTemplatesProcessor
 from samtranslator.policy_template_processor.template import Template
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
+from samtranslator.policy_templates_data import validated
 
 
 class TestPolicyTemplateProcessor(TestCase):
@@ -243,3 +244,45 @@ class TestPolicyTemplateProcessor(TestCase):
         result = PolicyTemplatesProcessor.get_default_policy_templates_json()
         self.assertEqual(result, expected)
         _read_file_mock.assert_called_once_with(PolicyTemplatesProcessor.DEFAULT_POLICY_TEMPLATES_FILE)
+
+    @patch.object(PolicyTemplatesProcessor, "_default", None)
+    @patch.object(PolicyTemplatesProcessor, "_is_valid_templates_dict")
+    def test_get_default_must_skip_validation_of_validated_templates(self, is_valid_templates_dict_mock):
+        processor = PolicyTemplatesProcessor.get_default()
+
+        self.assertIs(processor, PolicyTemplatesProcessor.get_default())
+        self.assertTrue(processor.has("DynamoDBCrudPolicy"))
+        is_valid_templates_dict_mock.assert_not_called()
+
+    @patch.object(PolicyTemplatesProcessor, "_default", None)
+    @patch.object(PolicyTemplatesProcessor, "_is_valid_templates_dict")
+    @patch("samtranslator.policy_template_processor.processor.validated.DIGEST", "digest of other files")
+    def test_get_default_must_validate_templates_that_changed(self, is_valid_templates_dict_mock):
+        PolicyTemplatesProcessor.get_default()
+
+        is_valid_templates_dict_mock.assert_called_once_with(
+            PolicyTemplatesProcessor.get_default_policy_templates_json(), None
+        )
+
+    def test_validated_digest_must_match_default_policy_templates(self):
+        policy_templates = PolicyTemplatesProcessor.get_default_policy_templates_json()
+        schema = PolicyTemplatesProcessor._read_schema()
+
+        self.assertTrue(PolicyTemplatesProcessor._is_valid_templates_dict(policy_templates))
+        self.assertEqual(
+            validated.DIGEST,
+            PolicyTemplatesProcessor._digest(policy_templates, schema),
+            "Policy templates changed, run `make policy-templates` to validate them and record their digest",
+        )
+
+    def test_digest_must_not_depend_on_line_endings(self):
+        with open(PolicyTemplatesProcessor.DEFAULT_POLICY_TEMPLATES_FILE, "rb") as fp:
+            content = fp.read().replace(b"\r\n", b"\n")
+        schema = PolicyTemplatesProcessor._read_schema()
+
+        digests = [
+            PolicyTemplatesProcessor._digest(json.loads(text.decode("utf-8")), schema)
+            for text in (content, content.replace(b"\n", b"\r\n"))
+        ]
+
+        self.assertEqual([validated.DIGEST, validated.DIGEST], digests)
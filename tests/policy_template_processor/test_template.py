@@ -1,6 +1,10 @@
+import copy
 from unittest import TestCase
 from mock import Mock, patch, ANY
+from parameterized import parameterized
 
+from samtranslator.intrinsics.actions import RefAction
+from samtranslator.intrinsics.resolver import IntrinsicsResolver
 from samtranslator.policy_template_processor.template import Template
 from samtranslator.policy_template_processor.exceptions import InvalidParameterValues, InsufficientParameterValues
 
@@ -113,40 +117,68 @@ class TestTemplateObject(TestCase):
         parameter_values = [1, 2, 3]
         self.assertFalse(Template._is_valid_parameter_values(parameter_values))
 
-    @patch("samtranslator.policy_template_processor.template.IntrinsicsResolver")
-    def test_to_statement_must_work_with_valid_inputs(self, intrinsics_resolver_mock):
+    def test_to_statement_must_work_with_valid_inputs(self):
         parameter_values = {"param1": "b"}
         template_parameters = {"param1": {"Description": "something"}}
-        template_definition = {"Statement": {"key": "value"}}
-        expected = "some result"
-
-        resolver_instance_mock = Mock()
-        intrinsics_resolver_mock.return_value = resolver_instance_mock
-        resolver_instance_mock.resolve_parameter_refs.return_value = expected
+        template_definition = {
+            "Statement": [{"key": "value", "Resource": {"Fn::Sub": ["${a}", {"a": {"Ref": "param1"}}]}}]
+        }
 
         template = Template("name", template_parameters, template_definition)
         result = template.to_statement(parameter_values)
 
-        self.assertEqual(expected, result)
-        intrinsics_resolver_mock.assert_called_once_with(parameter_values, {"Ref": ANY})
-        resolver_instance_mock.resolve_parameter_refs.assert_called_once_with({"Statement": {"key": "value"}})
+        self.assertEqual({"Statement": [{"key": "value", "Resource": {"Fn::Sub": ["${a}", {"a": "b"}]}}]}, result)
+        # The definition is not modified
+        self.assertEqual({"Ref": "param1"}, template_definition["Statement"][0]["Resource"]["Fn::Sub"][1]["a"])
 
-    @patch("samtranslator.policy_template_processor.template.IntrinsicsResolver")
-    def test_to_statement_must_exclude_extra_parameter_values(self, intrinsics_resolver_mock):
+    def test_to_statement_must_exclude_extra_parameter_values(self):
         parameter_values = {"param1": "b", "key1": "value1", "key2": "value2"}
         template_parameters = {"param1": {"Description": "something"}}
-        template_definition = {"Statement": {"key": "value"}}
-
-        resolver_instance_mock = Mock()
-        intrinsics_resolver_mock.return_value = resolver_instance_mock
-        resolver_instance_mock.resolve_parameter_refs.return_value = "some result"
+        template_definition = {"Statement": [{"Ref": "param1"}, {"Ref": "key1"}]}
 
         template = Template("name", template_parameters, template_definition)
-        template.to_statement(parameter_values)
+        result = template.to_statement(parameter_values)
+
+        # Only the parameters declared in the template are substituted
+        self.assertEqual({"Statement": ["b", {"Ref": "key1"}]}, result)
+
+    def test_to_statement_must_return_new_statements(self):
+        template_definition = {"Statement": [{"Effect": "Allow", "Resource": {"Ref": "param1"}}], "Constant": ["a"]}
+        template = Template("name", {"param1": {}}, template_definition)
+
+        first = template.to_statement({"param1": "a"})
+        second = template.to_statement({"param1": "b"})
+
+        self.assertEqual("a", first["Statement"][0]["Resource"])
+        self.assertEqual("b", second["Statement"][0]["Resource"])
+        self.assertEqual(first["Constant"], second["Constant"])
+        self.assertIsNot(first["Constant"], second["Constant"])
+        self.assertIsNot(first["Constant"], template_definition["Constant"])
+
+    def test_to_statement_must_resolve_references_within_parameter_values(self):
+        template = Template("name", {"param1": {}, "param2": {}}, {"Statement": {"Ref": "param1"}})
+
+        result = template.to_statement({"param1": {"Fn::Sub": ["${a}", {"a": {"Ref": "param2"}}]}, "param2": "b"})
+
+        self.assertEqual({"Statement": {"Fn::Sub": ["${a}", {"a": "b"}]}}, result)
+
+    @parameterized.expand(
+        [
+            ({"Ref": "param1"},),
+            ({"Ref": ["param1"]},),
+            (["a", {"Ref": "param1", "Other": "b"}],),
+            ("a",),
+        ]
+    )
+    def test_to_statement_must_match_intrinsics_resolver(self, template_definition):
+        parameter_values = {"param1": "b"}
+        expected = IntrinsicsResolver(parameter_values, {"Ref": RefAction()}).resolve_parameter_refs(
+            copy.deepcopy(template_definition)
+        )
+
+        template = Template("name", {"param1": {}}, template_definition)
 
-        # Intrinsics resolver must be called only with the parameters declared in the template
-        expected_parameter_values = {"param1": "b"}
-        intrinsics_resolver_mock.assert_called_once_with(expected_parameter_values, ANY)
+        self.assertEqual(expected, template.to_statement(parameter_values))
 
     @patch("samtranslator.policy_template_processor.template.IntrinsicsResolver")
     def test_to_statement_must_raise_with_missing_parameters(self, intrinsics_resolver_mock):
@@ -1,6 +1,9 @@
 from unittest import TestCase
+from mock import patch
 from six import assertCountEqual
 
+from samtranslator.model.exceptions import InvalidDocumentException
+
 from samtranslator.sdk.template import SamTemplate
 from samtranslator.sdk.resource import SamResource
 
@@ -128,3 +131,85 @@ class TestSamTemplate(TestCase):
         # Verify that actual references match - Input should be untouched
         self.assertTrue(template.to_dict()["Properties"] is self.template_dict["Properties"])
         self.assertTrue(template.to_dict()["Metadata"] is self.template_dict["Metadata"])
+
+
+class TestSamTemplateIndex(TestCase):
+    def setUp(self):
+        self.template_dict = {
+            "Resources": {
+                "Function1": {"Type": "AWS::Serverless::Function"},
+                "Api": {"Type": "AWS::Serverless::Api"},
+                "NonSam": {"Type": "AWS::Lambda::Function"},
+                "Function2": {"Type": "AWS::Serverless::Function"},
+            }
+        }
+        self.template = SamTemplate(self.template_dict)
+
+    def ids(self, resource_types=None):
+        return [logicalId for logicalId, _ in self.template.iterate(resource_types)]
+
+    def test_iterate_must_reuse_resources(self):
+        first = dict(self.template.iterate())
+
+        with patch("samtranslator.sdk.template.SamResource") as sam_resource_mock:
+            second = dict(self.template.iterate({"AWS::Serverless::Function"}))
+
+        sam_resource_mock.assert_not_called()
+        self.assertIs(first["Function1"], second["Function1"])
+
+    def test_iterate_must_yield_several_types_in_template_order(self):
+        self.template.set("Function1", {"Type": "AWS::Serverless::Function", "Properties": {"a": "b"}})
+
+        self.assertEqual(["Function1", "Api", "Function2"], self.ids())
+        self.assertEqual(
+            ["Function1", "Api", "Function2"], self.ids({"AWS::Serverless::Api", "AWS::Serverless::Function"})
+        )
+
+    def test_set_and_delete_must_update_index(self):
+        self.ids()
+
+        self.template.set("Api", {"Type": "AWS::Serverless::HttpApi"})
+        self.template.set("NonSam", {"Type": "AWS::Serverless::Function"})
+        self.template.set("New", {"Type": "AWS::Serverless::Api"})
+        self.template.delete("Function2")
+
+        self.assertEqual(["Function1", "NonSam"], self.ids({"AWS::Serverless::Function"}))
+        self.assertEqual(["Api"], self.ids({"AWS::Serverless::HttpApi"}))
+        self.assertEqual(["New"], self.ids({"AWS::Serverless::Api"}))
+
+    def test_iterate_must_see_resources_modified_in_template_dict(self):
+        self.ids()
+
+        self.template_dict["Resources"]["New"] = {"Type": "AWS::Serverless::Function"}
+        self.assertEqual(["Function1", "Function2", "New"], self.ids({"AWS::Serverless::Function"}))
+
+        self.template_dict["Resources"]["Api"]["Type"] = "AWS::Serverless::Function"
+        self.assertEqual([], self.ids({"AWS::Serverless::Api"}))
+        self.assertEqual(["Function1", "Api", "Function2", "New"], self.ids({"AWS::Serverless::Function"}))
+
+        self.template_dict["Resources"]["Function1"]["Properties"] = {"a": "b"}
+        self.assertEqual({"a": "b"}, dict(self.template.iterate())["Function1"].properties)
+
+    def test_iterate_must_see_resource_replaced_by_another_in_template_dict(self):
+        self.ids()
+
+        del self.template_dict["Resources"]["NonSam"]
+        self.template_dict["Resources"]["New"] = {"Type": "AWS::Serverless::Function"}
+
+        self.assertEqual(["Function1", "Function2", "New"], self.ids({"AWS::Serverless::Function"}))
+
+    def test_iterate_must_allow_set_while_iterating(self):
+        for logicalId, resource in self.template.iterate():
+            self.template.set(logicalId + "Copy", {"Type": resource.type})
+
+        self.assertEqual(
+            ["Function1", "Function2", "Function1Copy", "Function2Copy"], self.ids({"AWS::Serverless::Function"})
+        )
+
+    def test_set_must_not_raise_for_invalid_condition_until_iteration(self):
+        self.ids()
+
+        self.template.set("Invalid", {"Type": "AWS::Serverless::Function", "Condition": ["not", "a", "string"]})
+
+        with self.assertRaises(InvalidDocumentException):
+            self.ids()
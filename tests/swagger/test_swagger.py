@@ -657,6 +657,24 @@ class TestSwaggerEditor_swagger_property(TestCase):
         self.assertEqual({}, input["paths"])  # Editor works on a diff copy of input
 
 
+class TestSwaggerEditor_document_property(TestCase):
+    def test_must_return_document_owned_by_editor(self):
+        editor = SwaggerEditor({"swagger": "2.0", "paths": {}})
+        document = editor.document
+
+        editor.add_path("/foo", "get")
+
+        self.assertIs(document, editor.document)
+        self.assertEqual({"/foo": {"get": {}}}, document["paths"])
+
+    def test_must_attach_new_sections(self):
+        editor = SwaggerEditor({"swagger": "2.0", "paths": {}})
+        editor.security_definitions["key"] = {"type": "apiKey"}
+
+        self.assertEqual({"key": {"type": "apiKey"}}, editor.document["securityDefinitions"])
+        self.assertEqual(editor.document, editor.swagger)
+
+
 class TestSwaggerEditor_is_valid(TestCase):
     @parameterized.expand(
         [
@@ -4,6 +4,7 @@ from unittest import TestCase
 from mock import Mock, call, ANY
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.model import PropertyType, Resource, SamResourceMacro, ResourceTypeResolver
+from samtranslator.model.types import is_str, list_of
 from samtranslator.intrinsics.resource_refs import SupportedResourceReferences
 from samtranslator.plugins import LifeCycleEvents
 
@@ -170,6 +171,72 @@ class TestResourceAttributes(TestCase):
         self.assertEqual(r.get_resource_attribute("Condition"), "con")
 
 
+class TestResourceProperties(TestCase):
+    def setUp(self):
+        self.validate = Mock(return_value=True)
+
+        class MyResource(Resource):
+            resource_type = "foo"
+            property_types = {
+                "Property": PropertyType(True, self.validate),
+                "__Private": PropertyType(False, self.validate),
+            }
+
+        class MySubResource(MyResource):
+            property_types = dict(MyResource.property_types, OtherProperty=PropertyType(False, self.validate))
+
+        self.MyResource = MyResource
+        self.MySubResource = MySubResource
+
+    def test_must_store_properties_in_slots(self):
+        resource = self.MySubResource("id")
+        resource.Property = "value"
+        resource.OtherProperty = "other"
+
+        self.assertEqual(self.MyResource.__slots__, ("Property", "__dict__"))
+        self.assertEqual(self.MySubResource.__slots__, ("OtherProperty",))
+        self.assertEqual(
+            resource.to_dict(), {"id": {"Type": "foo", "Properties": {"Property": "value", "OtherProperty": "other"}}}
+        )
+
+    def test_must_keep_private_properties_in_a_dictionary(self):
+        resource = self.MyResource("id")
+        resource.Property = "value"
+        setattr(resource, "__Private", True)
+
+        self.assertEqual(resource.__dict__, {"__Private": True})
+        self.assertEqual(
+            resource.to_dict(), {"id": {"Type": "foo", "Properties": {"Property": "value", "__Private": True}}}
+        )
+
+    def test_must_not_set_unknown_attributes(self):
+        resource = self.MySubResource("id")
+
+        with self.assertRaises(InvalidResourceException):
+            resource.UnknownProperty = "value"
+
+    def test_must_validate_properties_changed_in_place(self):
+        class MyResource(Resource):
+            resource_type = "foo"
+            property_types = {"Property": PropertyType(True, list_of(is_str()))}
+
+        resource = MyResource.from_dict("id", {"Type": "foo", "Properties": {"Property": ["value"]}})
+        resource.to_dict()
+
+        resource.Property.append(1)
+
+        with self.assertRaises(InvalidResourceException):
+            resource.to_dict()
+
+    def test_must_validate_again_after_a_failure(self):
+        resource = self.MyResource("id")
+
+        with self.assertRaises(InvalidResourceException):
+            resource.validate_properties()
+        with self.assertRaises(InvalidResourceException):
+            resource.to_dict()
+
+
 class TestResourceRuntimeAttributes(TestCase):
     def test_resource_must_override_runtime_attributes(self):
         class NewResource(Resource):
@@ -2,7 +2,7 @@ from enum import Enum
 from samtranslator.plugins import SamPlugins, BasePlugin, LifeCycleEvents
 
 from unittest import TestCase
-from mock import Mock, patch, call
+from mock import ANY, Mock, patch, call
 
 
 class TestSamPluginsRegistration(TestCase):
@@ -285,6 +285,120 @@ class TestSamPluginsAct(TestCase):
         parent_mock.assert_has_calls([call.plugin1_hook(), call.plugin2_hook()])
 
 
+class TestSamPluginsActLatency(TestCase):
+    def setUp(self):
+        self.metrics = Mock()
+        self.sam_plugins = SamPlugins(metrics=self.metrics)
+        self.plugin = Mock(spec=BasePlugin)
+        self.plugin.name = "plugin"
+        self.sam_plugins.register(self.plugin)
+
+    def test_act_must_record_latency_of_template_hooks_per_plugin(self):
+        self.sam_plugins.act(LifeCycleEvents.before_transform_template, {})
+
+        self.metrics.record_latency.assert_called_once_with(
+            "PluginLatency",
+            ANY,
+            [
+                {"Name": "PluginName", "Value": "plugin"},
+                {"Name": "LifeCycleEvent", "Value": "before_transform_template"},
+            ],
+        )
+
+    def test_act_must_not_record_latency_of_resource_hooks(self):
+        self.sam_plugins.act(LifeCycleEvents.before_transform_resource, "id", "type", {})
+
+        self.plugin.on_before_transform_resource.assert_called_once_with("id", "type", {})
+        self.metrics.record_latency.assert_not_called()
+
+    def test_act_must_record_latency_when_hook_fails(self):
+        self.plugin.on_after_transform_template.side_effect = IOError
+
+        with self.assertRaises(IOError):
+            self.sam_plugins.act(LifeCycleEvents.after_transform_template, {})
+
+        self.metrics.record_latency.assert_called_once()
+
+
+class TestSamPluginsDispatch(TestCase):
+    def setUp(self):
+        self.sam_plugins = SamPlugins()
+
+    def test_act_must_skip_hooks_inherited_from_base_plugin(self):
+        class TemplatePlugin(BasePlugin):
+            def on_before_transform_template(self, template):
+                template["Visited"] = True
+
+        plugin = TemplatePlugin("plugin")
+        self.sam_plugins.register(plugin)
+        template = {}
+
+        with patch.object(BasePlugin, "on_after_transform_template") as base_hook:
+            self.sam_plugins.act(LifeCycleEvents.before_transform_template, template)
+            self.sam_plugins.act(LifeCycleEvents.after_transform_template, template)
+
+        self.assertEqual({"Visited": True}, template)
+        self.assertEqual(
+            [(plugin, plugin.on_before_transform_template)],
+            self.sam_plugins._get_dispatch_table("before_transform_template"),
+        )
+        self.assertEqual([], self.sam_plugins._get_dispatch_table("after_transform_template"))
+        base_hook.assert_not_called()
+
+    def test_act_must_only_invoke_resource_hooks_of_interested_plugins(self):
+        class FunctionPlugin(BasePlugin):
+            resource_types = {"AWS::Serverless::Function"}
+            on_before_transform_resource = Mock()
+
+        class AnyResourcePlugin(BasePlugin):
+            on_before_transform_resource = Mock()
+
+        function_plugin = FunctionPlugin("function")
+        any_resource_plugin = AnyResourcePlugin("any")
+        self.sam_plugins.register(function_plugin)
+        self.sam_plugins.register(any_resource_plugin)
+
+        self.sam_plugins.act(LifeCycleEvents.before_transform_resource, "Function", "AWS::Serverless::Function", {})
+        self.sam_plugins.act(LifeCycleEvents.before_transform_resource, "Api", "AWS::Serverless::Api", {})
+
+        FunctionPlugin.on_before_transform_resource.assert_called_once_with("Function", "AWS::Serverless::Function", {})
+        self.assertEqual(
+            [
+                call("Function", "AWS::Serverless::Function", {}),
+                call("Api", "AWS::Serverless::Api", {}),
+            ],
+            AnyResourcePlugin.on_before_transform_resource.call_args_list,
+        )
+
+    def test_act_must_invoke_resource_hooks_of_plugins_registered_after_acting(self):
+        first = _make_mock_plugin("first")
+        second = _make_mock_plugin("second")
+        self.sam_plugins.register(first)
+        self.sam_plugins.act(LifeCycleEvents.before_transform_resource, "Function", "AWS::Serverless::Function", {})
+
+        self.sam_plugins.register(second)
+        self.sam_plugins.act(LifeCycleEvents.before_transform_resource, "Function", "AWS::Serverless::Function", {})
+
+        self.assertEqual(2, first.on_before_transform_resource.call_count)
+        second.on_before_transform_resource.assert_called_once_with("Function", "AWS::Serverless::Function", {})
+
+    def test_act_must_read_resource_type_from_keyword_arguments(self):
+        class FunctionPlugin(BasePlugin):
+            resource_types = {"AWS::Serverless::Function"}
+            on_before_transform_resource = Mock()
+
+        self.sam_plugins.register(FunctionPlugin("function"))
+
+        self.sam_plugins.act(
+            LifeCycleEvents.before_transform_resource,
+            logical_id="Api",
+            resource_type="AWS::Serverless::Api",
+            resource_properties={},
+        )
+
+        FunctionPlugin.on_before_transform_resource.assert_not_called()
+
+
 class TestBasePlugin(TestCase):
     def test_initialization_should_set_name(self):
 
@@ -0,0 +1,89 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+import yaml
+from six import StringIO
+
+from samtranslator.yaml_helper import yaml_dump, yaml_parse
+
+OUTPUT_FOLDER = os.path.join(os.path.dirname(__file__), "translator", "output")
+
+
+class TestYamlParse(TestCase):
+    def test_must_parse_short_form_intrinsics(self):
+        template = "\n".join(
+            [
+                "Ref: !Ref Parameter",
+                "Condition: !Condition IsProd",
+                "GetAtt: !GetAtt Resource.Attribute.Nested",
+                'Sub: !Sub ["${A}", {A: !Ref B}]',
+                "If: !If {Condition: [a, b]}",
+            ]
+        )
+
+        self.assertEqual(
+            {
+                "Ref": {"Ref": "Parameter"},
+                "Condition": {"Condition": "IsProd"},
+                "GetAtt": {"Fn::GetAtt": ["Resource", "Attribute.Nested"]},
+                "Sub": {"Fn::Sub": ["${A}", {"A": {"Ref": "B"}}]},
+                "If": {"Fn::If": {"Condition": ["a", "b"]}},
+            },
+            yaml_parse(template),
+        )
+
+    def test_must_not_register_intrinsics_on_safe_loader(self):
+        yaml_parse("Value: !Ref Parameter")
+
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml.safe_load("Value: !Ref Parameter")
+
+
+class TestYamlDump(TestCase):
+    def test_must_write_short_form_intrinsics(self):
+        template = {
+            "Ref": {"Ref": "Parameter"},
+            "Sub": {"Fn::Sub": ["${A}", {"A": {"Ref": "B"}}]},
+            "GetAtt": {"Fn::GetAtt": ["Resource", "Arn"]},
+        }
+
+        self.assertEqual(
+            "Ref: !Ref Parameter\nSub: !Sub\n- ${A}\n- A: !Ref B\nGetAtt: !GetAtt\n- Resource\n- Arn\n",
+            yaml_dump(template),
+        )
+
+    def test_must_write_long_form_when_short_form_reads_back_differently(self):
+        template = {
+            "GetAtt": {"Fn::GetAtt": "Resource.Arn"},
+            "Ref": {"Ref": 1},
+            "Prefixed": {"Fn::Ref": "Parameter"},
+            "Nested": {"Condition": {"Condition": "IsProd"}},
+        }
+
+        text = yaml_dump(template)
+
+        self.assertEqual(template, yaml_parse(text))
+        self.assertIn("Fn::GetAtt: Resource.Arn", text)
+        self.assertIn("Nested: !Condition\n  Condition: IsProd", text)
+
+    def test_must_quote_strings_that_look_like_other_types(self):
+        template = {"Values": ["1", 1, "true", True, "null", None, "", 1.5, {}, []]}
+
+        self.assertEqual(template, yaml_parse(yaml_dump(template)))
+
+    def test_must_write_to_stream(self):
+        stream = StringIO()
+
+        self.assertIsNone(yaml_dump({"b": 1, "a": 2}, stream, sort_keys=True))
+        self.assertEqual("a: 2\nb: 1\n", stream.getvalue())
+
+    def test_must_read_back_translated_templates(self):
+        paths = glob.glob(os.path.join(OUTPUT_FOLDER, "*.json"))
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, "r") as fp:
+                template = json.load(fp)
+
+            self.assertEqual(template, yaml_parse(yaml_dump(template)), path)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 
@@ -6,6 +7,7 @@ from mock import MagicMock, patch
 from tests.translator.helpers import get_template_parameter_values
 from samtranslator.translator.transform import transform
 from samtranslator.model.apigateway import ApiGatewayDeployment
+from samtranslator.translator.logical_id_generator import LogicalIdGenerator
 from tests.plugins.application.test_serverless_app_plugin import mock_get_region
 
 mock_policy_loader = MagicMock()
@@ -124,11 +126,34 @@ class TestApiGatewayDeploymentResource(TestCase):
         self.assertEqual(deployment.logical_id, id_val)
         self.assertEqual(deployment.Description, "RestApi deployment id: {}".format(full_hash))
 
-        LogicalIdGeneratorMock.assert_called_once_with(prefix, str(swagger))
+        LogicalIdGeneratorMock.assert_called_once_with(
+            prefix, data_hash=hashlib.sha1(str(swagger).encode("utf-8")).hexdigest()
+        )
         generator_mock.gen.assert_called_once_with()
         generator_mock.get_hash.assert_called_once_with(length=40)  # getting full SHA
         stage.update_deployment_ref.assert_called_once_with(id_val)
 
+    def test_make_auto_deployable_must_hash_like_str_of_swagger(self):
+        swagger = {
+            "paths": {"/{}".format(index): {"get": {"x-amazon-apigateway-integration": {}}} for index in range(5)}
+        }
+        domain = {"DomainName": "example.com"}
+        redeploy_restapi_parameters = {"function_names": {"prefix": "FunctionName"}}
+        data = "||".join([str(swagger), "3.0", json.dumps(domain), "FunctionName"])
+        expected = LogicalIdGenerator("prefixDeployment", data)
+
+        deployment = ApiGatewayDeployment(logical_id="prefixDeployment")
+        deployment.make_auto_deployable(
+            MagicMock(),
+            openapi_version="3.0",
+            swagger=swagger,
+            domain=domain,
+            redeploy_restapi_parameters=redeploy_restapi_parameters,
+        )
+
+        self.assertEqual(expected.gen(), deployment.logical_id)
+        self.assertEqual("RestApi deployment id: {}".format(expected.get_hash(length=40)), deployment.Description)
+
     @patch("samtranslator.translator.logical_id_generator.LogicalIdGenerator")
     def test_make_auto_deployable_no_swagger(self, LogicalIdGeneratorMock):
         prefix = "prefix"
@@ -1,3 +1,5 @@
+import os
+import threading
 from unittest import TestCase
 from parameterized import parameterized
 from mock import patch
@@ -30,3 +32,44 @@ class TestArnGenerator(TestCase):
         self.assertEqual(actual, "aws")
 
         ArnGenerator.BOTO_SESSION_REGION_NAME = None
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_use_region_name_must_set_region_for_the_duration_of_the_block(self):
+        with ArnGenerator.use_region_name("cn-north-1"):
+            self.assertEqual("cn-north-1", ArnGenerator.get_region_name())
+            self.assertEqual("aws-cn", ArnGenerator.get_partition_name())
+
+        self.assertIsNone(ArnGenerator.BOTO_SESSION_REGION_NAME)
+        self.assertEqual("us-east-1", ArnGenerator.get_region_name())
+
+    def test_get_partition_name_must_not_create_session_when_region_is_set(self):
+        with ArnGenerator.use_region_name("us-gov-west-1"), patch("boto3.session.Session") as session_mock:
+            self.assertEqual("aws-us-gov", ArnGenerator.get_partition_name())
+
+        session_mock.assert_not_called()
+
+    def test_get_region_name_must_resolve_region_once_per_environment(self):
+        with patch("boto3.session.Session") as session_mock, patch.dict(
+            os.environ, {"AWS_DEFAULT_REGION": "us-east-1"}
+        ):
+            session_mock.return_value.region_name = "us-east-1"
+            self.assertEqual("us-east-1", ArnGenerator.get_region_name())
+            self.assertEqual("us-east-1", ArnGenerator.get_region_name())
+            session_mock.assert_called_once_with()
+
+            os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
+            session_mock.return_value.region_name = "eu-west-1"
+            self.assertEqual("eu-west-1", ArnGenerator.get_region_name())
+            self.assertEqual(2, session_mock.call_count)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_use_region_name_must_only_set_region_of_current_thread(self):
+        regions = []
+        thread = threading.Thread(target=lambda: regions.append(ArnGenerator.get_region_name()))
+
+        with ArnGenerator.use_region_name("cn-north-1"):
+            thread.start()
+            thread.join()
+            self.assertEqual("cn-north-1", ArnGenerator.get_region_name())
+
+        self.assertEqual(["us-east-1"], regions)
@@ -1,9 +1,10 @@
 import hashlib
 import json
+from collections import OrderedDict
 
 from unittest import TestCase
 from mock import patch
-from samtranslator.translator.logical_id_generator import LogicalIdGenerator
+from samtranslator.translator.logical_id_generator import LogicalIdGenerator, StrHasher
 
 
 class TestLogicalIdGenerator(TestCase):
@@ -174,16 +175,25 @@ class TestLogicalIdGenerator(TestCase):
         # Strings should be returned unmodified ie. json dump is short circuited
         self.assertEqual(data, generator._stringify(data))
 
-    @patch.object(json, "dumps")
-    def test_stringify_expectations(self, json_dumps_mock):
-        data = ["foo"]
-        expected = "bar"
-        json_dumps_mock.return_value = expected
+    def test_stringify_must_match_json_dumps(self):
+        data = [
+            {"b": [4, 3.5, None, True], "a": {"z": u"\u00e9", "y": {"Fn::Sub": "${AWS::Region}"}}},
+            ["foo", 1, -0.1, {"b": "d", "a": []}],
+            {1: "one", 2: float("nan")},
+        ]
+        generator = LogicalIdGenerator(self.prefix)
 
-        generator = LogicalIdGenerator(self.prefix, data_obj=data)
-        self.assertEqual(expected, generator._stringify(data))
+        for value in data:
+            self.assertEqual(json.dumps(value, separators=(",", ":"), sort_keys=True), generator._stringify(value))
 
-        json_dumps_mock.assert_called_with(data, separators=(",", ":"), sort_keys=True)
+    @patch("samtranslator.translator.logical_id_generator.hashlib")
+    def test_get_hash_must_hash_data_once(self, hashlib_mock):
+        hashlib_mock.sha1.return_value.hexdigest.return_value = "0123456789abcdef"
+        generator = LogicalIdGenerator(self.prefix, data_obj={"foo": "bar"})
+
+        self.assertEqual("prefix0123456789", generator.gen())
+        self.assertEqual("0123456789abcdef", generator.get_hash(length=40))
+        hashlib_mock.sha1.assert_called_once_with(b'{"foo":"bar"}')
 
     @patch.object(json, "dumps")
     def test_stringify_expectations_for_string(self, json_dumps_mock):
@@ -193,3 +203,43 @@ class TestLogicalIdGenerator(TestCase):
         self.assertEqual(data, generator._stringify(data))
 
         json_dumps_mock.assert_not_called()
+
+
+class TestStrHasher(TestCase):
+    def assert_same_hash_as_str(self, data):
+        hasher = StrHasher()
+        hasher.update_str(data)
+        self.assertEqual(hashlib.sha1(str(data).encode("utf-8")).hexdigest(), hasher.hexdigest())
+
+    def test_must_hash_like_str(self):
+        self.assert_same_hash_as_str("string")
+        self.assert_same_hash_as_str({})
+        self.assert_same_hash_as_str([(), (1,), (1, 2), [], {}])
+        self.assert_same_hash_as_str({"a": [1, 2.5, None, True, u"\u00e9\n'\""], 1: {"b": {"c": (3,)}}})
+
+    def test_must_hash_large_containers_like_str(self):
+        paths = {"/path{}".format(index): {"get": {"responses": {}}} for index in range(2000)}
+        self.assert_same_hash_as_str({"swagger": "2.0", "paths": paths, "list": [list(range(2000))]})
+
+    def test_must_hash_recursive_containers_like_str(self):
+        recursive_list = [1]
+        recursive_list.append(recursive_list)
+        recursive_dict = {"large": list(range(2000))}
+        recursive_dict["self"] = recursive_dict
+        recursive_tuple = ([],)
+        recursive_tuple[0].append(recursive_tuple)
+
+        self.assert_same_hash_as_str(recursive_list)
+        self.assert_same_hash_as_str({"a": recursive_dict, "b": [recursive_tuple]})
+
+    def test_must_hash_subclasses_with_repr(self):
+        self.assert_same_hash_as_str({"a": OrderedDict([("b", 1)]), "c": {"d", "e"}})
+
+    def test_must_hash_consecutive_updates_like_their_concatenation(self):
+        hasher = StrHasher()
+        hasher.update_str({"a": "b"})
+        hasher.update("||")
+        hasher.update("3.0")
+
+        expected = LogicalIdGenerator("", "||".join([str({"a": "b"}), "3.0"])).get_hash(length=40)
+        self.assertEqual(expected, hasher.hexdigest())
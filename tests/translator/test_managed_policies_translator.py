@@ -1,4 +1,5 @@
-from mock import MagicMock
+from mock import MagicMock, patch
+from samtranslator.translator.managed_policy_cache import ManagedPolicyCache
 from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
 
 
@@ -33,3 +34,122 @@ def test_load():
 
     iam.get_paginator.assert_called_once_with("list_policies")
     paginator.paginate.assert_called_once_with(Scope="AWS", PaginationConfig={"PageSize": 1000})
+
+
+def create_iam(policies):
+    paginator = MagicMock()
+    paginator.paginate.return_value = [create_page(policies)]
+
+    iam = MagicMock()
+    iam.get_paginator.return_value = paginator
+    return iam
+
+
+def test_load_must_save_policies_to_cache(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws")
+    iam = create_iam([("Policy-1", "Arn-1")])
+
+    assert ManagedPolicyLoader(iam, cache=cache).load() == {"Policy-1": "Arn-1"}
+    assert cache.load() == ({"Policy-1": "Arn-1"}, True)
+
+
+def test_load_must_not_call_iam_when_cache_is_fresh(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws")
+    cache.save({"Policy-1": "Arn-1"})
+    iam = create_iam([("Policy-2", "Arn-2")])
+
+    assert ManagedPolicyLoader(iam, cache=cache).load() == {"Policy-1": "Arn-1"}
+    iam.get_paginator.assert_not_called()
+
+
+def test_load_must_refresh_stale_cache(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws", ttl_seconds=60)
+    with patch("samtranslator.translator.managed_policy_cache.time.time", return_value=1000):
+        cache.save({"Policy-1": "Arn-1"})
+    iam = create_iam([("Policy-2", "Arn-2")])
+
+    with patch("samtranslator.translator.managed_policy_cache.time.time", return_value=1060):
+        assert ManagedPolicyLoader(iam, cache=cache).load() == {"Policy-2": "Arn-2"}
+        assert cache.load() == ({"Policy-2": "Arn-2"}, True)
+
+
+def test_load_must_return_stale_cache_and_refresh_in_background(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws", ttl_seconds=60)
+    with patch("samtranslator.translator.managed_policy_cache.time.time", return_value=1000):
+        cache.save({"Policy-1": "Arn-1"})
+    iam = create_iam([("Policy-2", "Arn-2")])
+    loader = ManagedPolicyLoader(iam, cache=cache, background_refresh=True)
+
+    with patch("samtranslator.translator.managed_policy_cache.time.time", return_value=1060):
+        assert loader.load() == {"Policy-1": "Arn-1"}
+    loader.wait_for_refresh()
+
+    assert loader.load() == {"Policy-2": "Arn-2"}
+    assert cache.load()[0] == {"Policy-2": "Arn-2"}
+
+
+def test_load_must_keep_stale_cache_when_background_refresh_fails(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws", ttl_seconds=60)
+    with patch("samtranslator.translator.managed_policy_cache.time.time", return_value=1000):
+        cache.save({"Policy-1": "Arn-1"})
+    iam = MagicMock()
+    iam.get_paginator.side_effect = RuntimeError("throttled")
+    loader = ManagedPolicyLoader(iam, cache=cache, background_refresh=True)
+
+    assert loader.load() == {"Policy-1": "Arn-1"}
+    loader.wait_for_refresh()
+
+    assert loader.load() == {"Policy-1": "Arn-1"}
+    assert cache.load() == ({"Policy-1": "Arn-1"}, False)
+
+
+def test_invalidate_must_reload_from_iam(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws")
+    cache.save({"Policy-1": "Arn-1"})
+    iam = create_iam([("Policy-2", "Arn-2")])
+    loader = ManagedPolicyLoader(iam, cache=cache)
+    assert loader.load() == {"Policy-1": "Arn-1"}
+
+    loader.invalidate()
+
+    assert loader.load() == {"Policy-2": "Arn-2"}
+
+
+def test_cache_must_be_keyed_by_partition(tmpdir):
+    ManagedPolicyCache(str(tmpdir), "aws").save({"Policy-1": "arn:aws:iam::aws:policy/Policy-1"})
+
+    assert ManagedPolicyCache(str(tmpdir), "aws-cn").load() == (None, False)
+
+
+def test_cache_must_fall_back_to_snapshot(tmpdir):
+    snapshot = ManagedPolicyCache(str(tmpdir.join("snapshot")), "aws")
+    snapshot.save({"Policy-1": "Arn-1"})
+
+    cache = ManagedPolicyCache(str(tmpdir.join("cache")), "aws", snapshot_file=snapshot.cache_file)
+    assert cache.load() == ({"Policy-1": "Arn-1"}, True)
+
+    cache.save({"Policy-2": "Arn-2"})
+    assert cache.load() == ({"Policy-2": "Arn-2"}, True)
+
+    cache.invalidate()
+    assert cache.load() == ({"Policy-1": "Arn-1"}, True)
+
+
+def test_cache_must_ignore_invalid_files(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws")
+
+    tmpdir.join("managed-policies-aws.json").write("{not json")
+    assert cache.load() == (None, False)
+
+    tmpdir.join("managed-policies-aws.json").write('{"version": 0, "partition": "aws"}')
+    assert cache.load() == (None, False)
+
+
+def test_cache_must_not_fail_when_it_cannot_be_written(tmpdir):
+    cache = ManagedPolicyCache(str(tmpdir), "aws")
+
+    with patch("samtranslator.utils.files._replace", side_effect=OSError("read-only")):
+        cache.save({"Policy-1": "Arn-1"})
+
+    assert cache.load() == (None, False)
+    assert tmpdir.listdir() == []
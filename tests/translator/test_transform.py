@@ -0,0 +1,74 @@
+import copy
+import os
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.translator.transform import transform, transform_many
+
+
+def make_function_template(path):
+    return {
+        "Resources": {
+            "MyFunction": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "s3://bucket/key",
+                    "Handler": "index.handler",
+                    "Runtime": "python3.8",
+                    "Policies": [{"SQSPollerPolicy": {"QueueName": "name"}}],
+                    "Events": {"Get": {"Type": "Api", "Properties": {"Path": path, "Method": "get"}}},
+                },
+            }
+        }
+    }
+
+
+@patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-east-1"})
+class TestTransformMany(TestCase):
+    def setUp(self):
+        self.policy_loader = MagicMock()
+        self.policy_loader.load.return_value = {
+            "AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"
+        }
+        self.parameter_values = {"param1": "value1"}
+
+    def test_must_transform_every_template_like_transform(self):
+        templates = [make_function_template("/path{}".format(index)) for index in range(5)]
+
+        results = dict(transform_many(copy.deepcopy(templates), self.parameter_values, self.policy_loader, processes=2))
+
+        self.assertEqual(list(range(5)), sorted(results))
+        for index, template in enumerate(templates):
+            expected = transform(copy.deepcopy(template), self.parameter_values, self.policy_loader)
+            self.assertEqual(expected, results[index])
+
+    def test_must_isolate_invalid_templates(self):
+        templates = [make_function_template("/"), {"Resources": {}}, make_function_template("/other")]
+
+        results = dict(transform_many(templates, self.parameter_values, self.policy_loader, processes=2))
+
+        self.assertIsInstance(results[1], InvalidDocumentException)
+        self.assertEqual(
+            ["Structure of the SAM template is invalid. 'Resources' section is required"],
+            [cause.message for cause in results[1].causes],
+        )
+        self.assertIn("MyFunction", results[0]["Resources"])
+        self.assertIn("MyFunction", results[2]["Resources"])
+
+    def test_must_load_managed_policies_once(self):
+        templates = [make_function_template("/path{}".format(index)) for index in range(3)]
+
+        list(transform_many(templates, self.parameter_values, self.policy_loader, processes=2))
+
+        self.policy_loader.load.assert_called_once_with()
+
+    def test_must_stop_workers_when_results_are_not_consumed(self):
+        templates = [make_function_template("/path{}".format(index)) for index in range(3)]
+
+        results = transform_many(templates, self.parameter_values, self.policy_loader, processes=1)
+        index, _ = next(results)
+        results.close()
+
+        self.assertIn(index, range(3))
@@ -0,0 +1,201 @@
+import copy
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import Mock, patch
+from parameterized import parameterized
+
+from samtranslator import __version__
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.model.sam_resources import SamApi, SamFunction
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.translation_cache import TranslationCache
+from samtranslator.translator.translator import Translator
+from samtranslator.yaml_helper import yaml_parse
+from tests.translator.test_translator import INPUT_FOLDER, get_template_parameter_values, mock_get_region
+
+MANAGED_POLICY_MAP = {
+    "AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
+    "AWSLambdaRole": "arn:aws:iam::aws:policy/service-role/AWSLambdaRole",
+    "AWSXrayWriteOnlyAccess": "arn:aws:iam::aws:policy/AWSXrayWriteOnlyAccess",
+}
+
+
+def make_function(path=None, timeout=3, rest_api_id=None):
+    properties = {"CodeUri": "s3://bucket/key", "Handler": "index.handler", "Runtime": "python3.8", "Timeout": timeout}
+    if path:
+        event_properties = {"Path": path, "Method": "get"}
+        if rest_api_id:
+            event_properties["RestApiId"] = {"Ref": rest_api_id}
+        properties["Events"] = {"Get": {"Type": "Api", "Properties": event_properties}}
+    return {"Type": "AWS::Serverless::Function", "Properties": properties}
+
+
+@patch("boto3.session.Session.region_name", "ap-southeast-1")
+@patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+class TestTranslationCache(TestCase):
+    def setUp(self):
+        self.cache = TranslationCache()
+        self.translator = Translator(MANAGED_POLICY_MAP, Parser(), translation_cache=self.cache)
+
+    def translate(self, template, translator=None):
+        translator = translator or self.translator
+        return translator.translate(copy.deepcopy(template), get_template_parameter_values())
+
+    def translate_without_cache(self, template):
+        return self.translate(template, Translator(MANAGED_POLICY_MAP, Parser()))
+
+    def translated_functions(self, template):
+        with patch.object(SamFunction, "to_cloudformation", autospec=True, side_effect=SamFunction.to_cloudformation):
+            self.translate(template)
+            return sorted(call[0][0].logical_id for call in SamFunction.to_cloudformation.call_args_list)
+
+    def test_must_only_translate_changed_resources(self):
+        template = {"Resources": {"First": make_function(), "Second": make_function()}}
+        self.assertEqual(["First", "Second"], self.translated_functions(template))
+        self.assertEqual(2, len(self.cache))
+
+        template["Resources"]["Second"]["Properties"]["Timeout"] = 10
+
+        self.assertEqual(["Second"], self.translated_functions(template))
+        self.assertEqual(self.translate_without_cache(template), self.translate(template))
+        self.assertEqual([], self.translated_functions(template))
+
+    def test_must_translate_resources_referencing_changed_parameters(self):
+        template = {
+            "Parameters": {"Timeout": {"Type": "Number", "Default": 3}},
+            "Resources": {"First": make_function(timeout={"Ref": "Timeout"}), "Second": make_function()},
+        }
+        self.translate(template)
+
+        template["Parameters"]["Timeout"]["Default"] = 10
+
+        self.assertEqual(["First"], self.translated_functions(template))
+        self.assertEqual(self.translate_without_cache(template), self.translate(template))
+
+    def test_must_translate_all_resources_adding_to_the_same_api(self):
+        template = {
+            "Resources": {
+                "First": make_function("/first", rest_api_id="MyApi"),
+                "Second": make_function("/second", rest_api_id="MyApi"),
+                "Other": make_function(),
+                "MyApi": {"Type": "AWS::Serverless::Api", "Properties": {"StageName": "Prod"}},
+            }
+        }
+        self.translate(template)
+
+        template["Resources"]["Second"]["Properties"]["Events"]["Get"]["Properties"]["Path"] = "/changed"
+
+        with patch.object(SamApi, "to_cloudformation", autospec=True, side_effect=SamApi.to_cloudformation) as api:
+            self.assertEqual(["First", "Second"], self.translated_functions(template))
+            api.assert_called_once()
+        output = self.translate(template)
+        self.assertEqual(self.translate_without_cache(template), output)
+        self.assertEqual(["/first", "/changed"], list(output["Resources"]["MyApi"]["Properties"]["Body"]["paths"]))
+
+    def test_must_translate_all_resources_when_context_changes(self):
+        template = {"Resources": {"First": make_function(), "Second": make_function()}}
+        self.translate(template)
+
+        self.translator.managed_policy_map = dict(MANAGED_POLICY_MAP, OtherPolicy="arn:aws:iam::aws:policy/Other")
+
+        self.assertEqual(["First", "Second"], self.translated_functions(template))
+
+    def test_must_not_cache_resources_that_failed(self):
+        template = {"Resources": {"First": make_function(), "Invalid": {"Type": "AWS::Serverless::Function"}}}
+        with self.assertRaises(InvalidDocumentException):
+            self.translate(template)
+
+        self.assertEqual(1, len(self.cache))
+
+    def test_must_translate_applications_again(self):
+        template = {
+            "Resources": {
+                "App": {
+                    "Type": "AWS::Serverless::Application",
+                    "Properties": {"Location": {"ApplicationId": "app", "SemanticVersion": "1.0.0"}},
+                },
+                "First": make_function(),
+            }
+        }
+        sar_client = Mock()
+        sar_client.create_cloud_formation_template.side_effect = [
+            {"ApplicationId": "app", "Status": "ACTIVE", "TemplateId": template_id, "TemplateUrl": template_id}
+            for template_id in ("first-signed", "second-signed")
+        ]
+
+        with patch("boto3.client", return_value=sar_client):
+            self.translate(template)
+            self.assertEqual(1, len(self.cache))
+            with patch.object(SamFunction, "to_cloudformation") as to_cloudformation:
+                output = self.translate(template)
+                to_cloudformation.assert_not_called()
+
+        self.assertEqual("second-signed", output["Resources"]["App"]["Properties"]["TemplateURL"])
+
+    @parameterized.expand(
+        [
+            "api_with_resource_refs",
+            "api_with_usageplans_shared_attributes_three",
+            "cognito_userpool_with_event",
+            "function_event_conditions",
+            "function_with_deployment_preference_multiple_combinations",
+            "layers_with_intrinsics",
+            "s3_multiple_functions",
+        ]
+    )
+    def test_must_reuse_translations_read_from_file(self, testcase):
+        template = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml"), "r"))
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "cache.json")
+
+        self.translate(template)
+        self.cache.save(path)
+        cache = TranslationCache.load(path)
+        translator = Translator(MANAGED_POLICY_MAP, Parser(), translation_cache=cache)
+
+        with patch.object(SamFunction, "to_cloudformation") as to_cloudformation:
+            output = self.translate(template, translator)
+            to_cloudformation.assert_not_called()
+        self.assertEqual(self.translate_without_cache(template), output)
+
+
+class TestTranslationCacheFile(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "cache.json")
+
+    def test_must_ignore_missing_file(self):
+        self.assertEqual(0, len(TranslationCache.load(self.path)))
+
+    def test_must_ignore_cache_of_other_version(self):
+        with open(self.path, "w") as fp:
+            json.dump({"version": TranslationCache.VERSION, "samtranslator": "0.0.1", "groups": {"a": {"b": {}}}}, fp)
+
+        self.assertEqual(0, len(TranslationCache.load(self.path)))
+
+    def test_must_load_saved_cache(self):
+        with open(self.path, "w") as fp:
+            json.dump(
+                {"version": TranslationCache.VERSION, "samtranslator": __version__, "groups": {"a": {"b": {}}}}, fp
+            )
+
+        self.assertEqual(1, len(TranslationCache.load(self.path)))
+
+    def test_failed_save_must_keep_previous_cache(self):
+        cache = TranslationCache()
+        cache._groups = {"a": {"b": {}}}
+        cache.save(self.path)
+
+        cache._groups = {"a": {"b": {}, "c": {}}}
+        with patch("samtranslator.utils.files._replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                cache.save(self.path)
+
+        self.assertEqual(1, len(TranslationCache.load(self.path)))
+        self.assertEqual(["cache.json"], os.listdir(self.directory))
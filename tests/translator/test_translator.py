@@ -1,3 +1,4 @@
+import copy
 import json
 import itertools
 import os.path
@@ -6,20 +7,24 @@ import sys
 from functools import reduce, cmp_to_key
 
 from samtranslator.translator.translator import Translator, prepare_plugins, make_policy_template_for_function_plugin
+from samtranslator.metrics.metrics import DummyMetricsPublisher, Metrics, Unit
 from samtranslator.parser.parser import Parser
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidResourceException
 from samtranslator.model import Resource
 from samtranslator.model.sam_resources import SamSimpleTable
 from samtranslator.public.plugins import BasePlugin
+from samtranslator.public.translator import TemplateUrlCache
 
 from tests.translator.helpers import get_template_parameter_values
 from tests.plugins.application.test_serverless_app_plugin import mock_get_region
 from samtranslator.yaml_helper import yaml_parse
 from parameterized import parameterized, param
 
+import boto3
 import pytest
 import yaml
 from unittest import TestCase
+from samtranslator.translator.arn_generator import ArnGenerator
 from samtranslator.translator.transform import transform
 from mock import Mock, MagicMock, patch
 
@@ -654,6 +659,34 @@ class TestTranslatorEndToEnd(AbstractTestTranslator):
             self._compare_transform(manifest, expected, partition, region)
 
 
+class TestTranslatorWithoutTemplateCopy(AbstractTestTranslator):
+    @parameterized.expand(
+        [
+            "s3",
+            "cognito_userpool_with_event",
+            "implicit_api",
+            "api_with_resource_refs",
+            "function_with_resource_refs",
+            "function_with_deployment_preference",
+            "globals_for_function",
+            "intrinsic_functions",
+            "layers_all_properties",
+        ]
+    )
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_transform_success_without_template_copy(self, testcase):
+        manifest = self._read_input(testcase)
+        expected = self._read_expected_output(testcase, "aws")
+
+        translate = Translator.translate
+
+        def translate_without_copy(translator, *args, **kwargs):
+            return translate(translator, *args, copy_template=False, **kwargs)
+
+        with patch.object(Translator, "translate", translate_without_copy):
+            self._compare_transform(manifest, expected, "aws", "ap-southeast-1")
+
+
 @pytest.mark.parametrize(
     "testcase",
     [
@@ -1086,12 +1119,9 @@ class TestPluginsUsage(TestCase):
         self, policy_templates_for_function_plugin_mock, policy_templates_processor_mock
     ):
 
-        default_templates = {"some": "value"}
-        policy_templates_processor_mock.get_default_policy_templates_json.return_value = default_templates
-
         # mock to return instance of the processor
         processor_instance = Mock()
-        policy_templates_processor_mock.return_value = processor_instance
+        policy_templates_processor_mock.get_default.return_value = processor_instance
 
         # mock for plugin instance
         plugin_instance = Mock()
@@ -1101,8 +1131,7 @@ class TestPluginsUsage(TestCase):
 
         self.assertEqual(plugin_instance, result)
 
-        policy_templates_processor_mock.get_default_policy_templates_json.assert_called_once_with()
-        policy_templates_processor_mock.assert_called_once_with(default_templates)
+        policy_templates_processor_mock.get_default.assert_called_once_with()
         policy_templates_for_function_plugin_mock.assert_called_once_with(processor_instance)
 
     @patch.object(Resource, "from_dict")
@@ -1128,8 +1157,255 @@ class TestPluginsUsage(TestCase):
             "MyTable", manifest["Resources"]["MyTable"], sam_plugins=sam_plugins_object_mock
         )
         prepare_plugins_mock.assert_called_once_with(
-            initial_plugins, {"AWS::Region": "ap-southeast-1", "AWS::Partition": "aws"}
+            initial_plugins,
+            {"AWS::Region": "ap-southeast-1", "AWS::Partition": "aws"},
+            policy_templates_processor=translator._get_policy_templates_processor(),
+            metrics=None,
+            template_url_cache=None,
+        )
+
+    @patch("samtranslator.translator.translator.make_default_policy_templates_processor")
+    @patch("samtranslator.translator.translator.ResourceTypeResolver")
+    def test_translator_must_reuse_template_independent_artifacts(
+        self, resource_type_resolver_mock, make_processor_mock
+    ):
+        translator = Translator({}, Parser())
+
+        self.assertIs(translator._get_policy_templates_processor(), translator._get_policy_templates_processor())
+        self.assertIs(translator._get_macro_resolver(), translator._get_macro_resolver())
+
+        make_processor_mock.assert_called_once_with()
+        resource_type_resolver_mock.assert_called_once()
+
+    @patch("samtranslator.translator.translator.PolicyTemplatesProcessor")
+    @patch("samtranslator.translator.translator.PolicyTemplatesForResourcePlugin")
+    def test_make_policy_template_for_function_plugin_must_use_given_processor(
+        self, policy_templates_for_function_plugin_mock, policy_templates_processor_mock
+    ):
+        processor_instance = Mock()
+
+        make_policy_template_for_function_plugin(processor_instance)
+
+        policy_templates_processor_mock.get_default.assert_not_called()
+        policy_templates_for_function_plugin_mock.assert_called_once_with(processor_instance)
+
+
+class TestTranslatorTemplateCopy(TestCase):
+    def setUp(self):
+        self.manifest = {
+            "Resources": {
+                "MyFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.8",
+                        "Role": "arn:aws:iam::123456789012:role/role",
+                        "AutoPublishAlias": "live",
+                    },
+                },
+                "MyTopic": {
+                    "Type": "AWS::SNS::Topic",
+                    "Properties": {"Subscription": [{"Endpoint": {"Ref": "MyFunction.Alias"}, "Protocol": "lambda"}]},
+                },
+            },
+            "Outputs": {"Alias": {"Value": {"Ref": "MyFunction.Alias"}}},
+        }
+        self.managed_policy_map = {"AWSLambdaRole": "arn:aws:iam::aws:policy/service-role/AWSLambdaRole"}
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_not_modify_pass_through_sections_of_input(self):
+        original = copy.deepcopy(self.manifest)
+
+        output = Translator(self.managed_policy_map, Parser()).translate(self.manifest, {})
+
+        self.assertEqual(
+            {"Ref": "MyFunctionAliaslive"}, output["Resources"]["MyTopic"]["Properties"]["Subscription"][0]["Endpoint"]
+        )
+        self.assertEqual({"Ref": "MyFunctionAliaslive"}, output["Outputs"]["Alias"]["Value"])
+        self.assertEqual(original["Resources"]["MyTopic"], self.manifest["Resources"]["MyTopic"])
+        self.assertEqual(original["Outputs"], self.manifest["Outputs"])
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_share_pass_through_sections_without_copy(self):
+        expected = Translator(self.managed_policy_map, Parser()).translate(copy.deepcopy(self.manifest), {})
+
+        output = Translator(self.managed_policy_map, Parser()).translate(self.manifest, {}, copy_template=False)
+
+        self.assertEqual(expected, output)
+        self.assertIs(self.manifest["Resources"]["MyTopic"], output["Resources"]["MyTopic"])
+        self.assertIs(self.manifest["Outputs"], output["Outputs"])
+
+    def test_prepare_output_template_must_not_copy_sam_resources(self):
+        translator = Translator({}, Parser())
+
+        template = translator._prepare_output_template(self.manifest, translator._get_macro_resolver())
+
+        self.assertIsNot(self.manifest["Resources"], template["Resources"])
+        self.assertIs(self.manifest["Resources"]["MyFunction"], template["Resources"]["MyFunction"])
+        self.assertIsNot(self.manifest["Resources"]["MyTopic"], template["Resources"]["MyTopic"])
+        self.assertEqual(self.manifest["Resources"]["MyTopic"], template["Resources"]["MyTopic"])
+
+    def test_prepare_output_template_must_preserve_shared_objects(self):
+        translator = Translator({}, Parser())
+        shared = {"Ref": "MyFunction"}
+        self.manifest["Outputs"] = {"One": {"Value": shared}, "Two": {"Value": shared}}
+
+        template = translator._prepare_output_template(self.manifest, translator._get_macro_resolver())
+
+        self.assertIsNot(shared, template["Outputs"]["One"]["Value"])
+        self.assertIs(template["Outputs"]["One"]["Value"], template["Outputs"]["Two"]["Value"])
+
+
+class TestTranslatorReuse(TestCase):
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_produce_same_output_when_translator_is_reused(self):
+        manifest = {
+            "Resources": {
+                "MyFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.8",
+                        "Policies": [{"SQSPollerPolicy": {"QueueName": "name"}}],
+                        "Events": {"Get": {"Type": "Api", "Properties": {"Path": "/", "Method": "get"}}},
+                    },
+                }
+            }
+        }
+
+        managed_policy_map = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+        translator = Translator(managed_policy_map, Parser())
+        first = translator.translate(copy.deepcopy(manifest), {})
+        second = translator.translate(copy.deepcopy(manifest), {})
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, Translator(managed_policy_map, Parser()).translate(copy.deepcopy(manifest), {}))
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    def test_translate_must_share_template_url_cache_between_translations(self):
+        manifest = {
+            "Resources": {
+                "MyApp": {
+                    "Type": "AWS::Serverless::Application",
+                    "Properties": {"Location": {"ApplicationId": "app", "SemanticVersion": "1.0.0"}},
+                }
+            }
+        }
+        sar_client = Mock()
+        sar_client.meta.region_name = "ap-southeast-1"
+        sar_client.create_cloud_formation_template.return_value = {
+            "ApplicationId": "app",
+            "SemanticVersion": "1.0.0",
+            "Status": "ACTIVE",
+            "TemplateId": "id",
+            "TemplateUrl": "https://example.com/template",
+        }
+        translator = Translator({}, Parser(), template_url_cache=TemplateUrlCache())
+
+        with patch("boto3.client", return_value=sar_client):
+            first = translator.translate(copy.deepcopy(manifest), {})
+            second = translator.translate(copy.deepcopy(manifest), {})
+
+        sar_client.create_cloud_formation_template.assert_called_once_with(ApplicationId="app", SemanticVersion="1.0.0")
+        self.assertEqual(first, second)
+        self.assertEqual("https://example.com/template", first["Resources"]["MyApp"]["Properties"]["TemplateURL"])
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_resolve_region_once_per_process(self):
+        manifest = {
+            "Resources": {
+                "MyFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.8",
+                        "Tracing": "Active",
+                        "Events": {"Get": {"Type": "Api", "Properties": {"Path": "/", "Method": "get"}}},
+                    },
+                }
+            }
+        }
+
+        with patch("boto3.session.Session", wraps=boto3.session.Session) as session_mock:
+            Translator({"AWSXrayWriteOnlyAccess": "arn"}, Parser()).translate(manifest, {})
+            Translator({"AWSXrayWriteOnlyAccess": "arn"}, Parser()).translate(manifest, {})
+
+        session_mock.assert_called_once_with()
+        self.assertIsNone(ArnGenerator.BOTO_SESSION_REGION_NAME)
+
+
+class TestTranslatorLatencyMetrics(TestCase):
+    def setUp(self):
+        self.manifest = {
+            "Resources": {
+                "MyFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.8",
+                        "AutoPublishAlias": "live",
+                        "DeploymentPreference": {"Type": "AllAtOnce"},
+                    },
+                }
+            }
+        }
+        self.managed_policy_map = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_record_latency_of_each_phase(self):
+        metrics = Metrics("ServerlessTransform", DummyMetricsPublisher())
+
+        Translator(self.managed_policy_map, Parser(), metrics=metrics).translate(self.manifest, {})
+
+        recorded = [(metric.name, metric.unit, metric.dimensions) for metric in metrics.metrics_cache]
+        names = set(name for name, _, _ in recorded)
+        self.assertEqual(
+            {
+                "ValidationLatency",
+                "PluginLatency",
+                "FromDictLatency",
+                "ToCloudFormationLatency",
+                "DeploymentPreferenceLatency",
+                "ResolutionLatency",
+            },
+            names,
+        )
+        self.assertTrue(all(unit == Unit.Milliseconds for _, unit, _ in recorded))
+
+        function_dimensions = [{"Name": "ResourceType", "Value": "AWS::Serverless::Function"}]
+        self.assertIn(("FromDictLatency", Unit.Milliseconds, function_dimensions), recorded)
+        self.assertIn(("ToCloudFormationLatency", Unit.Milliseconds, function_dimensions), recorded)
+        self.assertIn(
+            (
+                "PluginLatency",
+                Unit.Milliseconds,
+                [
+                    {"Name": "PluginName", "Value": "GlobalsPlugin"},
+                    {"Name": "LifeCycleEvent", "Value": "before_transform_template"},
+                ],
+            ),
+            recorded,
         )
+        metrics.metrics_cache = []
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_translate_must_not_record_latency_without_metrics(self):
+        translator = Translator(self.managed_policy_map, Parser())
+
+        translator.translate(self.manifest, {})
+
+        self.assertEqual([], translator.metrics.metrics_cache)
 
 
 def get_policy_mock():
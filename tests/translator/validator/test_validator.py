@@ -1,6 +1,11 @@
 import os.path
+import jsonschema
 import pytest
 from unittest import TestCase
+from mock import Mock, patch
+from jsonschema.exceptions import SchemaError, ValidationError
+from samtranslator.parser.parser import Parser
+from samtranslator.plugins import LifeCycleEvents
 from samtranslator.yaml_helper import yaml_parse
 from samtranslator.validator.validator import SamTemplateValidator
 
@@ -122,3 +127,65 @@ def test_validate_template_success(testcase):
         print("\nFailing template: {0}\n".format(testcase))
         print(validation_errors)
     assert len(validation_errors) == 0
+
+
+class TestSamTemplateValidator(TestCase):
+    def setUp(self):
+        self.invalid_template = {"Resources": {"MyTable": {"Type": "AWS::Serverless::SimpleTable", "Properties": 1}}}
+
+    def test_validate_must_return_empty_string_for_valid_template(self):
+        template = {"Resources": {"MyTable": {"Type": "AWS::Serverless::SimpleTable"}}}
+
+        self.assertEqual("", SamTemplateValidator.validate(template))
+        self.assertEqual([], SamTemplateValidator.validate_all(template))
+
+    def test_validate_must_match_jsonschema_validate_error(self):
+        schema = SamTemplateValidator._read_schema()
+        with self.assertRaises(ValidationError) as ctx:
+            jsonschema.validate(self.invalid_template, schema)
+
+        self.assertEqual(str(ctx.exception), SamTemplateValidator.validate(self.invalid_template))
+        self.assertEqual(str(ctx.exception), SamTemplateValidator.validate(self.invalid_template, schema))
+
+    def test_validate_all_must_collect_every_error(self):
+        errors = SamTemplateValidator.validate_all(self.invalid_template)
+
+        self.assertTrue(errors)
+        self.assertEqual([str(e) for e in SamTemplateValidator.iter_errors(self.invalid_template)], errors)
+
+    def test_iter_errors_must_be_lazy(self):
+        errors = SamTemplateValidator.iter_errors(self.invalid_template)
+
+        self.assertIsInstance(next(errors), ValidationError)
+
+    @patch.object(SamTemplateValidator, "_default_validator", None)
+    @patch.object(SamTemplateValidator, "_read_schema", wraps=SamTemplateValidator._read_schema)
+    def test_default_validator_must_be_compiled_once(self, read_schema_mock):
+        SamTemplateValidator.validate(self.invalid_template)
+        SamTemplateValidator.validate(self.invalid_template)
+
+        read_schema_mock.assert_called_once_with()
+
+    def test_custom_schema_must_be_checked(self):
+        with self.assertRaises(SchemaError):
+            SamTemplateValidator.validate({}, {"type": 1})
+
+
+class TestParserSchemaValidation(TestCase):
+    def setUp(self):
+        self.template = {"Resources": {"MyTable": {"Type": "AWS::Serverless::SimpleTable"}}}
+
+    @patch.object(SamTemplateValidator, "validate")
+    def test_parser_must_validate_schema_by_default(self, validate_mock):
+        Parser().parse(self.template, {}, Mock())
+
+        validate_mock.assert_called_once_with(self.template)
+
+    @patch.object(SamTemplateValidator, "validate")
+    def test_parser_must_skip_schema_validation_when_disabled(self, validate_mock):
+        sam_plugins = Mock()
+
+        Parser(validate_schema=False).parse(self.template, {}, sam_plugins)
+
+        validate_mock.assert_not_called()
+        sam_plugins.act.assert_called_once_with(LifeCycleEvents.before_transform_template, self.template)
@@ -4,6 +4,7 @@ from mock import patch
 from parameterized import parameterized
 
 from samtranslator.region_configuration import RegionConfiguration
+from samtranslator.translator.arn_generator import ArnGenerator
 
 
 class TestRegionConfiguration(TestCase):
@@ -36,3 +37,14 @@ class TestRegionConfiguration(TestCase):
             get_partition_name_patch.return_value = partition
 
             self.assertFalse(RegionConfiguration.is_apigw_edge_configuration_supported())
+
+    @parameterized.expand(
+        [
+            ["us-east-1", True],
+            ["cn-north-1", True],
+            ["af-south-1", False],
+        ]
+    )
+    def test_is_sar_supported(self, region, expected):
+        with ArnGenerator.use_region_name(region):
+            self.assertEqual(expected, RegionConfiguration.is_sar_supported())
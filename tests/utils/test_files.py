@@ -0,0 +1,28 @@
+import json
+import os
+
+import pytest
+from mock import patch
+
+from samtranslator.utils.files import write_json_atomically
+
+
+def test_write_json_atomically_must_create_directory_and_replace_file(tmpdir):
+    path = os.path.join(str(tmpdir), "cache", "file.json")
+
+    write_json_atomically(path, {"a": 1})
+    write_json_atomically(path, {"b": [1, 2]})
+
+    with open(path) as fp:
+        assert json.load(fp) == {"b": [1, 2]}
+    assert os.listdir(os.path.dirname(path)) == ["file.json"]
+
+
+def test_write_json_atomically_must_remove_temporary_file_on_failure(tmpdir):
+    path = os.path.join(str(tmpdir), "file.json")
+
+    with patch("samtranslator.utils.files._replace", side_effect=OSError("read-only")):
+        with pytest.raises(OSError):
+            write_json_atomically(path, {"a": 1})
+
+    assert tmpdir.listdir() == []